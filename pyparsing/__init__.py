@@ -152,12 +152,14 @@ from .core import _builtin_exprs as core_builtin_exprs
 from .helpers import *
 from .helpers import _builtin_exprs as helper_builtin_exprs
 
-from .unicode import unicode_set, UnicodeRangeList, pyparsing_unicode as unicode
-from .testing import pyparsing_test as testing
-from .common import (
-    pyparsing_common as common,
-    _builtin_exprs as common_builtin_exprs,
+from .unicode import (
+    unicode_set,
+    UnicodeRangeList,
+    CharSet,
+    pyparsing_unicode as unicode,
 )
+from .testing import pyparsing_test as testing
+from .common import pyparsing_common as common
 from importlib import resources
 import sys
 
@@ -169,7 +171,16 @@ if "pyparsing_common" not in globals():
 if "pyparsing_test" not in globals():
     pyparsing_test = testing
 
-core_builtin_exprs += common_builtin_exprs + helper_builtin_exprs
+core_builtin_exprs += helper_builtin_exprs
+
+
+def __getattr__(name: str):
+    # any_open_tag and any_close_tag are built on first access
+    from . import helpers
+
+    if name in helpers._lazy_tag_names:
+        return getattr(helpers, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # fmt: off
 _FALLBACK_BEST_PRACTICES = """
@@ -248,6 +259,7 @@ __all__ = [
     "AtStringStart",
     "CaselessKeyword",
     "CaselessLiteral",
+    "CharSet",
     "CharsNotIn",
     "CloseMatch",
     "Combine",
@@ -259,19 +271,23 @@ __all__ = [
     "Forward",
     "GoToColumn",
     "Group",
+    "IncrementalParser",
     "IndentedBlock",
     "Keyword",
     "LineEnd",
     "LineStart",
     "Literal",
+    "LiteralSet",
     "Located",
     "PrecededBy",
     "MatchFirst",
+    "NestedBlock",
     "NoMatch",
     "NotAny",
     "OneOrMore",
     "OnlyOnce",
     "OpAssoc",
+    "OperatorPrecedence",
     "Opt",
     "Optional",
     "Or",
@@ -353,6 +369,7 @@ __all__ = [
     "rest_of_line",
     "sgl_quoted_string",
     "show_best_practices",
+    "scan_many",
     "srange",
     "string_end",
     "string_start",
@@ -1,6 +1,7 @@
 # actions.py
 from __future__ import annotations
 
+from functools import partial
 from typing import Union, Callable, Any
 
 from .exceptions import ParseException
@@ -48,12 +49,12 @@ def match_only_at_col(n: int) -> ParseAction:
     Helper method for defining parse actions that require matching at
     a specific column in the input text.
     """
+    return partial(_verify_col, n)
 
-    def verify_col(strg: str, locn: int, toks: ParseResults) -> None:
-        if col(locn, strg) != n:
-            raise ParseException(strg, locn, f"matched token not at column {n}")
 
-    return verify_col
+def _verify_col(n: int, strg: str, locn: int, toks: ParseResults) -> None:
+    if col(locn, strg) != n:
+        raise ParseException(strg, locn, f"matched token not at column {n}")
 
 
 def replace_with(repl_str: Any) -> ParseAction:
@@ -73,7 +74,11 @@ def replace_with(repl_str: Any) -> ParseAction:
        >>> term[1, ...].parse_string("324 234 N/A 234")
        ParseResults([324, 234, nan, 234], {})
     """
-    return lambda s, l, t: [repl_str]
+    return partial(_replacement_value, repl_str)
+
+
+def _replacement_value(repl_str: Any, s: str, l: int, t: ParseResults) -> list:
+    return [repl_str]
 
 
 def remove_quotes(s: str, l: int, t: ParseResults) -> Any:
@@ -177,22 +182,36 @@ def with_attribute(*args: tuple[str, str], **attr_dict) -> ParseAction:
         attrs_list.extend(args)
     else:
         attrs_list.extend(attr_dict.items())
+    return partial(_verify_attributes, attrs_list)
+
+
+def _verify_attributes(
+    attrs_list: list[tuple[str, str]], s: str, l: int, tokens: ParseResults
+) -> None:
+    for attrName, attrValue in attrs_list:
+        if attrName not in tokens:
+            raise ParseException(s, l, f"no matching attribute {attrName!r}")
+        if attrValue != with_attribute.ANY_VALUE and tokens[attrName] != attrValue:  # type: ignore [attr-defined]
+            raise ParseException(
+                s,
+                l,
+                f"attribute {attrName!r} has value {tokens[attrName]!r}, must be {attrValue!r}",
+            )
+
+
+class _AnyValue:
+    # sentinel type for with_attribute.ANY_VALUE, that unpickles as the
+    # same singleton object
+    def __repr__(self) -> str:
+        return "with_attribute.ANY_VALUE"
 
-    def pa(s: str, l: int, tokens: ParseResults) -> None:
-        for attrName, attrValue in attrs_list:
-            if attrName not in tokens:
-                raise ParseException(s, l, f"no matching attribute {attrName!r}")
-            if attrValue != with_attribute.ANY_VALUE and tokens[attrName] != attrValue:  # type: ignore [attr-defined]
-                raise ParseException(
-                    s,
-                    l,
-                    f"attribute {attrName!r} has value {tokens[attrName]!r}, must be {attrValue!r}",
-                )
+    def __reduce__(self) -> str:
+        return "_ANY_VALUE"
 
-    return pa
 
+_ANY_VALUE = _AnyValue()
 
-with_attribute.ANY_VALUE = object()  # type: ignore [attr-defined]
+with_attribute.ANY_VALUE = _ANY_VALUE  # type: ignore [attr-defined]
 "Value to use with :class:`with_attribute` parse action, to match any value, as long as the attribute is present"
 
 
@@ -1,19 +1,109 @@
 # common.py
 from .core import *
-from .helpers import DelimitedList, any_open_tag, any_close_tag
+from .core import _build_builtin_exprs
+from array import array
 from datetime import datetime, timedelta
+from functools import partial
+from threading import RLock
 import sys
 
 PY_310_OR_LATER = sys.version_info >= (3, 10)
 
 
+# parse actions and conditions used by pyparsing_common are defined at
+# module level (rather than as lambdas or closures), so that expressions
+# that use them can be pickled
+
+
+def _strptime_date(fmt, ss, ll, tt):
+    try:
+        return datetime.strptime(tt[0], fmt).date()
+    except ValueError as ve:
+        raise ParseException(ss, ll, str(ve))
+
+
+def _strptime_datetime(fmt, s, l, t):
+    try:
+        return datetime.strptime(t[0], fmt)
+    except ValueError as ve:
+        raise ParseException(s, l, str(ve))
+
+
+def _divide_fraction(tt):
+    return tt[0] / tt[-1]
+
+
+def _is_valid_short_ipv6(t):
+    return sum(1 for tt in t if pyparsing_common._ipv6_part.matches(tt)) < 8
+
+
+def _convert_to_array(typecode, convert, s, l, t):
+    try:
+        return [array(typecode, map(convert, t))]
+    except OverflowError as oe:
+        raise ParseException(s, l, str(oe))
+
+
+class _FastNumber(Regex):
+    """
+    :class:`Regex` for all the numeric forms matched by
+    :class:`pyparsing_common.number`, converting the matched text in
+    ``parseImpl``, instead of in a parse action
+    """
+
+    def __init__(self) -> None:
+        # the groups only match for a decimal point or an exponent
+        super().__init__(r"[+-]?(?:\d+(\.\d*)?|(\.)\d+)([eE][+-]?\d+)?")
+
+    def parseImpl(self, instring, loc, do_actions=True) -> ParseImplReturnType:
+        result = self.re_match(instring, loc)
+        if not result:
+            raise ParseException(instring, loc, self.errmsg, self)
+
+        # float if any group matched, otherwise int
+        ret = result[0]
+        return result.end(), float(ret) if result.lastindex else int(ret)
+
+
+class _lazy_expr:
+    """
+    Class-level descriptor for a :class:`pyparsing_common` expression, so that
+    the expression is only built the first time it is accessed, and not when
+    pyparsing is imported. The built expression then replaces the descriptor
+    in the class namespace, so later accesses are plain attribute lookups.
+    """
+
+    _lock = RLock()
+
+    def __init__(self, fn):
+        self.fn = fn
+        self.__doc__ = fn.__doc__
+        self.__name__ = fn.__name__
+
+    def __set_name__(self, owner, name):
+        self.owner = owner
+
+    def __get__(self, obj, cls=None):
+        owner = self.owner
+        with self._lock:
+            expr = owner.__dict__[self.__name__]
+            if expr is self:
+                # built with the default global settings, and registered with
+                # the other built-in expressions, so that changes to the default
+                # whitespace characters are applied to it too
+                expr = _build_builtin_exprs(partial(self.fn, owner))
+                setattr(owner, self.__name__, expr)
+        return expr
+
+
 # some other useful expressions - using lower-case class name since we are really using this as a namespace
 class pyparsing_common:
     """Here are some common low-level expressions that may be useful in
     jump-starting parser development:
 
     - numeric forms (:class:`integers<integer>`, :class:`reals<real>`,
-      :class:`scientific notation<sci_real>`)
+      :class:`scientific notation<sci_real>`, :class:`any number<fast_number>`,
+      :class:`arrays of numbers<fast_number_array>`)
     - common :class:`programming identifiers<identifier>`
     - network addresses (:class:`MAC<mac_address>`,
       :class:`IPv4<ipv4_address>`, :class:`IPv6<ipv6_address>`)
@@ -201,108 +291,203 @@ class pyparsing_common:
         """
         return [float(tt) for tt in t]
 
-    integer = (
-        Word(nums)
-        .set_name("integer")
-        .set_parse_action(convert_to_integer if PY_310_OR_LATER else token_map(int))
-    )
-    """expression that parses an unsigned integer, converts to an int"""
-
-    hex_integer = (
-        Word(hexnums).set_name("hex integer").set_parse_action(token_map(int, 16))
-    )
-    """expression that parses a hexadecimal integer, converts to an int"""
-
-    signed_integer = (
-        Regex(r"[+-]?\d+")
-        .set_name("signed integer")
-        .set_parse_action(convert_to_integer if PY_310_OR_LATER else token_map(int))
-    )
-    """expression that parses an integer with optional leading sign, converts to an int"""
-
-    fraction = (
-        signed_integer().set_parse_action(
-            convert_to_float if PY_310_OR_LATER else token_map(float)
+    @_lazy_expr
+    def integer(cls):
+        """expression that parses an unsigned integer, converts to an int"""
+        return Word(nums).set_name("integer").set_parse_action(cls.convert_to_integer)
+
+    @_lazy_expr
+    def hex_integer(cls):
+        """expression that parses a hexadecimal integer, converts to an int"""
+        return (
+            Word(hexnums).set_name("hex integer").set_parse_action(token_map(int, 16))
+        )
+
+    @_lazy_expr
+    def signed_integer(cls):
+        """expression that parses an integer with optional leading sign, converts to an int"""
+        return (
+            Regex(r"[+-]?\d+")
+            .set_name("signed integer")
+            .set_parse_action(cls.convert_to_integer)
+        )
+
+    @_lazy_expr
+    def fraction(cls):
+        """fractional expression of an integer divided by an integer, converts to a float"""
+        fraction = (
+            cls.signed_integer().set_parse_action(cls.convert_to_float)
+            + Literal("/")
+            + cls.signed_integer().set_parse_action(cls.convert_to_float)
+        ).set_name("fraction")
+        fraction.add_parse_action(_divide_fraction)
+        return fraction
+
+    @_lazy_expr
+    def mixed_integer(cls):
+        """mixed integer of the form 'integer - fraction', with optional leading integer, converts to a float"""
+        mixed_integer = (
+            cls.fraction
+            | cls.signed_integer + Opt(Opt(Literal("-")).suppress() + cls.fraction)
+        ).set_name("fraction or mixed integer-fraction")
+        mixed_integer.add_parse_action(sum)
+        return mixed_integer
+
+    @_lazy_expr
+    def real(cls):
+        """expression that parses a floating point number, converts to a float"""
+        return (
+            Regex(r"[+-]?(?:\d+\.\d*|\.\d+)")
+            .set_name("real number")
+            .set_parse_action(cls.convert_to_float)
+        )
+
+    @_lazy_expr
+    def sci_real(cls):
+        """expression that parses a floating point number with optional
+        scientific notation, converts to a float"""
+        return (
+            Regex(r"[+-]?(?:\d+(?:[eE][+-]?\d+)|(?:\d+\.\d*|\.\d+)(?:[eE][+-]?\d+)?)")
+            .set_name("real number with scientific notation")
+            .set_parse_action(cls.convert_to_float)
+        )
+
+    @_lazy_expr
+    def number(cls):
+        """any numeric expression, converts to the corresponding Python type"""
+        # streamlining this expression makes the docs nicer-looking
+        return (
+            (cls.sci_real | cls.real | cls.signed_integer)
+            .set_name("number")
+            .streamline()
+        )
+
+    @_lazy_expr
+    def fnumber(cls):
+        """any int or real number, always converts to a float"""
+        return (
+            Regex(r"[+-]?\d+\.?\d*(?:[eE][+-]?\d+)?")
+            .set_name("fnumber")
+            .set_parse_action(cls.convert_to_float)
+        )
+
+    @_lazy_expr
+    def ieee_float(cls):
+        """any floating-point literal (int, real number, infinity, or NaN), converts to a float"""
+        return (
+            Regex(r"(?i:[+-]?(?:(?:\d+\.?\d*(?:e[+-]?\d+)?)|nan|inf(?:inity)?))")
+            .set_name("ieee_float")
+            .set_parse_action(cls.convert_to_float)
         )
-        + "/"
-        + signed_integer().set_parse_action(
-            convert_to_float if PY_310_OR_LATER else token_map(float)
+
+    @_lazy_expr
+    def fast_number(cls):
+        """any numeric expression matched by :class:`number`, converts to the
+        corresponding Python type; matches with a single regex, and converts
+        without a parse action
+
+        .. versionadded:: 3.3.3
+        """
+        return _FastNumber().set_name("number")
+
+    @staticmethod
+    def fast_number_array(
+        typecode: str = "d", delim: Union[str, ParserElement] = ","
+    ) -> ParserElement:
+        """
+        Helper to create an expression for a delimited list of numbers,
+        returned as a single :class:`array.array` token with the given
+        ``typecode``, instead of as separate int or float tokens as parsed
+        by ``DelimitedList(pyparsing_common.fast_number)``. Float typecodes
+        (``"d"`` or ``"f"``) match any numeric form matched by
+        :class:`number`; integer typecodes match only integers, and only
+        unsigned integers for unsigned typecodes such as ``"Q"``.
+
+        Example:
+
+        .. doctest::
+
+            >>> values = pyparsing_common.fast_number_array()
+            >>> values.parse_string("1, 2.5, -3e2")[0]
+            array('d', [1.0, 2.5, -300.0])
+            >>> values = pyparsing_common.fast_number_array("q", delim=";")
+            >>> values.parse_string("1; -2; 3")[0]
+            array('q', [1, -2, 3])
+
+        .. versionadded:: 3.3.3
+        """
+        if typecode in ("f", "d"):
+            item = Regex(r"[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?")
+            item.set_name("number")
+            convert = float
+        elif typecode in ("b", "h", "i", "l", "q"):
+            item = Regex(r"[+-]?\d+").set_name("signed integer")
+            convert = int
+        elif typecode in ("B", "H", "I", "L", "Q"):
+            item = Word(nums).set_name("integer")
+            convert = int
+        else:
+            raise ValueError(f"invalid typecode {typecode!r} for a numeric array")
+
+        return (
+            DelimitedList(item, delim)
+            .set_name("numeric array")
+            .add_parse_action(partial(_convert_to_array, typecode, convert))
         )
-    ).set_name("fraction")
-    """fractional expression of an integer divided by an integer, converts to a float"""
-    fraction.add_parse_action(lambda tt: tt[0] / tt[-1])
-
-    mixed_integer = (
-        fraction | signed_integer + Opt(Opt("-").suppress() + fraction)
-    ).set_name("fraction or mixed integer-fraction")
-    """mixed integer of the form 'integer - fraction', with optional leading integer, converts to a float"""
-    mixed_integer.add_parse_action(sum)
-
-    real = (
-        Regex(r"[+-]?(?:\d+\.\d*|\.\d+)")
-        .set_name("real number")
-        .set_parse_action(convert_to_float if PY_310_OR_LATER else token_map(float))
-    )
-    """expression that parses a floating point number, converts to a float"""
-
-    sci_real = (
-        Regex(r"[+-]?(?:\d+(?:[eE][+-]?\d+)|(?:\d+\.\d*|\.\d+)(?:[eE][+-]?\d+)?)")
-        .set_name("real number with scientific notation")
-        .set_parse_action(convert_to_float if PY_310_OR_LATER else token_map(float))
-    )
-    """expression that parses a floating point number with optional
-    scientific notation, converts to a float"""
-
-    # streamlining this expression makes the docs nicer-looking
-    number = (sci_real | real | signed_integer).set_name("number").streamline()
-    """any numeric expression, converts to the corresponding Python type"""
-
-    fnumber = (
-        Regex(r"[+-]?\d+\.?\d*(?:[eE][+-]?\d+)?")
-        .set_name("fnumber")
-        .set_parse_action(convert_to_float if PY_310_OR_LATER else token_map(float))
-    )
-    """any int or real number, always converts to a float"""
-
-    ieee_float = (
-        Regex(r"(?i:[+-]?(?:(?:\d+\.?\d*(?:e[+-]?\d+)?)|nan|inf(?:inity)?))")
-        .set_name("ieee_float")
-        .set_parse_action(convert_to_float if PY_310_OR_LATER else token_map(float))
-    )
-    """any floating-point literal (int, real number, infinity, or NaN), converts to a float"""
-
-    identifier = Word(identchars, identbodychars).set_name("identifier")
-    """typical code identifier (leading alpha or '_', followed by 0 or more alphas, nums, or '_')"""
-
-    ipv4_address = Regex(
-        r"(?:25[0-5]|2[0-4][0-9]|1?[0-9]{1,2})(?:\.(?:25[0-5]|2[0-4][0-9]|1?[0-9]{1,2})){3}"
-    ).set_name("IPv4 address")
-    "IPv4 address (``0.0.0.0 - 255.255.255.255``)"
-
-    _ipv6_part = Regex(r"[0-9a-fA-F]{1,4}").set_name("hex_integer")
-    _full_ipv6_address = (_ipv6_part + (":" + _ipv6_part) * 7).set_name(
-        "full IPv6 address"
-    )
-    _short_ipv6_address = (
-        Opt(_ipv6_part + (":" + _ipv6_part) * (0, 6))
-        + "::"
-        + Opt(_ipv6_part + (":" + _ipv6_part) * (0, 6))
-    ).set_name("short IPv6 address")
-    _short_ipv6_address.add_condition(
-        lambda t: sum(1 for tt in t if pyparsing_common._ipv6_part.matches(tt)) < 8
-    )
-    _mixed_ipv6_address = ("::ffff:" + ipv4_address).set_name("mixed IPv6 address")
-    ipv6_address = Combine(
-        (_full_ipv6_address | _mixed_ipv6_address | _short_ipv6_address).set_name(
-            "IPv6 address"
+
+    @_lazy_expr
+    def identifier(cls):
+        """typical code identifier (leading alpha or '_', followed by 0 or more alphas, nums, or '_')"""
+        return Word(identchars, identbodychars).set_name("identifier")
+
+    @_lazy_expr
+    def ipv4_address(cls):
+        "IPv4 address (``0.0.0.0 - 255.255.255.255``)"
+        return Regex(
+            r"(?:25[0-5]|2[0-4][0-9]|1?[0-9]{1,2})(?:\.(?:25[0-5]|2[0-4][0-9]|1?[0-9]{1,2})){3}"
+        ).set_name("IPv4 address")
+
+    @_lazy_expr
+    def _ipv6_part(cls):
+        return Regex(r"[0-9a-fA-F]{1,4}").set_name("hex_integer")
+
+    @_lazy_expr
+    def _full_ipv6_address(cls):
+        return (cls._ipv6_part + (Literal(":") + cls._ipv6_part) * 7).set_name(
+            "full IPv6 address"
         )
-    ).set_name("IPv6 address")
-    "IPv6 address (long, short, or mixed form)"
 
-    mac_address = Regex(
-        r"[0-9a-fA-F]{2}([:.-])[0-9a-fA-F]{2}(?:\1[0-9a-fA-F]{2}){4}"
-    ).set_name("MAC address")
-    "MAC address xx:xx:xx:xx:xx (may also have '-' or '.' delimiters)"
+    @_lazy_expr
+    def _short_ipv6_address(cls):
+        short_ipv6_address = (
+            Opt(cls._ipv6_part + (Literal(":") + cls._ipv6_part) * (0, 6))
+            + Literal("::")
+            + Opt(cls._ipv6_part + (Literal(":") + cls._ipv6_part) * (0, 6))
+        ).set_name("short IPv6 address")
+        short_ipv6_address.add_condition(_is_valid_short_ipv6)
+        return short_ipv6_address
+
+    @_lazy_expr
+    def _mixed_ipv6_address(cls):
+        return (Literal("::ffff:") + cls.ipv4_address).set_name("mixed IPv6 address")
+
+    @_lazy_expr
+    def ipv6_address(cls):
+        "IPv6 address (long, short, or mixed form)"
+        return Combine(
+            (
+                cls._full_ipv6_address
+                | cls._mixed_ipv6_address
+                | cls._short_ipv6_address
+            ).set_name("IPv6 address")
+        ).set_name("IPv6 address")
+
+    @_lazy_expr
+    def mac_address(cls):
+        "MAC address xx:xx:xx:xx:xx (may also have '-' or '.' delimiters)"
+        return Regex(
+            r"[0-9a-fA-F]{2}([:.-])[0-9a-fA-F]{2}(?:\1[0-9a-fA-F]{2}){4}"
+        ).set_name("MAC address")
 
     @staticmethod
     def convert_to_date(fmt: str = "%Y-%m-%d"):
@@ -326,14 +511,7 @@ class pyparsing_common:
 
             [datetime.date(1999, 12, 31)]
         """
-
-        def cvt_fn(ss, ll, tt):
-            try:
-                return datetime.strptime(tt[0], fmt).date()
-            except ValueError as ve:
-                raise ParseException(ss, ll, str(ve))
-
-        return cvt_fn
+        return partial(_strptime_date, fmt)
 
     @staticmethod
     def convert_to_datetime(fmt: str = "%Y-%m-%dT%H:%M:%S.%f"):
@@ -357,24 +535,21 @@ class pyparsing_common:
 
             [datetime.datetime(1999, 12, 31, 23, 59, 59, 999000)]
         """
-
-        def cvt_fn(s, l, t):
-            try:
-                return datetime.strptime(t[0], fmt)
-            except ValueError as ve:
-                raise ParseException(s, l, str(ve))
-
-        return cvt_fn
-
-    iso8601_date = Regex(
-        r"(?P<year>\d{4})(?:-(?P<month>\d\d)(?:-(?P<day>\d\d))?)?"
-    ).set_name("ISO8601 date")
-    "ISO8601 date (``yyyy-mm-dd``)"
-
-    iso8601_datetime = Regex(
-        r"(?P<year>\d{4})-(?P<month>\d\d)-(?P<day>\d\d)[T ](?P<hour>\d\d):(?P<minute>\d\d)(:(?P<second>\d\d(\.\d*)?)?)?(?P<tz>Z|[+-]\d\d:?\d\d)?"
-    ).set_name("ISO8601 datetime")
-    "ISO8601 datetime (``yyyy-mm-ddThh:mm:ss.s(Z|+-00:00)``) - trailing seconds, milliseconds, and timezone optional; accepts separating ``'T'`` or ``' '``"
+        return partial(_strptime_datetime, fmt)
+
+    @_lazy_expr
+    def iso8601_date(cls):
+        "ISO8601 date (``yyyy-mm-dd``)"
+        return Regex(
+            r"(?P<year>\d{4})(?:-(?P<month>\d\d)(?:-(?P<day>\d\d))?)?"
+        ).set_name("ISO8601 date")
+
+    @_lazy_expr
+    def iso8601_datetime(cls):
+        "ISO8601 datetime (``yyyy-mm-ddThh:mm:ss.s(Z|+-00:00)``) - trailing seconds, milliseconds, and timezone optional; accepts separating ``'T'`` or ``' '``"
+        return Regex(
+            r"(?P<year>\d{4})-(?P<month>\d\d)-(?P<day>\d\d)[T ](?P<hour>\d\d):(?P<minute>\d\d)(:(?P<second>\d\d(\.\d*)?)?)?(?P<tz>Z|[+-]\d\d:?\d\d)?"
+        ).set_name("ISO8601 datetime")
 
     @staticmethod
     def as_datetime(s, l, t):
@@ -409,18 +584,29 @@ class pyparsing_common:
             ) from None
 
     if PY_310_OR_LATER:
-        iso8601_date_validated = iso8601_date().add_parse_action(as_datetime)
-        "Validated ISO8601 date strings, raising :class:`ParseException` for invalid date values."
 
-        iso8601_datetime_validated = iso8601_datetime().add_parse_action(as_datetime)
-        "Validated ISO8601 date and time strings, raising :class:`ParseException` for invalid date/time values."
+        @_lazy_expr
+        def iso8601_date_validated(cls):
+            "Validated ISO8601 date strings, raising :class:`ParseException` for invalid date values."
+            return cls.iso8601_date().add_parse_action(cls.as_datetime)
+
+        @_lazy_expr
+        def iso8601_datetime_validated(cls):
+            "Validated ISO8601 date and time strings, raising :class:`ParseException` for invalid date/time values."
+            return cls.iso8601_datetime().add_parse_action(cls.as_datetime)
 
-    uuid = Regex(r"[0-9a-fA-F]{8}(?:-[0-9a-fA-F]{4}){3}-[0-9a-fA-F]{12}").set_name(
-        "UUID"
-    )
-    "UUID (``xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx``)"
+    @_lazy_expr
+    def uuid(cls):
+        "UUID (``xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx``)"
+        return Regex(
+            r"[0-9a-fA-F]{8}(?:-[0-9a-fA-F]{4}){3}-[0-9a-fA-F]{12}"
+        ).set_name("UUID")
 
-    _html_stripper = any_open_tag.suppress() | any_close_tag.suppress()
+    @_lazy_expr
+    def _html_stripper(cls):
+        from .helpers import any_open_tag, any_close_tag
+
+        return any_open_tag.suppress() | any_close_tag.suppress()
 
     @staticmethod
     def strip_html_tags(s: str, l: int, tokens: ParseResults):
@@ -445,22 +631,27 @@ class pyparsing_common:
         """
         return pyparsing_common._html_stripper.transform_string(tokens[0])
 
-    _commasepitem = (
-        Combine(
-            OneOrMore(
-                ~Literal(",")
-                + ~LineEnd()
-                + Word(printables, exclude_chars=",")
-                + Opt(White(" \t") + ~FollowedBy(LineEnd() | ","))
+    @_lazy_expr
+    def _commasepitem(cls):
+        return (
+            Combine(
+                OneOrMore(
+                    ~Literal(",")
+                    + ~LineEnd()
+                    + Word(printables, exclude_chars=",")
+                    + Opt(White(" \t") + ~FollowedBy(LineEnd() | Literal(",")))
+                )
             )
+            .streamline()
+            .set_name("commaItem")
         )
-        .streamline()
-        .set_name("commaItem")
-    )
-    comma_separated_list = DelimitedList(
-        Opt(quoted_string.copy() | _commasepitem, default="")
-    ).set_name("comma separated list")
-    """Predefined expression of 1 or more printable words or quoted strings, separated by commas."""
+
+    @_lazy_expr
+    def comma_separated_list(cls):
+        """Predefined expression of 1 or more printable words or quoted strings, separated by commas."""
+        return DelimitedList(
+            Opt(quoted_string.copy() | cls._commasepitem, default="")
+        ).set_name("comma separated list")
 
     @staticmethod
     def upcase_tokens(s, l, t):
@@ -472,61 +663,63 @@ class pyparsing_common:
         """Parse action to convert tokens to lower case."""
         return [tt.lower() for tt in t]
 
-    # fmt: off
-    url = Regex(
-        # https://mathiasbynens.be/demo/url-regex
-        # https://gist.github.com/dperini/729294
-        r"(?P<url>"
-        # protocol identifier (optional)
-        # short syntax // still required
-        r"(?:(?:(?P<scheme>https?|ftp):)?\/\/)"
-        # user:pass BasicAuth (optional)
-        r"(?:(?P<auth>\S+(?::\S*)?)@)?"
-        r"(?P<host>"
-        # IP address exclusion
-        # private & local networks
-        r"(?!(?:10|127)(?:\.\d{1,3}){3})"
-        r"(?!(?:169\.254|192\.168)(?:\.\d{1,3}){2})"
-        r"(?!172\.(?:1[6-9]|2\d|3[0-1])(?:\.\d{1,3}){2})"
-        # IP address dotted notation octets
-        # excludes loopback network 0.0.0.0
-        # excludes reserved space >= 224.0.0.0
-        # excludes network & broadcast addresses
-        # (first & last IP address of each class)
-        r"(?:[1-9]\d?|1\d\d|2[01]\d|22[0-3])"
-        r"(?:\.(?:1?\d{1,2}|2[0-4]\d|25[0-5])){2}"
-        r"(?:\.(?:[1-9]\d?|1\d\d|2[0-4]\d|25[0-4]))"
-        r"|"
-        # host & domain names, may end with dot
-        # can be replaced by a shortest alternative
-        # (?![-_])(?:[-\w\u00a1-\uffff]{0,63}[^-_]\.)+
-        r"(?:"
-        r"(?:"
-        r"[a-z0-9\u00a1-\uffff]"
-        r"[a-z0-9\u00a1-\uffff_-]{0,62}"
-        r")?"
-        r"[a-z0-9\u00a1-\uffff]\."
-        r")+"
-        # TLD identifier name, may end with dot
-        r"(?:[a-z\u00a1-\uffff]{2,}\.?)"
-        r")"
-        # port number (optional)
-        r"(:(?P<port>\d{2,5}))?"
-        # resource path (optional)
-        r"(?P<path>\/[^?# ]*)?"
-        # query string (optional)
-        r"(\?(?P<query>[^#]*))?"
-        # fragment (optional)
-        r"(#(?P<fragment>\S*))?"
-        r")"
-    ).set_name("url")
-    """
-    URL (http/https/ftp scheme)
-    
-    .. versionchanged:: 3.1.0
-       ``url`` named group added
-    """
-    # fmt: on
+    @_lazy_expr
+    def url(cls):
+        """
+        URL (http/https/ftp scheme)
+
+        .. versionchanged:: 3.1.0
+           ``url`` named group added
+        """
+        # fmt: off
+        return Regex(
+            # https://mathiasbynens.be/demo/url-regex
+            # https://gist.github.com/dperini/729294
+            r"(?P<url>"
+            # protocol identifier (optional)
+            # short syntax // still required
+            r"(?:(?:(?P<scheme>https?|ftp):)?\/\/)"
+            # user:pass BasicAuth (optional)
+            r"(?:(?P<auth>\S+(?::\S*)?)@)?"
+            r"(?P<host>"
+            # IP address exclusion
+            # private & local networks
+            r"(?!(?:10|127)(?:\.\d{1,3}){3})"
+            r"(?!(?:169\.254|192\.168)(?:\.\d{1,3}){2})"
+            r"(?!172\.(?:1[6-9]|2\d|3[0-1])(?:\.\d{1,3}){2})"
+            # IP address dotted notation octets
+            # excludes loopback network 0.0.0.0
+            # excludes reserved space >= 224.0.0.0
+            # excludes network & broadcast addresses
+            # (first & last IP address of each class)
+            r"(?:[1-9]\d?|1\d\d|2[01]\d|22[0-3])"
+            r"(?:\.(?:1?\d{1,2}|2[0-4]\d|25[0-5])){2}"
+            r"(?:\.(?:[1-9]\d?|1\d\d|2[0-4]\d|25[0-4]))"
+            r"|"
+            # host & domain names, may end with dot
+            # can be replaced by a shortest alternative
+            # (?![-_])(?:[-\w\u00a1-\uffff]{0,63}[^-_]\.)+
+            r"(?:"
+            r"(?:"
+            r"[a-z0-9\u00a1-\uffff]"
+            r"[a-z0-9\u00a1-\uffff_-]{0,62}"
+            r")?"
+            r"[a-z0-9\u00a1-\uffff]\."
+            r")+"
+            # TLD identifier name, may end with dot
+            r"(?:[a-z\u00a1-\uffff]{2,}\.?)"
+            r")"
+            # port number (optional)
+            r"(:(?P<port>\d{2,5}))?"
+            # resource path (optional)
+            r"(?P<path>\/[^?# ]*)?"
+            # query string (optional)
+            r"(\?(?P<query>[^#]*))?"
+            # fragment (optional)
+            r"(#(?P<fragment>\S*))?"
+            r")"
+        ).set_name("url")
+        # fmt: on
 
     # pre-PEP8 compatibility names
     # fmt: off
@@ -539,7 +732,3 @@ class pyparsing_common:
     downcaseTokens = staticmethod(replaced_by_pep8("downcaseTokens", downcase_tokens))
     # fmt: on
 
-
-_builtin_exprs = [
-    v for v in vars(pyparsing_common).values() if isinstance(v, ParserElement)
-]
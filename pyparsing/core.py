@@ -5,12 +5,16 @@ from __future__ import annotations
 
 import collections.abc
 from collections import deque
+import heapq
+import itertools
 import os
 import typing
 from typing import (
     Any,
+    AsyncGenerator,
     Callable,
     Generator,
+    Mapping,
     NamedTuple,
     Sequence,
     TextIO,
@@ -27,8 +31,9 @@ import sys
 from collections.abc import Iterable
 import traceback
 import types
+import operator
 from operator import itemgetter
-from functools import wraps
+from functools import lru_cache, partial
 from threading import RLock
 from pathlib import Path
 
@@ -48,8 +53,14 @@ from .util import (
 )
 from .exceptions import *
 from .actions import *
-from .results import ParseResults, _ParseResultsWithOffset
-from .unicode import pyparsing_unicode
+from .results import (
+    ParseResults,
+    _ParseResultsBuilder,
+    _ParseResultsWithOffset,
+    _pack_results,
+    _unpack_results,
+)
+from .unicode import CharSet, pyparsing_unicode
 
 _MAX_INT = sys.maxsize
 str_type: tuple[type, ...] = (str, bytes)
@@ -257,72 +268,70 @@ class _ParseActionIndexError(Exception):
         self.exc: BaseException = exc
 
 
-_trim_arity_call_line: traceback.StackSummary = None  # type: ignore[assignment]
-pa_call_line_synth = ()
-
-
-def _trim_arity(func, max_limit=3):
-    """decorator to trim function calls to match the arity of the target"""
-    global _trim_arity_call_line, pa_call_line_synth
-
-    if func in _single_arg_builtins:
-        return lambda s, l, t: func(t)
+class _TrimArityWrapper:
+    """
+    Wrapper for parse actions, to trim calls to match the arity of the
+    wrapped function. Implemented as a class (rather than a closure) so
+    that parse actions can be pickled, as long as the wrapped function can.
+    """
 
-    limit = 0
-    found_arity = False
+    def __init__(self, func, max_limit: int = 3) -> None:
+        # staticmethods referenced inside a class body (such as the
+        # pyparsing_common conversion functions) are unwrapped, so that
+        # they pickle by name like any other function
+        if isinstance(func, staticmethod):
+            func = func.__func__
+        self.func = func
+        self.max_limit = max_limit
+        if func in _single_arg_builtins:
+            # builtins are only passed the tokens
+            self.limit = 2
+            self.found_arity = True
+        else:
+            self.limit = 0
+            self.found_arity = False
 
-    # synthesize what would be returned by traceback.extract_stack at the call to
-    # user's parse action 'func', so that we don't incur call penalty at parse time
+        # copy func name to wrapper for sensible debug output
+        # (can't use functools.wraps, since that messes with function signature)
+        self.__name__ = getattr(func, "__name__", type(func).__name__)
+        self.__doc__ = func.__doc__
 
-    # fmt: off
-    LINE_DIFF = 9
-    # IF ANY CODE CHANGES, EVEN JUST COMMENTS OR BLANK LINES, BETWEEN THE NEXT LINE AND
-    # THE CALL TO FUNC INSIDE WRAPPER, LINE_DIFF MUST BE MODIFIED!!!!
-    _trim_arity_call_line = _trim_arity_call_line or traceback.extract_stack(limit=2)[-1]
-    pa_call_line_synth = pa_call_line_synth or (_trim_arity_call_line[0], _trim_arity_call_line[1] + LINE_DIFF)
-
-    def wrapper(*args):
-        nonlocal found_arity, limit
-        if found_arity:
-            return func(*args[limit:])
+    def __call__(self, *args):
+        if self.found_arity:
+            return self.func(*args[self.limit :])
         while 1:
             try:
-                ret = func(*args[limit:])
-                found_arity = True
+                ret = self.func(*args[self.limit :])
+                self.found_arity = True
                 return ret
             except TypeError as te:
-                # re-raise TypeErrors if they did not come from our arity testing
-                if found_arity:
+                # re-raise TypeErrors if they did not come from our arity testing -
+                # a TypeError for calling func with the wrong number of arguments
+                # is raised here, not from within a frame of func itself
+                if self.found_arity:
                     raise
-                else:
-                    tb = te.__traceback__
-                    frames = traceback.extract_tb(tb, limit=2)
-                    frame_summary = frames[-1]
-                    trim_arity_type_error = (
-                        [frame_summary[:2]][-1][:2] == pa_call_line_synth
-                    )
-                    del tb
+                tb = te.__traceback__
+                trim_arity_type_error = tb is not None and tb.tb_next is None
+                del tb
 
-                    if trim_arity_type_error:
-                        if limit < max_limit:
-                            limit += 1
-                            continue
+                if trim_arity_type_error and self.limit < self.max_limit:
+                    self.limit += 1
+                    continue
 
-                    raise
+                raise
             except IndexError as ie:
                 # wrap IndexErrors inside a _ParseActionIndexError
                 raise _ParseActionIndexError(
                     "IndexError raised in parse action", ie
                 ).with_traceback(None)
-    # fmt: on
 
-    # copy func name to wrapper for sensible debug output
-    # (can't use functools.wraps, since that messes with function signature)
-    func_name = getattr(func, "__name__", getattr(func, "__class__").__name__)
-    wrapper.__name__ = func_name
-    wrapper.__doc__ = func.__doc__
+    def __reduce__(self):
+        return _trim_arity, (self.func, self.max_limit)
 
-    return wrapper
+
+def _trim_arity(func, max_limit=3):
+    """decorator to trim function calls to match the arity of the target"""
+    return _TrimArityWrapper(func, max_limit)
 
 
 def condition_as_parse_action(
@@ -344,14 +353,26 @@ def condition_as_parse_action(
     """
     msg = message if message is not None else "failed user-defined condition"
     exc_type = ParseFatalException if fatal else ParseException
-    fn = _trim_arity(fn)
+    return _ConditionParseAction(_trim_arity(fn), msg, exc_type)
 
-    @wraps(fn)
-    def pa(s, l, t):
-        if not bool(fn(s, l, t)):
-            raise exc_type(s, l, msg)
 
-    return pa
+class _ConditionParseAction:
+    """
+    Parse action that raises an exception if a condition function
+    returns a falsy value. Implemented as a class so that conditions
+    can be pickled along with the rest of a grammar.
+    """
+
+    def __init__(self, fn, msg: str, exc_type: type) -> None:
+        self.fn = fn
+        self.msg = msg
+        self.exc_type = exc_type
+        self.__name__ = fn.__name__
+        self.__doc__ = fn.__doc__
+
+    def __call__(self, s, l, t):
+        if not bool(self.fn(s, l, t)):
+            raise self.exc_type(s, l, self.msg)
 
 
 # control characters escaped so they can't corrupt the printed debug line
@@ -1359,6 +1380,108 @@ class ParserElement(ABC):
         else:
             return tokens
 
+    def parse_many(
+        self,
+        instrings: Iterable[str],
+        parse_all: bool = False,
+        *,
+        on_error: str = "raise",
+        workers: typing.Optional[int] = None,
+        chunksize: int = 100,
+    ) -> Generator[Union[ParseResults, ParseBaseException], None, None]:
+        """
+        Parse each string in ``instrings``, as done in :class:`parse_string`,
+        yielding the parsed results for each. This is more efficient than
+        calling :class:`parse_string` for many short input strings, since
+        setup such as streamlining the expression and building the end-of-string
+        check for ``parse_all`` is done only once. Results are generated
+        lazily as the strings are read from ``instrings``.
+
+        ``on_error`` controls how strings that fail to parse are handled:
+
+        - ``"raise"`` (default) - raise the :class:`ParseException`
+        - ``"return"`` - yield the :class:`ParseException` in place of the
+          parsed results
+        - ``"skip"`` - skip the failed string and continue with the next
+
+        If ``workers`` is greater than 1, the strings are parsed in a
+        ``concurrent.futures.ProcessPoolExecutor`` with that many worker
+        processes. The expression is sent to each worker process once, and
+        the strings are sent in batches of ``chunksize`` strings, with results
+        returned in a compact form and yielded in the same order as the input
+        strings. The expression must be picklable (parse actions must be
+        defined at module level, not as lambdas or nested functions), and any
+        side effects of parse actions are not visible in the calling process.
+
+        Example:
+
+        .. testcode::
+
+            integer = Word(nums).set_parse_action(lambda t: int(t[0]))
+            assignment = Word(alphas) + Suppress("=") + integer
+
+            for result in assignment.parse_many(
+                ["a = 1", "b = x", "c = 3"], parse_all=True, on_error="return"
+            ):
+                print(result)
+
+        prints:
+
+        .. testoutput::
+
+            ['a', 1]
+            Expected W:(0-9), found 'x'  (at char 4), (line:1, col:5)
+            ['c', 3]
+
+        .. versionadded:: 3.3.3
+        """
+        if on_error not in ("raise", "return", "skip"):
+            raise ValueError(
+                f"invalid on_error value {on_error!r}, must be 'raise', 'return', or 'skip'"
+            )
+
+        if workers is not None and workers > 1:
+            yield from _parse_many_in_workers(
+                self, instrings, parse_all, on_error, workers, chunksize
+            )
+            return
+
+        if not self.streamlined:
+            self.streamline()
+        for e in self.ignoreExprs:
+            e.streamline()
+
+        parse_fn = self._parse
+        preparse_fn = self.preParse
+        end_parse_fn = (Empty() + StringEnd().set_debug(False)).streamline()._parse
+        expand_tabs = not self.keepTabs
+        # packrat and left-recursion memos must be cleared for each new string
+        memoizing = ParserElement._packratEnabled or ParserElement._left_recursion_enabled
+
+        ParserElement.reset_cache()
+        for instring in instrings:
+            if memoizing:
+                ParserElement.reset_cache()
+            if expand_tabs and "\t" in instring:
+                instring = instring.expandtabs()
+            try:
+                loc, tokens = parse_fn(instring, 0)
+                if parse_all:
+                    loc = preparse_fn(instring, loc)
+                    end_parse_fn(instring, loc)
+            except _ParseActionIndexError as pa_exc:
+                raise pa_exc.exc
+            except ParseBaseException as exc:
+                if on_error == "skip":
+                    continue
+                if not ParserElement.verbose_stacktrace:
+                    exc = exc.with_traceback(None)
+                if on_error == "raise":
+                    raise exc
+                yield exc
+            else:
+                yield tokens
+
     def scan_string(
         self,
         instring: str,
@@ -1415,25 +1538,62 @@ class ParserElement(ABC):
             instring = str(instring).expandtabs()
         instrlen = len(instring)
         loc = 0
+        preparser: ParserElement = self
         if always_skip_whitespace:
             preparser = Empty()
             preparser.ignoreExprs = self.ignoreExprs
             preparser.whiteChars = self.whiteChars
-            preparseFn = preparser.preParse
-        else:
-            preparseFn = self.preParse
+        preparseFn = preparser.preParse
         parseFn = self._parse
+
+        # once several locations have failed to match, skip over locations that
+        # cannot start a match (see _start_finders)
+        skip_chars = preparser.whiteChars if preparser.skipWhitespace else ()
+        find_start = check_start = None
+        failures_before_prefilter = 16
+
         ParserElement.reset_cache()
         matches = 0
         try:
             while loc <= instrlen and matches < max_matches:
                 try:
-                    preloc: int = preparseFn(instring, loc)
+                    preloc: int
+                    if find_start is not None:
+                        start_match = find_start(instring, loc)
+                        if start_match is None:
+                            break
+                        preloc = start_match.start()
+                        # every location before preloc that is not whitespace
+                        # would have been tried and failed
+                        if preloc > loc and instring[preloc - 1] not in skip_chars:
+                            loc = preloc
+                        elif overlap:
+                            # the next location after a match depends on loc,
+                            # so set it to the start of the whitespace before
+                            # preloc, as if each location had been tried
+                            white_start = preloc
+                            while (
+                                white_start > loc
+                                and instring[white_start - 1] in skip_chars
+                            ):
+                                white_start -= 1
+                            loc = white_start
+                    else:
+                        preloc = preparseFn(instring, loc)
+                        if check_start is not None and not check_start(
+                            instring, preloc
+                        ):
+                            loc = preloc + 1
+                            continue
                     nextLoc: int
                     tokens: ParseResults
                     nextLoc, tokens = parseFn(instring, preloc, callPreParse=False)
                 except ParseException:
                     loc = preloc + 1
+                    if failures_before_prefilter:
+                        failures_before_prefilter -= 1
+                        if not failures_before_prefilter:
+                            find_start, check_start = _start_finders(self, preparser)
                 else:
                     if nextLoc > loc:
                         matches += 1
@@ -1619,6 +1779,319 @@ class ParserElement(ABC):
             last = e
         yield instring[last:]
 
+    async def scan_stream_async(
+        self,
+        reader: typing.Any,
+        max_matches: int = _MAX_INT,
+        *,
+        chunk_size: int = 65536,
+        encoding: str = "utf-8",
+        errors: str = "strict",
+        yield_every: int = 1000,
+    ) -> AsyncGenerator[tuple[ParseResults, int, int], None]:
+        """
+        Asynchronous version of :class:`scan_string`, to scan for matches in
+        data read from an ``asyncio.StreamReader`` (or any object with an
+        awaitable ``read(n)`` method, returning ``bytes`` or ``str``). Yields
+        the matching tokens, start location, and end location of each match,
+        with locations given relative to the start of the stream.
+
+        Data is read from ``reader`` in chunks of at most ``chunk_size``, and
+        only as the results are consumed, so a slow consumer applies
+        backpressure to the reader. Input that has been scanned is discarded.
+        Match attempts that fail within the last ``chunk_size`` characters of
+        the buffered input, or that fail at the end of the buffered input
+        (including syntax errors raised by an :class:`ErrorStop`), are
+        retried once more data is read, so that matches that span chunks are
+        not missed; the input is buffered until such a match is resolved. A
+        single token (such as a quoted string) that is longer than
+        ``chunk_size`` may still fail at its start location, and so be
+        skipped. While scanning, control is returned to the event loop after
+        each chunk is read, and after every ``yield_every`` match attempts,
+        so that other tasks are not starved.
+
+        ``bytes`` data is decoded using the given ``encoding`` and ``errors``
+        arguments. Tabs in the input are not expanded.
+
+        Example:
+
+        .. testcode::
+
+            import asyncio
+
+            async def main():
+                reader = asyncio.StreamReader()
+                reader.feed_data(b"sldjf123lsdjjkf345sldkjf879lkjsfd987")
+                reader.feed_eof()
+                async for tokens, start, end in Word(nums).scan_stream_async(
+                    reader, chunk_size=4
+                ):
+                    print(tokens, start, end)
+
+            asyncio.run(main())
+
+        prints:
+
+        .. testoutput::
+
+            ['123'] 5 8
+            ['345'] 15 18
+            ['879'] 24 27
+            ['987'] 33 36
+
+        .. versionadded:: 3.3.3
+        """
+        import asyncio
+        import codecs
+
+        if not self.streamlined:
+            self.streamline()
+        for e in self.ignoreExprs:
+            e.streamline()
+
+        decoder = codecs.getincrementaldecoder(encoding)(errors)
+        preparser = Empty()
+        preparser.ignoreExprs = self.ignoreExprs
+        preparser.whiteChars = self.whiteChars
+        preparse_fn = preparser.preParse
+        parse_fn = self._parse
+
+        def at_buffer_end(instring: str, loc: int) -> bool:
+            loc = preparse_fn(instring, loc)
+            return _partial_word_at_end(instring, loc) is not None
+
+        instring = ""
+        # location in the stream of the first character in instring, the
+        # number of newlines before it, and the location of the start of its
+        # line
+        offset = newlines = line_start = 0
+        at_eof = False
+        matches = 0
+        attempts = 0
+        while matches < max_matches and not at_eof:
+            data = await reader.read(chunk_size)
+            if not data:
+                at_eof = True
+                data = b""
+            if isinstance(data, str):
+                instring += data
+            else:
+                instring += decoder.decode(data, final=at_eof)
+            instrlen = len(instring)
+
+            # failed match attempts within the last chunk_size characters may
+            # succeed once more data is read, so defer them until then
+            retry_limit = instrlen if at_eof else instrlen - chunk_size
+
+            ParserElement.reset_cache()
+            loc = 0
+            try:
+                while loc <= instrlen and matches < max_matches:
+                    preloc = preparse_fn(instring, loc)
+                    if preloc >= instrlen and not at_eof:
+                        break
+                    attempts += 1
+                    if attempts % yield_every == 0:
+                        await asyncio.sleep(0)
+                    try:
+                        next_loc, tokens = parse_fn(instring, preloc, callPreParse=False)
+                    except ParseException as pe:
+                        # also defer longer match attempts that failed at the
+                        # end of the buffer
+                        if preloc > retry_limit or (
+                            not at_eof and at_buffer_end(instring, pe.loc)
+                        ):
+                            break
+                        loc = preloc + 1
+                        continue
+                    except ParseBaseException as pe:
+                        # a syntax error at the end of the buffer may also be
+                        # caused by an incomplete match
+                        if at_eof or not at_buffer_end(instring, pe.loc):
+                            raise
+                        break
+
+                    if not at_eof and preparse_fn(instring, next_loc) >= instrlen:
+                        # match may be extended by more data
+                        break
+                    if next_loc > loc:
+                        matches += 1
+                        yield tokens, offset + preloc, offset + next_loc
+                        loc = next_loc
+                    else:
+                        loc = preloc + 1
+            except ParseBaseException as exc:
+                _relocate_exception(exc, instring, offset, newlines, line_start)
+                if ParserElement.verbose_stacktrace:
+                    raise
+                raise exc.with_traceback(None)
+
+            # discard scanned input
+            line_breaks = instring.count("\n", 0, loc)
+            if line_breaks:
+                newlines += line_breaks
+                line_start = offset + instring.rfind("\n", 0, loc) + 1
+            instring = instring[loc:]
+            offset += loc
+            await asyncio.sleep(0)
+
+    async def parse_string_async(
+        self,
+        reader: typing.Any,
+        parse_all: bool = False,
+        *,
+        chunk_size: int = 65536,
+        encoding: str = "utf-8",
+        errors: str = "strict",
+    ) -> ParseResults:
+        """
+        Asynchronous version of :class:`parse_string`, to parse data read from
+        an ``asyncio.StreamReader`` (or any object with an awaitable ``read(n)``
+        method, returning ``bytes`` or ``str``). The input is read in chunks of
+        at most ``chunk_size``, returning control to the event loop between
+        chunks.
+
+        This method does not parse incrementally: the whole input is read into
+        memory, and is then parsed by calling :class:`parse_string` in the
+        event loop's default executor. Running the parse in a separate thread
+        only keeps it from blocking the event loop. The packrat and
+        left-recursion caches are global, and are reset by
+        :class:`parse_string` at the start of each parse, so no other parsing
+        should be done (in the event loop or in other threads) while the parse
+        runs if either of them is enabled. To process input as it is read, use
+        :class:`scan_stream_async` or :class:`IncrementalParser`.
+
+        ``bytes`` data is decoded using the given ``encoding`` and ``errors``
+        arguments.
+
+        .. versionadded:: 3.3.3
+        """
+        import asyncio
+        import codecs
+
+        decoder = codecs.getincrementaldecoder(encoding)(errors)
+        chunks: list[str] = []
+        while True:
+            data = await reader.read(chunk_size)
+            if isinstance(data, str):
+                chunks.append(data)
+            else:
+                chunks.append(decoder.decode(data, final=not data))
+            if not data:
+                break
+            await asyncio.sleep(0)
+
+        return await asyncio.get_running_loop().run_in_executor(
+            None, partial(self.parse_string, "".join(chunks), parse_all=parse_all)
+        )
+
+    def scan_string_parallel(
+        self,
+        instring: str,
+        workers: typing.Optional[int] = None,
+        split_on: Union[str, re.Pattern, ParserElement] = r"\n",
+        max_matches: int = _MAX_INT,
+        always_skip_whitespace: bool = True,
+        *,
+        min_partition_size: int = 4096,
+    ) -> Generator[tuple[ParseResults, int, int], None, None]:
+        r"""
+        Version of :class:`scan_string` that scans large inputs using multiple
+        processes. The input string is partitioned at matches of ``split_on``
+        (a regular expression string, compiled ``re.Pattern``, or a
+        :class:`ParserElement`; default= ``r"\n"``), which must be safe points
+        at which to resume scanning, such as the ends of records or lines. The
+        partitions are scanned in a ``concurrent.futures.ProcessPoolExecutor``
+        with ``workers`` processes (default= ``os.cpu_count()``), and the
+        matching tokens, start location, and end location of each match are
+        yielded in order, with locations relative to the full input string.
+
+        The results are the same as those from :class:`scan_string`. If a match
+        extends past the end of its partition, the following partition is
+        re-scanned from the end of that match. Inputs that are too small to
+        split into partitions of at least ``min_partition_size`` characters
+        are scanned in the current process.
+
+        The expression is pickled to send to the worker processes, so any
+        parse actions must be picklable (such as functions defined at module
+        level). Parse actions run in the worker processes, so any side effects
+        are not visible in the calling process.
+
+        Example::
+
+            csv_line = DelimitedList(Word(alphanums), ",") + LineEnd().suppress()
+            for tokens, start, end in csv_line.scan_string_parallel(
+                big_csv_text, workers=4
+            ):
+                print(tokens)
+
+        .. versionadded:: 3.3.3
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        if not self.streamlined:
+            self.streamline()
+        for e in self.ignoreExprs:
+            e.streamline()
+
+        if not self.keepTabs:
+            instring = str(instring).expandtabs()
+        instrlen = len(instring)
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        partitions = _partition_at_separators(
+            instring, split_on, workers * 4, min_partition_size
+        )
+
+        ParserElement.reset_cache()
+        try:
+            if workers < 2 or len(partitions) < 2:
+                yield from itertools.islice(
+                    _scan_range(self, instring, 0, instrlen, always_skip_whitespace),
+                    max_matches,
+                )
+                return
+
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_parallel_scan_init,
+                initargs=(_pickle_for_workers(self), instring),
+            ) as pool:
+                futures = [
+                    pool.submit(
+                        _parallel_scan_partition, start, end, always_skip_whitespace
+                    )
+                    for start, end in partitions
+                ]
+                try:
+                    matches = 0
+                    last_end = 0
+                    for (start, end), future in zip(partitions, futures):
+                        results = future.result()
+                        if last_end > start:
+                            # previous match ran into this partition, re-scan
+                            # from the end of that match
+                            results = _scan_range(
+                                self, instring, last_end, end, always_skip_whitespace
+                            )
+                        for tokens, preloc, next_loc in results:
+                            if matches >= max_matches:
+                                return
+                            matches += 1
+                            yield tokens, preloc, next_loc
+                            last_end = next_loc
+                finally:
+                    for future in futures:
+                        future.cancel()
+
+        except ParseBaseException as exc:
+            if ParserElement.verbose_stacktrace:
+                raise
+
+            # catch and re-raise exception from here, clears out pyparsing internal stack trace
+            raise exc.with_traceback(None)
+
     def __add__(self, other) -> ParserElement:
         """
         Implementation of ``+`` operator - returns :class:`And`. Adding strings to a :class:`ParserElement`
@@ -2217,6 +2690,47 @@ class ParserElement(ABC):
         for e in self.recurse():
             e._checkRecursion(subRecCheckList)
 
+    def _first_chars(
+        self, visited: typing.Optional[dict[int, typing.Optional[CharSet]]] = None
+    ) -> typing.Optional[CharSet]:
+        # Return a CharSet of the characters that a match of this expression
+        # can start with (not counting whitespace or ignorables skipped before
+        # the match), or None if this cannot be determined or if this
+        # expression can match an empty string. The returned set may include
+        # characters that cannot actually start a match, but must not omit
+        # any that can.
+        return None
+
+    def _lead_chars(
+        self, visited: typing.Optional[dict[int, typing.Optional[CharSet]]] = None
+    ) -> typing.Optional[CharSet]:
+        # Same as _first_chars, but also includes the characters that this
+        # expression would skip over before the match, for use by container
+        # expressions that call self._parse with callPreParse=True.
+        visited = {} if visited is None else visited
+        ret = self._first_chars(visited)
+        if ret is None:
+            return None
+        if self.skipWhitespace:
+            ret |= self.whiteChars
+        for e in self.ignoreExprs:
+            ignore_chars = e._first_chars(visited)
+            if ignore_chars is None:
+                return None
+            ret |= ignore_chars
+            if e.skipWhitespace:
+                ret |= e.whiteChars
+        return ret
+
+    def _start_regex(self, skip_chars: frozenset[str]) -> typing.Optional[re.Pattern]:
+        # Return a regex to search for the locations where a match of this
+        # expression can start, for expressions that can narrow these down
+        # better than _first_chars, or None to use _first_chars. The regex
+        # must match at every location where a match can start, and may
+        # also match at others; skip_chars are whitespace characters that
+        # are never at a start location.
+        return None
+
     def validate(self, validateTrace=None) -> None:
         """
         .. deprecated:: 3.0.0
@@ -2640,6 +3154,513 @@ class ParserElement(ABC):
     # fmt: on
 
 
+def _leading_expr(expr: ParserElement) -> ParserElement:
+    # return the expression whose match every match of expr must start with
+    seen: set[int] = set()
+    while id(expr) not in seen:
+        seen.add(id(expr))
+        if isinstance(expr, (TokenConverter, Forward)):
+            if expr.expr is None:
+                break
+            expr = expr.expr
+        elif isinstance(expr, And) and expr.exprs:
+            expr = expr.exprs[0]
+        else:
+            break
+    return expr
+
+
+def _contains_forward(expr: ParserElement) -> bool:
+    # return whether a Forward can be reached from expr; the contents of a
+    # Forward can change after the parser is built (even while parsing, as
+    # with match_previous_literal), so lookup tables or regexes that are
+    # derived from its contents must not be cached
+    seen: set[int] = set()
+    stack = [expr]
+    while stack:
+        e = stack.pop()
+        if id(e) in seen:
+            continue
+        seen.add(id(e))
+        if isinstance(e, Forward):
+            return True
+        stack.extend(e.recurse())
+        stack.extend(e.ignoreExprs)
+    return False
+
+
+def _literal_prefix(expr: ParserElement) -> str:
+    # return a literal string that every match of expr must start with, or ""
+    expr = _leading_expr(expr)
+    if type(expr) in (Literal, _SingleCharLiteral) or (
+        type(expr) is Keyword and not expr.caseless
+    ):
+        return expr.match
+    return ""
+
+
+def _start_prefilter(
+    expr: ParserElement, skip_chars: Iterable[str]
+) -> typing.Optional[re.Pattern]:
+    # return a regex that matches at every location where a match of expr
+    # can start (and possibly others), or None if this cannot be determined;
+    # skip_chars are whitespace characters that are never at a start location
+    start_re = _leading_expr(expr)._start_regex(frozenset(skip_chars))
+    if start_re is not None:
+        return start_re
+    first_chars = expr._first_chars()
+    if first_chars is None:
+        return None
+    return _compile_start_prefilter(
+        first_chars, frozenset(skip_chars), _literal_prefix(expr)
+    )
+
+
+@lru_cache(maxsize=128)
+def _compile_start_prefilter(
+    first_chars: CharSet, skip_chars: frozenset[str], prefix: str
+) -> re.Pattern:
+    first_chars -= skip_chars
+    if not first_chars:
+        # expr can never match
+        return re.compile("(?!)")
+    if prefix and prefix[0] in first_chars:
+        return re.compile(re.escape(prefix))
+    return re.compile(first_chars.regex_class())
+
+
+def _start_finders(
+    expr: ParserElement, preparser: ParserElement
+) -> tuple[typing.Optional[Callable], typing.Optional[Callable]]:
+    # return (find_start, check_start) functions for scanning for matches of
+    # expr, using the prefilter regex from _start_prefilter; at most one is
+    # not None:
+    # - find_start(instring, loc) searches directly for the next possible start
+    #   location, when the only characters skipped by preparser.preParse
+    #   are whitespace
+    # - check_start(instring, loc) checks a location returned by preParse,
+    #   when ignorables must be skipped first
+    skip_chars = preparser.whiteChars if preparser.skipWhitespace else ()
+    start_re = _start_prefilter(expr, skip_chars)
+    if start_re is None:
+        return None, None
+    if preparser.ignoreExprs:
+        return None, start_re.match
+    return start_re.search, None
+
+
+def _scan_range(
+    expr: ParserElement,
+    instring: str,
+    start: int,
+    end: int,
+    always_skip_whitespace: bool = True,
+) -> Generator[tuple[ParseResults, int, int], None, None]:
+    # scan for matches starting between start and end, as done in
+    # ParserElement.scan_string (without overlap)
+    preparser: ParserElement = expr
+    if always_skip_whitespace:
+        preparser = Empty()
+        preparser.ignoreExprs = expr.ignoreExprs
+        preparser.whiteChars = expr.whiteChars
+    preparse_fn = preparser.preParse
+    parse_fn = expr._parse
+    instrlen = len(instring)
+
+    skip_chars = preparser.whiteChars if preparser.skipWhitespace else ()
+    find_start, check_start = _start_finders(expr, preparser)
+
+    loc = start
+    while loc <= instrlen:
+        if find_start is not None:
+            start_match = find_start(instring, loc)
+            if start_match is None:
+                break
+            preloc = start_match.start()
+            if preloc > loc and instring[preloc - 1] not in skip_chars:
+                loc = preloc
+        else:
+            preloc = preparse_fn(instring, loc)
+        if preloc >= end and end < instrlen:
+            break
+        if check_start is not None and not check_start(instring, preloc):
+            loc = preloc + 1
+            continue
+        try:
+            next_loc, tokens = parse_fn(instring, preloc, callPreParse=False)
+        except ParseException:
+            loc = preloc + 1
+        else:
+            if next_loc > loc:
+                yield tokens, preloc, next_loc
+                loc = next_loc
+            else:
+                loc = preloc + 1
+
+
+def _partition_at_separators(
+    instring: str,
+    split_on: Union[str, re.Pattern, ParserElement],
+    num_partitions: int,
+    min_partition_size: int,
+) -> list[tuple[int, int]]:
+    # split instring into (start, end) partitions of roughly equal size, with
+    # each partition (other than the last) ending at the end of a separator
+    instrlen = len(instring)
+    size = max(instrlen // max(num_partitions, 1), min_partition_size, 1)
+
+    if isinstance(split_on, ParserElement):
+        split_on.streamline()
+
+        def next_boundary(loc: int) -> int:
+            for _, _, sep_end in _scan_range(split_on, instring, loc, instrlen):
+                return sep_end
+            return -1
+
+    else:
+        pattern = re.compile(split_on) if isinstance(split_on, str) else split_on
+
+        def next_boundary(loc: int) -> int:
+            match = pattern.search(instring, loc)
+            return match.end() if match else -1
+
+    partitions = []
+    start = 0
+    while start + size < instrlen:
+        boundary = next_boundary(start + size)
+        if boundary <= start or boundary >= instrlen:
+            break
+        partitions.append((start, boundary))
+        start = boundary
+    partitions.append((start, instrlen))
+    return partitions
+
+
+def _pickle_for_workers(expr: ParserElement) -> bytes:
+    # pickle expr to send to worker processes, with a descriptive error if
+    # it cannot be pickled (usually because of a lambda or nested function
+    # used as a parse action)
+    import pickle
+
+    try:
+        return pickle.dumps(expr)
+    except Exception as pickle_exc:
+        reason = f"{type(pickle_exc).__name__}: {pickle_exc}"
+        for e in expr.visit_all():
+            for fn in (*e.parseAction, e.failAction):
+                if fn is None:
+                    continue
+                try:
+                    pickle.dumps(fn)
+                except Exception:
+                    fn_name = getattr(fn, "__name__", type(fn).__name__)
+                    raise TypeError(
+                        f"cannot send expression {expr} to worker processes:"
+                        f" parse action {fn_name!r} of {e} cannot be pickled ({reason});"
+                        " parse actions used with worker processes must be functions"
+                        " defined at module level, not lambdas or nested functions"
+                    ) from pickle_exc
+        raise TypeError(
+            f"cannot send expression {expr} to worker processes: {reason}"
+        ) from pickle_exc
+
+
+# per-process state for ParserElement.scan_string_parallel and
+# ParserElement.parse_many worker processes
+_parallel_scan_state: dict[str, Any] = {}
+
+
+def _parallel_scan_init(expr_state: bytes, instring: str) -> None:
+    import pickle
+
+    _parallel_scan_state["expr"] = pickle.loads(expr_state)
+    _parallel_scan_state["instring"] = instring
+
+
+def _parallel_scan_partition(
+    start: int, end: int, always_skip_whitespace: bool
+) -> list[tuple[ParseResults, int, int]]:
+    ParserElement.reset_cache()
+    return list(
+        _scan_range(
+            _parallel_scan_state["expr"],
+            _parallel_scan_state["instring"],
+            start,
+            end,
+            always_skip_whitespace,
+        )
+    )
+
+
+def _parallel_parse_init(expr_state: bytes) -> None:
+    import pickle
+
+    _parallel_scan_state["expr"] = pickle.loads(expr_state)
+
+
+def _parallel_parse_batch(
+    instrings: list[str], parse_all: bool
+) -> list[Union[tuple, ParseBaseException]]:
+    # parse a batch of strings, returning compact packed results (or the
+    # exceptions for strings that failed to parse)
+    expr: ParserElement = _parallel_scan_state["expr"]
+    return [
+        _pack_results(res) if isinstance(res, ParseResults) else res
+        for res in expr.parse_many(instrings, parse_all, on_error="return")
+    ]
+
+
+def _parse_many_in_workers(
+    expr: ParserElement,
+    instrings: Iterable[str],
+    parse_all: bool,
+    on_error: str,
+    workers: int,
+    chunksize: int,
+) -> Generator[Union[ParseResults, ParseBaseException], None, None]:
+    from concurrent.futures import Future, ProcessPoolExecutor
+
+    expr.streamline()
+    expr_state = _pickle_for_workers(expr)
+    instrings_iter = iter(instrings)
+    # limit the number of batches in flight, so that the input is read
+    # lazily and memory use stays bounded
+    pending: deque[Future] = deque()
+    max_pending = workers * 2
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_parallel_parse_init,
+        initargs=(expr_state,),
+    ) as pool:
+        try:
+            while True:
+                while len(pending) < max_pending:
+                    batch = list(itertools.islice(instrings_iter, chunksize))
+                    if not batch:
+                        break
+                    pending.append(
+                        pool.submit(_parallel_parse_batch, batch, parse_all)
+                    )
+                if not pending:
+                    break
+
+                for res in pending.popleft().result():
+                    if isinstance(res, ParseBaseException):
+                        if on_error == "skip":
+                            continue
+                        if on_error == "raise":
+                            raise res
+                        yield res
+                    else:
+                        yield _unpack_results(res)
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _plain_token_re(expr: ParserElement) -> typing.Optional[re.Pattern]:
+    # return a compiled regex that matches the same text as expr, if expr is a
+    # simple token that returns the matched text as its only token, and has no
+    # parse actions, results name, or other per-element processing
+    if (
+        expr.parseAction
+        or expr.resultsName
+        or expr.debug
+        or expr.ignoreExprs
+        or expr.failAction is not None
+        or not expr.callPreparse
+    ):
+        return None
+    if type(expr) in (Word, Char):
+        if vars(expr).get("parseImpl") == expr.parseImpl_regex:
+            return expr.re
+        return None
+    if type(expr) is Regex and "parseImpl" not in vars(expr) and not expr.re.groupindex:
+        return expr.re
+    if type(expr) in (Literal, _SingleCharLiteral):
+        return re.compile(re.escape(expr.match))
+    return None
+
+
+def _skipped_white_pattern(expr: ParserElement) -> str:
+    # regex pattern for the whitespace skipped before matching expr
+    if expr.skipWhitespace and expr.whiteChars:
+        return f"{_chars_re_class(expr.whiteChars)}*"
+    return ""
+
+
+def _set_parent_anchor(block, s, l, t):
+    # parse action linking an IndentedBlock to the column of the prior expression
+    block.parent_anchor = col(l, s)
+
+
+def _clear_tokens(s, l, t):
+    del t[:]
+
+
+if sys.version_info >= (3, 10):
+    _bit_count = int.bit_count
+else:  # pragma: no cover
+
+    def _bit_count(n: int) -> int:
+        return bin(n).count("1")
+
+
+_all_chars = CharSet.from_ranges([(0, sys.maxunicode)])
+_non_ascii_chars = CharSet.from_ranges([(0x80, sys.maxunicode)])
+_ascii_letters = CharSet(string.ascii_letters)
+
+
+@lru_cache(maxsize=128)
+@lru_cache(maxsize=None)
+def _non_ascii_case_variants() -> dict[str, str]:
+    # map each character in the lower, upper, or casefolded form of a non-ASCII
+    # character back to all the characters that have it in one of those forms
+    # (so that "Σ" maps to "σς"); all cased characters are below U+20000
+    variants: dict[str, set[str]] = {}
+    for code in range(0x80, 0x20000):
+        c = chr(code)
+        for c_variant in {c.lower(), c.upper(), c.casefold()} - {c}:
+            for v in c_variant:
+                variants.setdefault(v, set()).add(c)
+    return {v: "".join(cs) for v, cs in variants.items()}
+
+
+def _caseless_chars(chars: Iterable[str]) -> CharSet:
+    # all characters that could compare equal to any of chars when ignoring
+    # case; some non-ASCII characters are case variants of ASCII letters
+    # (such as "ſ" and "s", or "K" and "k"), so any non-ASCII character is
+    # included for ASCII letters, and all ASCII letters for non-ASCII characters
+    chars = CharSet(chars)
+    ascii_chars = chars - _non_ascii_chars
+    ret = chars | ascii_chars.union(
+        "".join(ascii_chars).lower(), "".join(ascii_chars).upper()
+    )
+    if ascii_chars & _ascii_letters:
+        ret |= _non_ascii_chars
+    non_ascii_chars = chars & _non_ascii_chars
+    if non_ascii_chars:
+        ret |= _ascii_letters
+        if len(non_ascii_chars) > 256:
+            # too many to look up one at a time; the variants of non-ASCII
+            # characters are all non-ASCII characters or ASCII letters
+            return ret | _non_ascii_chars
+        case_variants = _non_ascii_case_variants()
+        added = []
+        for c in non_ascii_chars:
+            for c_variant in {c, c.lower(), c.upper(), c.casefold()}:
+                added.append(c_variant)
+                added.extend(case_variants.get(v, "") for v in c_variant)
+        ret |= "".join(added)
+    return ret
+
+
+@lru_cache(maxsize=128)
+def _regex_first_chars(pattern: re.Pattern) -> typing.Optional[CharSet]:
+    # derive the characters that a match of a compiled regex can start with,
+    # from the parsed form of the pattern; returns None if the pattern can
+    # match an empty string, or uses any construct that is not understood
+    try:
+        import re._parser as sre_parse  # type: ignore[import-not-found]
+    except ImportError:  # pragma: no cover
+        import sre_parse  # type: ignore[no-redef]
+
+    if not isinstance(pattern.pattern, str):
+        return None
+    try:
+        parsed = sre_parse.parse(pattern.pattern, pattern.flags)
+    except Exception:
+        return None
+
+    sre = sre_parse
+    ascii_categories = {
+        sre.CATEGORY_DIGIT: CharSet(string.digits),
+        sre.CATEGORY_WORD: CharSet(string.ascii_letters + string.digits + "_"),
+        sre.CATEGORY_SPACE: CharSet(" \t\n\r\f\v"),
+    }
+    repeat_ops = {
+        sre.MAX_REPEAT,
+        sre.MIN_REPEAT,
+        getattr(sre, "POSSESSIVE_REPEAT", sre.MAX_REPEAT),
+    }
+
+    def class_chars(items, flags) -> CharSet:
+        ret = CharSet()
+        negate = False
+        for op, av in items:
+            if op is sre.NEGATE:
+                negate = True
+            elif op is sre.LITERAL:
+                ret |= chr(av)
+            elif op is sre.RANGE:
+                ret |= CharSet.from_ranges([av])
+            elif op is sre.CATEGORY and av in ascii_categories:
+                ret |= ascii_categories[av]
+                if not flags & re.ASCII:
+                    # Unicode digits, word characters, and spaces
+                    ret |= _non_ascii_chars
+                    if av is sre.CATEGORY_SPACE:
+                        ret |= "\x1c\x1d\x1e\x1f"
+            else:
+                return _all_chars
+        if negate:
+            return _all_chars
+        return ret
+
+    def seq_first(items, flags) -> tuple[typing.Optional[CharSet], bool]:
+        # returns (first chars, whether items can match an empty string)
+        ret = CharSet()
+        for op, av in items:
+            nullable = False
+            if op is sre.LITERAL:
+                chars = CharSet(chr(av))
+            elif op is sre.NOT_LITERAL or op is sre.ANY:
+                chars = _all_chars
+            elif op is sre.IN:
+                chars = class_chars(av, flags)
+            elif op is sre.AT or op is sre.ASSERT or op is sre.ASSERT_NOT:
+                # zero-width
+                continue
+            elif op is sre.BRANCH:
+                chars = CharSet()
+                for branch in av[1]:
+                    branch_chars, branch_nullable = seq_first(branch, flags)
+                    if branch_chars is None:
+                        return None, False
+                    chars |= branch_chars
+                    nullable = nullable or branch_nullable
+            elif op is sre.SUBPATTERN:
+                _, add_flags, del_flags, sub_items = av
+                chars, nullable = seq_first(
+                    sub_items, (flags | add_flags) & ~del_flags
+                )
+            elif op is getattr(sre, "ATOMIC_GROUP", None):
+                chars, nullable = seq_first(av, flags)
+            elif op in repeat_ops:
+                min_repeat, max_repeat, sub_items = av
+                if max_repeat == 0:
+                    continue
+                chars, nullable = seq_first(sub_items, flags)
+                nullable = nullable or min_repeat == 0
+            else:
+                return None, False
+
+            if chars is None:
+                return None, False
+            if flags & re.IGNORECASE:
+                chars = _caseless_chars(chars) if chars is not _all_chars else chars
+            ret |= chars
+            if not nullable:
+                return ret, False
+        return ret, True
+
+    first, nullable = seq_first(parsed, parsed.state.flags)
+    if nullable:
+        return None
+    return first
+
+
 class _PendingSkip(ParserElement):
     # internal placeholder class to hold a place were '...' is added to a parser element,
     # once another ParserElement is added, this placeholder will be replaced with a SkipTo
@@ -2707,6 +3728,9 @@ class NoMatch(Token):
     def parseImpl(self, instring, loc, do_actions=True) -> ParseImplReturnType:
         raise ParseException(instring, loc, self.errmsg, self)
 
+    def _first_chars(self, visited=None) -> typing.Optional[CharSet]:
+        return CharSet()
+
 
 class Literal(Token):
     """
@@ -2770,6 +3794,9 @@ class Literal(Token):
             return loc + self.matchLen, self.match
         raise ParseException(instring, loc, self.errmsg, self)
 
+    def _first_chars(self, visited=None) -> typing.Optional[CharSet]:
+        return CharSet(self.firstMatchChar)
+
 
 class Empty(Literal):
     """
@@ -2784,6 +3811,9 @@ class Empty(Literal):
     def _generateDefaultName(self) -> str:
         return "Empty"
 
+    def _first_chars(self, visited=None) -> typing.Optional[CharSet]:
+        return None
+
     def parseImpl(self, instring, loc, do_actions=True) -> ParseImplReturnType:
         return loc, []
 
@@ -2928,6 +3958,11 @@ class Keyword(Token):
 
         raise ParseException(instring, errloc, errmsg, self)
 
+    def _first_chars(self, visited=None) -> typing.Optional[CharSet]:
+        if self.caseless:
+            return _caseless_chars(self.firstMatchChar)
+        return CharSet(self.firstMatchChar)
+
     @staticmethod
     def set_default_keyword_chars(chars) -> None:
         """
@@ -2971,6 +4006,9 @@ class CaselessLiteral(Literal):
             return loc + self.matchLen, self.returnString
         raise ParseException(instring, loc, self.errmsg, self)
 
+    def _first_chars(self, visited=None) -> typing.Optional[CharSet]:
+        return _caseless_chars(self.firstMatchChar)
+
 
 class CaselessKeyword(Keyword):
     """
@@ -2999,6 +4037,136 @@ class CaselessKeyword(Keyword):
         super().__init__(match_string, identChars, caseless=True)
 
 
+class LiteralSet(Token):
+    """
+    Token to match any one of a set of literal strings, such as a large
+    vocabulary of keywords, operators, or product codes. The strings are
+    stored in a trie, so the time to match does not depend on the number
+    of strings, only on the length of the matched text. If more than one
+    string matches, the longest match is returned.
+
+    Returns the matched string as given in ``symbols``, even if
+    matched caselessly. :class:`one_of` creates a ``LiteralSet`` when
+    called with ``engine="trie"``.
+
+    Parameters:
+
+    - ``symbols`` - a string of space-delimited literals, or a collection
+      of string literals
+    - ``caseless`` - match ignoring case of letters (default=``False``)
+    - ``as_keyword`` - match as keywords, as in :class:`Keyword`; a
+      matched string must not be immediately preceded or followed
+      by a keyword character (default=``False``)
+    - ``ident_chars`` - keyword characters to use if ``as_keyword`` is
+      True (default= :attr:`Keyword.DEFAULT_KEYWORD_CHARS`)
+
+    Example:
+
+    .. testcode::
+
+        stop_words = LiteralSet("a an and in of on the", caseless=True, as_keyword=True)
+        print(stop_words[1, ...].parse_string("In THE and"))
+
+    prints:
+
+    .. testoutput::
+
+        ['in', 'the', 'and']
+
+    .. versionadded:: 3.3.3
+    """
+
+    def __init__(
+        self,
+        symbols: Union[Iterable[str], str],
+        caseless: bool = False,
+        as_keyword: bool = False,
+        ident_chars: typing.Optional[str] = None,
+    ) -> None:
+        super().__init__()
+        if isinstance(symbols, str_type):
+            symbols = typing.cast(str, symbols).split()
+
+        self.caseless = caseless
+        self.as_keyword = as_keyword
+        if ident_chars is None:
+            ident_chars = Keyword.DEFAULT_KEYWORD_CHARS
+        if caseless:
+            ident_chars = ident_chars.upper()
+        self.ident_chars = set(ident_chars)
+
+        # build trie of nested dicts, keyed by character (upper-cased if caseless);
+        # the "" key of a node holds the symbol that ends at that node
+        self.symbols: list[str] = []
+        self._trie: dict = {}
+        for symbol in symbols:
+            node = self._trie
+            for c in symbol:
+                node = node.setdefault(c.upper() if caseless else c, {})
+            if "" not in node:
+                node[""] = symbol
+                self.symbols.append(symbol)
+
+        self._may_return_empty = "" in self._trie
+        self.mayIndexError = False
+        self.errmsg = f"Expected {self.name}"
+
+    def _generateDefaultName(self) -> str:
+        max_shown = 8
+        name = " | ".join(repr(s) for s in self.symbols[:max_shown])
+        if len(self.symbols) > max_shown:
+            name += f" | ... ({len(self.symbols)} symbols)"
+        return name
+
+    def _first_chars(self, visited=None) -> typing.Optional[CharSet]:
+        if self._may_return_empty:
+            return None
+        # caseless trie keys are upper-cased, and may be more than one character
+        first_chars = CharSet(key[0] for key in self._trie)
+        if self.caseless:
+            return _caseless_chars(first_chars)
+        return first_chars
+
+    def parseImpl(self, instring, loc, do_actions=True) -> ParseImplReturnType:
+        caseless = self.caseless
+        as_keyword = self.as_keyword
+        ident_chars = self.ident_chars
+        instrlen = len(instring)
+
+        if as_keyword and loc > 0:
+            prev = instring[loc - 1]
+            if (prev.upper() if caseless else prev) in ident_chars:
+                raise ParseException(instring, loc, self.errmsg, self)
+
+        # walk the trie as far as the input matches, keeping the
+        # longest symbol found along the way
+        node = self._trie
+        match_end = -1
+        match_symbol = ""
+        i = loc
+        while True:
+            symbol = node.get("")
+            if symbol is not None:
+                if (
+                    not as_keyword
+                    or i >= instrlen
+                    or (instring[i].upper() if caseless else instring[i])
+                    not in ident_chars
+                ):
+                    match_end, match_symbol = i, symbol
+            if i >= instrlen:
+                break
+            c = instring[i]
+            node = node.get(c.upper() if caseless else c)
+            if node is None:
+                break
+            i += 1
+
+        if match_end < 0:
+            raise ParseException(instring, loc, self.errmsg, self)
+        return match_end, match_symbol
+
+
 class CloseMatch(Token):
     """A variation on :class:`Literal` which matches "close" matches,
     that is, strings with at most 'n' mismatching characters.
@@ -3008,18 +4176,28 @@ class CloseMatch(Token):
     - ``caseless`` - a boolean indicating whether to ignore casing when comparing characters
     - ``max_mismatches`` - (``default=1``) maximum number of
       mismatches allowed to count as a match
+    - ``allow_indels`` - (``default=False``) if ``True``, also match strings
+      with inserted or deleted characters, with ``max_mismatches`` as the
+      maximum edit (Levenshtein) distance; the longest string with the fewest
+      edits is matched
 
     The results from a successful parse will contain the matched text
     from the input string and the following named results:
 
     - ``mismatches`` - a list of the positions within the
-      match_string where mismatches were found
+      match_string where mismatches were found (when ``allow_indels``
+      is ``True``, the positions of substituted and deleted characters,
+      and of the character following each inserted character)
     - ``original`` - the original match_string used to compare
       against the input string
 
     If ``mismatches`` is an empty list, then the match was an exact
     match.
 
+    When used to scan for matches, as with :meth:`ParserElement.scan_string`,
+    only locations where some part of ``match_string`` is found exactly are
+    tried.
+
     Example:
 
     .. doctest::
@@ -3045,6 +4223,15 @@ class CloseMatch(Token):
         >>> patt.parse_string("ATCAXCGAAXGGA")
         ParseResults(['ATCAXCGAAXGGA'],
         {'original': 'ATCATCGAATGGA', 'mismatches': [4, 9]})
+
+        # close match allowing a deleted character
+        >>> patt = CloseMatch("ATCATCGAATGGA", allow_indels=True)
+        >>> patt.parse_string("ATCATCGATGGA")
+        ParseResults(['ATCATCGATGGA'],
+        {'original': 'ATCATCGAATGGA', 'mismatches': [7]})
+
+    .. versionchanged:: 3.3.3
+       Added ``allow_indels`` parameter.
     """
 
     def __init__(
@@ -3053,6 +4240,7 @@ class CloseMatch(Token):
         max_mismatches: typing.Optional[int] = None,
         *,
         caseless=False,
+        allow_indels: bool = False,
         **kwargs,
     ) -> None:
         maxMismatches: int = deprecate_argument(kwargs, "maxMismatches", 1)
@@ -3061,44 +4249,203 @@ class CloseMatch(Token):
         super().__init__()
         self.match_string = match_string
         self.maxMismatches = maxMismatches
-        self.errmsg = f"Expected {self.match_string!r} (with up to {self.maxMismatches} mismatches)"
+        self.allow_indels = allow_indels
+        self.errmsg = (
+            f"Expected {self.match_string!r} (with up to {self.maxMismatches}"
+            f" {'edits' if allow_indels else 'mismatches'})"
+        )
         self.caseless = caseless
         self.mayIndexError = False
         self._may_return_empty = False
 
+        # the characters of match_string as compared with the input, and a bit
+        # mask for each of them, of the positions where it occurs
+        self._match_chars: Sequence[str] = (
+            [c.lower() for c in match_string] if caseless else match_string
+        )
+        self._char_masks: dict[str, int] = {}
+        for i, c in enumerate(self._match_chars):
+            self._char_masks[c] = self._char_masks.get(c, 0) | 1 << i
+
     def _generateDefaultName(self) -> str:
         return f"{type(self).__name__}:{self.match_string!r}"
 
-    def parseImpl(self, instring, loc, do_actions=True) -> ParseImplReturnType:
-        start = loc
-        instrlen = len(instring)
-        maxloc = start + len(self.match_string)
+    def _start_regex(self, skip_chars: frozenset[str]) -> typing.Optional[re.Pattern]:
+        return _close_match_prefilter(
+            self.match_string,
+            self.maxMismatches,
+            self.caseless,
+            self.allow_indels,
+            skip_chars,
+        )
 
-        if maxloc <= instrlen:
-            match_string = self.match_string
-            match_stringloc = 0
-            mismatches = []
-            maxMismatches = self.maxMismatches
+    def _match_substituted(self, instring, loc) -> typing.Optional[tuple[int, list]]:
+        end = loc + len(self.match_string)
+        if end > len(instring):
+            return None
+        window = instring[loc:end]
+        if window == self.match_string:
+            return end, []
+
+        # compare all characters at once, and only list the positions of the
+        # mismatches if there are few enough of them
+        compared = map(str.lower, window) if self.caseless else window
+        differs = list(map(operator.ne, compared, self._match_chars))
+        if sum(differs) > self.maxMismatches:
+            return None
+        return end, list(itertools.compress(itertools.count(), differs))
+
+    def _match_edited(self, instring, loc) -> typing.Optional[tuple[int, list]]:
+        # Myers' bit-parallel algorithm, computing the edit distance between
+        # match_string and each prefix of instring[loc:] in turn; bit i of vp
+        # (vn) is set if the distance for match_string[:i + 1] is one more (less)
+        # than for match_string[:i]
+        m = len(self._match_chars)
+        max_edits = self.maxMismatches
+        if not m:
+            return loc, []
+        all_bits = (1 << m) - 1
+        high_bit = 1 << (m - 1)
+        vp, vn = all_bits, 0
+        columns = [(vp, vn)]
+        distance = m
+        if distance <= max_edits:
+            best_distance, best_end = distance, loc
+        else:
+            best_distance, best_end = max_edits, -1
 
-            for match_stringloc, s_m in enumerate(
-                zip(instring[loc:maxloc], match_string)
-            ):
-                src, mat = s_m
-                if self.caseless:
-                    src, mat = src.lower(), mat.lower()
+        compared: Iterable[str] = instring[loc : loc + m + max_edits]
+        if self.caseless:
+            compared = map(str.lower, compared)
+        char_masks = map(self._char_masks.get, compared, itertools.repeat(0))
+        for end, eq in enumerate(char_masks, start=loc + 1):
+            xv = eq | vn
+            xh = (((eq & vp) + vp) ^ vp) | eq
+            ph = vn | (all_bits & ~(xh | vp))
+            mh = vp & xh
+            if ph & high_bit:
+                distance += 1
+            elif mh & high_bit:
+                distance -= 1
+            # the distance to an empty match_string increases along the input
+            ph = (ph << 1 | 1) & all_bits
+            mh = (mh << 1) & all_bits
+            vp = mh | (all_bits & ~(xv | ph))
+            vn = ph & xv
+            columns.append((vp, vn))
+            if distance <= best_distance:
+                best_distance, best_end = distance, end
+
+        if best_end < 0:
+            return None
+        return best_end, self._edit_positions(
+            instring[loc:best_end], columns[: best_end - loc + 1]
+        )
 
-                if src != mat:
-                    mismatches.append(match_stringloc)
-                    if len(mismatches) > maxMismatches:
-                        break
+    def _edit_positions(self, matched: str, columns: list) -> list[int]:
+        # trace back a minimal alignment of match_string and the matched text,
+        # using the distances recorded in the bit vectors for each column
+        match_chars = self._match_chars
+        if self.caseless:
+            matched = [c.lower() for c in matched]  # type: ignore[assignment]
+
+        def distance(i: int, j: int) -> int:
+            vp, vn = columns[j]
+            low_bits = (1 << i) - 1
+            return j + _bit_count(vp & low_bits) - _bit_count(vn & low_bits)
+
+        positions = []
+        i, j = len(match_chars), len(matched)
+        while i or j:
+            d = distance(i, j)
+            if i and j:
+                differs = match_chars[i - 1] != matched[j - 1]
+                if d == distance(i - 1, j - 1) + differs:
+                    if differs:
+                        positions.append(i - 1)
+                    i -= 1
+                    j -= 1
+                    continue
+            if i and d == distance(i - 1, j) + 1:
+                # deleted character
+                i -= 1
+                positions.append(i)
             else:
-                loc = start + match_stringloc + 1
-                results = ParseResults([instring[start:loc]])
-                results["original"] = match_string
-                results["mismatches"] = mismatches
-                return loc, results
+                # inserted character
+                j -= 1
+                positions.append(i)
+        positions.reverse()
+        return positions
+
+    def parseImpl(self, instring, loc, do_actions=True) -> ParseImplReturnType:
+        if self.allow_indels:
+            match = self._match_edited(instring, loc)
+        else:
+            match = self._match_substituted(instring, loc)
+        if match is None:
+            raise ParseException(instring, loc, self.errmsg, self)
+
+        end, mismatches = match
+        results = ParseResults([instring[loc:end]])
+        results["original"] = self.match_string
+        results["mismatches"] = mismatches
+        return end, results
+
+
+@lru_cache(maxsize=128)
+def _close_match_prefilter(
+    match_string: str,
+    max_mismatches: int,
+    caseless: bool,
+    allow_indels: bool,
+    skip_chars: frozenset[str],
+) -> typing.Optional[re.Pattern]:
+    # if match_string is split into max_mismatches + 1 pieces, at least one of
+    # them must be matched exactly; return a regex that matches at every location
+    # where one of the pieces is found at its offset in match_string (or within
+    # max_mismatches characters of it, if insertions and deletions are allowed)
+    n_pieces = max_mismatches + 1
+    if len(match_string) < n_pieces:
+        return None
+    alternatives = []
+    for i in range(n_pieces):
+        start = i * len(match_string) // n_pieces
+        end = (i + 1) * len(match_string) // n_pieces
+        if allow_indels:
+            lo, hi = max(start - max_mismatches, 0), start + max_mismatches
+            offset = f"[\\s\\S]{{{lo},{hi}}}"
+        else:
+            offset = f"[\\s\\S]{{{start}}}" if start else ""
+        alternatives.append(f"{offset}{re.escape(match_string[start:end])}")
+    not_white = f"(?!{_chars_re_class(set(skip_chars))})" if skip_chars else ""
+    return re.compile(
+        f"{not_white}(?={'|'.join(alternatives)})", re.IGNORECASE if caseless else 0
+    )
 
-        raise ParseException(instring, loc, self.errmsg, self)
+
+def _chars_as_str(chars: Union[set[str], CharSet]) -> Union[str, CharSet]:
+    # CharSets are kept as-is, to avoid expanding large ranges into strings
+    if isinstance(chars, CharSet):
+        return chars
+    return "".join(sorted(chars))
+
+
+def _chars_re_class(chars: Union[set[str], CharSet]) -> str:
+    if isinstance(chars, CharSet):
+        return chars.regex_class()
+    return f"[{_collapse_string_to_ranges(chars)}]"
+
+
+def _re_repeat(min_len: int, max_len: int) -> str:
+    # regex repetition suffix for matching min_len to max_len characters
+    if min_len > max_len:
+        # can never match
+        return "(?!)"
+    if max_len == _MAX_INT:
+        return "+" if min_len == 1 else f"{{{min_len},}}"
+    if min_len == max_len:
+        return "" if min_len == 1 else f"{{{min_len}}}"
+    return f"{{{min_len},{max_len}}}"
 
 
 class Word(Token):
@@ -3150,6 +4497,11 @@ class Word(Token):
     ``alphas``, ``nums``, and ``printables`` are also defined in several
     Unicode sets - see :class:`pyparsing_unicode`.
 
+    Any of the character arguments can also be given as a :class:`CharSet`;
+    this is much faster for very large character sets, such as
+    ``pyparsing_unicode.CJK.alphas_charset``, since the characters are
+    then kept as ranges, and never expanded into individual characters.
+
     Example:
 
     .. testcode::
@@ -3178,23 +4530,30 @@ class Word(Token):
 
     .. versionchanged:: 3.1.0
        Raises :exc:`ValueError` if ``min`` > ``max``.
+
+    .. versionchanged:: 3.3.3
+       Character arguments may be given as a :class:`CharSet`.
     """
 
     def __init__(
         self,
-        init_chars: str = "",
-        body_chars: typing.Optional[str] = None,
+        init_chars: Union[str, CharSet] = "",
+        body_chars: typing.Optional[Union[str, CharSet]] = None,
         min: int = 1,
         max: int = 0,
         exact: int = 0,
         as_keyword: bool = False,
-        exclude_chars: typing.Optional[str] = None,
+        exclude_chars: typing.Optional[Union[str, CharSet]] = None,
         **kwargs,
     ) -> None:
-        initChars: typing.Optional[str] = deprecate_argument(kwargs, "initChars", None)
-        bodyChars: typing.Optional[str] = deprecate_argument(kwargs, "bodyChars", None)
+        initChars: typing.Optional[Union[str, CharSet]] = deprecate_argument(
+            kwargs, "initChars", None
+        )
+        bodyChars: typing.Optional[Union[str, CharSet]] = deprecate_argument(
+            kwargs, "bodyChars", None
+        )
         asKeyword: bool = deprecate_argument(kwargs, "asKeyword", False)
-        excludeChars: typing.Optional[str] = deprecate_argument(
+        excludeChars: typing.Optional[Union[str, CharSet]] = deprecate_argument(
             kwargs, "excludeChars", None
         )
 
@@ -3208,18 +4567,25 @@ class Word(Token):
                 f"invalid {type(self).__name__}, initChars cannot be empty string"
             )
 
-        initChars_set = set(initChars)
+        # if any of the character sets is given as a CharSet, keep them all
+        # as ranges of characters, instead of as sets of single characters
+        chars_type: type = (
+            CharSet
+            if any(isinstance(c, CharSet) for c in (initChars, bodyChars, excludeChars))
+            else set
+        )
+        initChars_set = chars_type(initChars)
         if excludeChars:
-            excludeChars_set = set(excludeChars)
+            excludeChars_set = chars_type(excludeChars)
             initChars_set -= excludeChars_set
             if bodyChars:
-                bodyChars = "".join(set(bodyChars) - excludeChars_set)
+                bodyChars = chars_type(bodyChars) - excludeChars_set
         self.init_chars = initChars_set
-        self.initCharsOrig = "".join(sorted(initChars_set))
+        self.initCharsOrig = _chars_as_str(initChars_set)
 
         if bodyChars:
-            self.bodyChars = set(bodyChars)
-            self.bodyCharsOrig = "".join(sorted(bodyChars))
+            self.bodyChars = chars_type(bodyChars)
+            self.bodyCharsOrig = _chars_as_str(self.bodyChars)
         else:
             self.bodyChars = initChars_set
             self.bodyCharsOrig = self.initCharsOrig
@@ -3254,52 +4620,61 @@ class Word(Token):
         if self.asKeyword:
             self.errmsg += " as a keyword"
 
-        # see if we can make a regex for this Word
-        if " " not in (self.initChars | self.bodyChars):
-            if len(self.initChars) == 1:
-                re_leading_fragment = re.escape(self.initCharsOrig)
-            else:
-                re_leading_fragment = f"[{_collapse_string_to_ranges(self.initChars)}]"
+        # make a regex for this Word, so that matching runs in the re module;
+        # parseImpl is only used if the regex cannot be compiled
+        if len(self.init_chars) == 1:
+            re_leading_fragment = re.escape(next(iter(self.init_chars)))
+        else:
+            re_leading_fragment = _chars_re_class(self.init_chars)
 
-            if self.bodyChars == self.initChars:
-                if max == 0 and self.minLen == 1:
-                    repeat = "+"
-                elif max == 1:
-                    repeat = ""
+        if self.bodyChars == self.init_chars:
+            if max == 0 and self.minLen == 1:
+                repeat = "+"
+            elif max == 1:
+                repeat = ""
+            else:
+                if self.minLen != self.maxLen:
+                    repeat = f"{{{self.minLen},{'' if self.maxLen == _MAX_INT else self.maxLen}}}"
                 else:
-                    if self.minLen != self.maxLen:
-                        repeat = f"{{{self.minLen},{'' if self.maxLen == _MAX_INT else self.maxLen}}}"
-                    else:
-                        repeat = f"{{{self.minLen}}}"
-                self.reString = f"{re_leading_fragment}{repeat}"
+                    repeat = f"{{{self.minLen}}}"
+            self.reString = f"{re_leading_fragment}{repeat}"
+        else:
+            if max == 1:
+                re_body_fragment = ""
+                repeat = ""
             else:
-                if max == 1:
-                    re_body_fragment = ""
-                    repeat = ""
+                re_body_fragment = _chars_re_class(self.bodyChars)
+                if max == 0 and self.minLen == 1:
+                    repeat = "*"
+                elif max == 2:
+                    repeat = "?" if min <= 1 else ""
                 else:
-                    re_body_fragment = f"[{_collapse_string_to_ranges(self.bodyChars)}]"
-                    if max == 0 and self.minLen == 1:
-                        repeat = "*"
-                    elif max == 2:
-                        repeat = "?" if min <= 1 else ""
+                    if min != max:
+                        repeat = f"{{{min - 1 if min > 0 else ''},{max - 1 if max > 0 else ''}}}"
                     else:
-                        if min != max:
-                            repeat = f"{{{min - 1 if min > 0 else ''},{max - 1 if max > 0 else ''}}}"
-                        else:
-                            repeat = f"{{{min - 1 if min > 0 else ''}}}"
+                        repeat = f"{{{min - 1 if min > 0 else ''}}}"
 
-                self.reString = f"{re_leading_fragment}{re_body_fragment}{repeat}"
+            self.reString = f"{re_leading_fragment}{re_body_fragment}{repeat}"
 
-            if self.asKeyword:
+        if self.asKeyword:
+            if " " in self.init_chars or " " in self.bodyChars:
+                # "\b" word boundaries do not apply to words that can contain
+                # spaces, so check the adjacent characters against the body
+                # characters instead (as is done in parseImpl)
+                re_body_class = _chars_re_class(self.bodyChars)
+                self.reString = (
+                    f"(?<!{re_body_class}){self.reString}(?!{re_body_class})"
+                )
+            else:
                 self.reString = rf"\b{self.reString}\b"
 
-            try:
-                self.re = re.compile(self.reString)
-            except re.error:
-                self.re = None  # type: ignore[assignment]
-            else:
-                self.re_match = self.re.match
-                self.parseImpl = self.parseImpl_regex  # type: ignore[method-assign]
+        try:
+            self.re = re.compile(self.reString)
+        except re.error:
+            self.re = None  # type: ignore[assignment]
+        else:
+            self.re_match = self.re.match
+            self.parseImpl = self.parseImpl_regex  # type: ignore[method-assign]
 
     @property
     def initChars(self) -> set[str]:
@@ -3328,17 +4703,20 @@ class Word(Token):
     def _generateDefaultName(self) -> str:
         def charsAsStr(s):
             max_repr_len = 16
-            s = _collapse_string_to_ranges(s, re_escape=False)
+            if isinstance(s, CharSet):
+                s = s._collapsed_ranges(re_escape=False)
+            else:
+                s = _collapse_string_to_ranges(s, re_escape=False)
 
             if len(s) > max_repr_len:
                 return f"{s[:max_repr_len - 3]}..."
 
             return s
 
-        if self.initChars != self.bodyChars:
-            base = f"W:({charsAsStr(self.initChars)}, {charsAsStr(self.bodyChars)})"
+        if self.init_chars != self.bodyChars:
+            base = f"W:({charsAsStr(self.init_chars)}, {charsAsStr(self.bodyChars)})"
         else:
-            base = f"W:({charsAsStr(self.initChars)})"
+            base = f"W:({charsAsStr(self.init_chars)})"
 
         # add length specification
         if self.minLen > 1 or self.maxLen != _MAX_INT:
@@ -3353,14 +4731,19 @@ class Word(Token):
                 return base + f"{{{self.minLen},{self.maxLen}}}"
         return base
 
+    def _first_chars(self, visited=None) -> typing.Optional[CharSet]:
+        if isinstance(self.init_chars, CharSet):
+            return self.init_chars
+        return CharSet(self.init_chars)
+
     def parseImpl(self, instring, loc, do_actions=True) -> ParseImplReturnType:
-        if instring[loc] not in self.initChars:
+        if instring[loc] not in self.init_chars:
             raise ParseException(instring, loc, self.errmsg, self)
 
         start = loc
         loc += 1
         instrlen = len(instring)
-        body_chars: set[str] = self.bodyChars
+        body_chars: Union[set[str], CharSet] = self.bodyChars
         maxloc = start + self.maxLen
         maxloc = min(maxloc, instrlen)
         while loc < maxloc and instring[loc] in body_chars:
@@ -3397,9 +4780,9 @@ class Char(Word):
 
     def __init__(
         self,
-        charset: str,
+        charset: Union[str, CharSet],
         as_keyword: bool = False,
-        exclude_chars: typing.Optional[str] = None,
+        exclude_chars: typing.Optional[Union[str, CharSet]] = None,
         **kwargs,
     ) -> None:
         asKeyword: bool = deprecate_argument(kwargs, "asKeyword", False)
@@ -3511,6 +4894,13 @@ class Regex(Token):
             ret.parseImpl = ret.parseImplAsMatch  # type: ignore [method-assign]
         return ret
 
+    def __getstate__(self):
+        # resolve a deferred pattern before pickling, since the callable
+        # that creates it may be a lambda
+        if callable(self.pattern):
+            self.re  # noqa
+        return self.__dict__
+
     @cached_property
     def re(self) -> re.Pattern:
         """
@@ -3558,6 +4948,9 @@ class Regex(Token):
         unescaped = repr(self.pattern).replace("\\\\", "\\")
         return f"Re:({unescaped})"
 
+    def _first_chars(self, visited=None) -> typing.Optional[CharSet]:
+        return _regex_first_chars(self.re)
+
     def parseImpl(self, instring, loc, do_actions=True) -> ParseImplReturnType:
         # explicit check for matching past the length of the string;
         # this is done because the re module will not complain about
@@ -3627,16 +5020,42 @@ class Regex(Token):
             )
 
         if self.asMatch:
+            pa = partial(_regex_expand_match, repl)
+        else:
+            pa = partial(_regex_sub_tokens, self.re, repl)
 
-            def pa(tokens):
-                return tokens[0].expand(repl)
+        return self.add_parse_action(pa)
 
-        else:
 
-            def pa(tokens):
-                return self.re.sub(repl, tokens[0])
+# module-level parse actions for Regex.sub, so that they can be pickled
+def _regex_expand_match(repl, tokens):
+    return tokens[0].expand(repl)
 
-        return self.add_parse_action(pa)
+
+def _regex_sub_tokens(regex, repl, tokens):
+    return regex.sub(repl, tokens[0])
+
+
+class _LazyUnquotedString(collections.UserString):
+    """
+    String token returned by :class:`QuotedString` with ``lazy_unquote=True``;
+    the quoted body is unescaped when the token's value is first used, and
+    the result is kept for later accesses.
+    """
+
+    def __init__(self, seq, unquote=None) -> None:
+        self._raw = seq if unquote is not None else str(seq)
+        self._unquote = unquote
+
+    @property
+    def data(self) -> str:  # type: ignore[override]
+        if self._unquote is not None:
+            self._raw = self._unquote(self._raw)
+            self._unquote = None
+        return self._raw
+
+    def __reduce__(self):
+        return self.__class__, (self.data,)
 
 
 class QuotedString(Token):
@@ -3662,9 +5081,21 @@ class QuotedString(Token):
     - ``convert_whitespace_escapes`` - convert escaped whitespace
       (``'\t'``, ``'\n'``, etc.) to actual whitespace
       (default= ``True``)
-
-    .. caution:: ``convert_whitespace_escapes`` has no effect if
-       ``unquote_results`` is ``False``.
+    - ``lazy_unquote`` - keyword-only boolean; if ``True``, a quoted body
+      that contains escapes is returned as a string-like
+      :class:`collections.UserString` token, and its escapes are only
+      converted when the token's value is first used; useful when many
+      quoted strings are parsed and then discarded by backtracking or
+      :class:`Suppress` (default= ``False``). Since these tokens are not
+      ``str`` instances, convert them using ``str()`` before passing them
+      to code that checks ``isinstance(token, str)``, or to ``json.dumps``.
+
+    .. caution:: ``convert_whitespace_escapes`` and ``lazy_unquote`` have
+       no effect if ``unquote_results`` is ``False``.
+
+    .. versionchanged:: 3.3.3
+       Quoted bodies with no escape characters are returned as-is, without
+       running the unescaping scan; added ``lazy_unquote`` argument.
 
     Example:
 
@@ -3694,6 +5125,8 @@ class QuotedString(Token):
         unquote_results: bool = True,
         end_quote_char: typing.Optional[str] = None,
         convert_whitespace_escapes: bool = True,
+        *,
+        lazy_unquote: bool = False,
         **kwargs,
     ) -> None:
         super().__init__()
@@ -3738,7 +5171,16 @@ class QuotedString(Token):
         self.esc_quote: str = esc_quote or ""
         self.unquote_results: bool = unquote_results
         self.convert_whitespace_escapes: bool = convert_whitespace_escapes
+        self.lazy_unquote: bool = lazy_unquote
         self.multiline = multiline
+
+        # substrings whose presence in a quoted body means it needs unescaping;
+        # bodies without any of them are returned unchanged
+        unquote_markers = {self.esc_char, self.esc_quote}
+        if convert_whitespace_escapes:
+            unquote_markers.add("\\")
+        unquote_markers.discard("")
+        self._unquote_markers: tuple[str, ...] = tuple(unquote_markers)
         self.re_flags = re.RegexFlag(0)
 
         # fmt: off
@@ -3819,6 +5261,42 @@ class QuotedString(Token):
 
         return f"quoted string, starting with {self.quote_char} ending with {self.end_quote_char}"
 
+    def _first_chars(self, visited=None) -> typing.Optional[CharSet]:
+        return CharSet(self.quote_char[0])
+
+    def _unquote(self, ret: str) -> str:
+        # fmt: off
+        if self.convert_whitespace_escapes:
+            # as we iterate over matches in the input string,
+            # collect from whichever match group of the unquote_scan_re
+            # regex matches (only 1 group will match at any given time)
+            ret = "".join(
+                # match group 1 matches \t, \n, etc.
+                self.ws_map[g] if (g := match[1])
+                # match group 2 matches escaped octal, null, hex, and Unicode
+                # sequences
+                else _convert_escaped_numerics_to_char(g[1:]) if (g := match[2])
+                # match group 3 matches escaped characters
+                else g[-1] if (g := match[3])
+                # match group 4 matches any character
+                else match[4]
+                for match in self.unquote_scan_re.finditer(ret)
+            )
+        else:
+            ret = "".join(
+                # match group 1 matches escaped characters
+                g[-1] if (g := match[1])
+                # match group 2 matches any character
+                else match[2]
+                for match in self.unquote_scan_re.finditer(ret)
+            )
+        # fmt: on
+
+        # replace escaped quotes
+        if self.esc_quote:
+            ret = ret.replace(self.esc_quote, self.end_quote_char)
+        return ret
+
     def parseImpl(self, instring, loc, do_actions=True) -> ParseImplReturnType:
         # check first character of opening quote to see if that is a match
         # before doing the more complicated regex match
@@ -3838,37 +5316,13 @@ class QuotedString(Token):
             # strip off quotes
             ret = ret[self.quote_char_len : -self.end_quote_char_len]
 
-            if isinstance(ret, str_type):
-                # fmt: off
-                if self.convert_whitespace_escapes:
-                    # as we iterate over matches in the input string,
-                    # collect from whichever match group of the unquote_scan_re
-                    # regex matches (only 1 group will match at any given time)
-                    ret = "".join(
-                        # match group 1 matches \t, \n, etc.
-                        self.ws_map[g] if (g := match[1])
-                        # match group 2 matches escaped octal, null, hex, and Unicode
-                        # sequences
-                        else _convert_escaped_numerics_to_char(g[1:]) if (g := match[2])
-                        # match group 3 matches escaped characters
-                        else g[-1] if (g := match[3])
-                        # match group 4 matches any character
-                        else match[4]
-                        for match in self.unquote_scan_re.finditer(ret)
-                    )
+            # only run the unescaping scan if the body contains something to
+            # unescape; otherwise the stripped text is returned as-is
+            if any(marker in ret for marker in self._unquote_markers):
+                if self.lazy_unquote:
+                    ret = _LazyUnquotedString(ret, self._unquote)
                 else:
-                    ret = "".join(
-                        # match group 1 matches escaped characters
-                        g[-1] if (g := match[1])
-                        # match group 2 matches any character
-                        else match[2]
-                        for match in self.unquote_scan_re.finditer(ret)
-                    )
-                # fmt: on
-
-                # replace escaped quotes
-                if self.esc_quote:
-                    ret = ret.replace(self.esc_quote, self.end_quote_char)
+                    ret = self._unquote(ret)
 
         return loc, ret
 
@@ -3903,14 +5357,21 @@ class CharsNotIn(Token):
     """
 
     def __init__(
-        self, not_chars: str = "", min: int = 1, max: int = 0, exact: int = 0, **kwargs
+        self,
+        not_chars: Union[str, CharSet] = "",
+        min: int = 1,
+        max: int = 0,
+        exact: int = 0,
+        **kwargs,
     ) -> None:
         super().__init__()
-        notChars: str = deprecate_argument(kwargs, "notChars", "")
+        notChars: Union[str, CharSet] = deprecate_argument(kwargs, "notChars", "")
 
         self.skipWhitespace = False
         self.notChars = not_chars or notChars
-        self.notCharsSet = set(self.notChars)
+        self.notCharsSet = (
+            self.notChars if isinstance(self.notChars, CharSet) else set(self.notChars)
+        )
 
         if min < 1:
             raise ValueError(
@@ -3933,28 +5394,37 @@ class CharsNotIn(Token):
         self._may_return_empty = self.minLen == 0
         self.mayIndexError = False
 
+        if self.notChars:
+            re_not_chars = _chars_re_class(self.notCharsSet)
+            re_char = f"[^{re_not_chars[1:]}"
+        else:
+            re_char = r"[\s\S]"
+        self.reString = f"{re_char}{_re_repeat(self.minLen, self.maxLen)}"
+        self.re = re.compile(self.reString)
+        self.re_match = self.re.match
+
     def _generateDefaultName(self) -> str:
+        if isinstance(self.notChars, CharSet):
+            not_chars_str = self.notChars._collapsed_ranges(re_escape=False)
+            if len(not_chars_str) > 16:
+                return f"!W:({not_chars_str[: 16 - 3]}...)"
+            return f"!W:({not_chars_str})"
+
         not_chars_str = _collapse_string_to_ranges(self.notChars)
         if len(not_chars_str) > 16:
             return f"!W:({self.notChars[: 16 - 3]}...)"
         else:
             return f"!W:({self.notChars})"
 
-    def parseImpl(self, instring, loc, do_actions=True) -> ParseImplReturnType:
-        notchars = self.notCharsSet
-        if instring[loc] in notchars:
-            raise ParseException(instring, loc, self.errmsg, self)
-
-        start = loc
-        loc += 1
-        maxlen = min(start + self.maxLen, len(instring))
-        while loc < maxlen and instring[loc] not in notchars:
-            loc += 1
+    def _first_chars(self, visited=None) -> typing.Optional[CharSet]:
+        return _all_chars - self.notCharsSet
 
-        if loc - start < self.minLen:
+    def parseImpl(self, instring, loc, do_actions=True) -> ParseImplReturnType:
+        result = self.re_match(instring, loc)
+        if not result:
             raise ParseException(instring, loc, self.errmsg, self)
 
-        return loc, instring[start:loc]
+        return result.end(), result[0]
 
 
 class White(Token):
@@ -4017,23 +5487,26 @@ class White(Token):
             self.maxLen = exact
             self.minLen = exact
 
+        # at least one whitespace character must match, even if min is 0
+        self.reString = (
+            f"{_chars_re_class(set(self.matchWhite))}"
+            f"{_re_repeat(self.minLen or 1, self.maxLen)}"
+        )
+        self.re = re.compile(self.reString)
+        self.re_match = self.re.match
+
     def _generateDefaultName(self) -> str:
         return "".join(White.whiteStrs[c] for c in self.matchWhite)
 
-    def parseImpl(self, instring, loc, do_actions=True) -> ParseImplReturnType:
-        if instring[loc] not in self.matchWhite:
-            raise ParseException(instring, loc, self.errmsg, self)
-        start = loc
-        loc += 1
-        maxloc = start + self.maxLen
-        maxloc = min(maxloc, len(instring))
-        while loc < maxloc and instring[loc] in self.matchWhite:
-            loc += 1
+    def _first_chars(self, visited=None) -> typing.Optional[CharSet]:
+        return CharSet(self.matchWhite)
 
-        if loc - start < self.minLen:
+    def parseImpl(self, instring, loc, do_actions=True) -> ParseImplReturnType:
+        result = self.re_match(instring, loc)
+        if not result:
             raise ParseException(instring, loc, self.errmsg, self)
 
-        return loc, instring[start:loc]
+        return result.end(), result[0]
 
 
 class PositionToken(Token):
@@ -4327,6 +5800,20 @@ class ParseExpression(ParserElement):
     def recurse(self) -> list[ParserElement]:
         return self.exprs[:]
 
+    def _first_chars(self, visited=None) -> typing.Optional[CharSet]:
+        # a match can start with a match of any of the expressions, which are
+        # parsed with pre-parsing; And overrides this for a sequence
+        if not self.exprs:
+            return None
+        visited = {} if visited is None else visited
+        ret = CharSet()
+        for e in self.exprs:
+            e_chars = e._lead_chars(visited)
+            if e_chars is None:
+                return None
+            ret |= e_chars
+        return ret
+
     def append(self, other) -> ParserElement:
         """
         Add an expression to the list of expressions related to this ParseExpression instance.
@@ -4600,11 +6087,7 @@ class And(ParseExpression):
                     break
                 seen.add(id(cur))
                 if isinstance(cur, IndentedBlock):
-                    prev.add_parse_action(
-                        lambda s, l, t, cur_=cur: setattr(
-                            cur_, "parent_anchor", col(l, s)
-                        )
-                    )
+                    prev.add_parse_action(partial(_set_parent_anchor, cur))
                     break
                 subs = cur.recurse()
                 next_first = next(iter(subs), None)
@@ -4626,6 +6109,7 @@ class And(ParseExpression):
         loc, resultlist = next(exprs)._parse(
             instring, loc, do_actions, callPreParse=False
         )
+        results = _ParseResultsBuilder(resultlist)
 
         # iterate over remaining expressions
         raise_syntax_error_immediately = False
@@ -4649,8 +6133,19 @@ class And(ParseExpression):
                     )
             else:
                 loc, exprtokens = e._parse(instring, loc, do_actions)
-            resultlist += exprtokens
-        return loc, resultlist
+            results.add(exprtokens)
+        return loc, results.build()
+
+    def _first_chars(self, visited=None) -> typing.Optional[CharSet]:
+        # the first expression is parsed without pre-parsing, the rest with;
+        # zero-width lookaheads do not consume the first character
+        call_preparse = False
+        for e in self.exprs:
+            if isinstance(e, (NotAny, And._ErrorStop)):
+                call_preparse = True
+                continue
+            return e._lead_chars(visited) if call_preparse else e._first_chars(visited)
+        return None
 
     def __iadd__(self, other):
         if isinstance(other, str_type):
@@ -5042,65 +6537,190 @@ class Each(ParseExpression):
             self._may_return_empty = True
         return self
 
+    def _init_expr_groups(self) -> None:
+        self.opt1map = dict((id(e.expr), e) for e in self.exprs if isinstance(e, Opt))
+        opt1 = [e.expr for e in self.exprs if isinstance(e, Opt)]
+        opt2 = [
+            e
+            for e in self.exprs
+            if e.mayReturnEmpty and not isinstance(e, (Opt, Regex, ZeroOrMore))
+        ]
+        self.optionals = opt1 + opt2
+        self.multioptionals = [
+            e.expr.set_results_name(e.resultsName, list_all_matches=True)
+            for e in self.exprs
+            if isinstance(e, _MultipleMatch)
+        ]
+        self.multirequired = [
+            e.expr.set_results_name(e.resultsName, list_all_matches=True)
+            for e in self.exprs
+            if isinstance(e, OneOrMore)
+        ]
+        self.required = [
+            e for e in self.exprs if not isinstance(e, (Opt, ZeroOrMore, OneOrMore))
+        ]
+        self.required += self.multirequired
+
+        # Members are tried in the order required, optionals, multioptionals,
+        # and the unmatched members are tracked with a bit mask, with bit i
+        # set if self._members[i] is still to be matched. A required or
+        # optional member is done once it (or an equal expression) matches.
+        members = self.required + self.optionals + self.multioptionals
+        num_reqd = len(self.required)
+        num_opt = len(self.optionals)
+        reqd_bits = (1 << num_reqd) - 1
+        opt_bits = ((1 << num_opt) - 1) << num_reqd
+
+        def equal_members(e: ParserElement) -> int:
+            ret = 0
+            for i, other in enumerate(members[: num_reqd + num_opt]):
+                if other is e or other == e:
+                    ret |= 1 << i
+            return ret
+
+        member_info = []
+        for e in members:
+            eq_mask = equal_members(e)
+            # results are kept from the trial parse of each member, unless
+            # the Opt wrapper returned in its place would modify them
+            wrapper = self.opt1map.get(id(e), e)
+            keep_results = wrapper is e or (
+                not (wrapper.parseAction or wrapper.resultsName or wrapper.debug)
+                and wrapper.skipWhitespace == e.skipWhitespace
+                and wrapper.whiteChars == e.whiteChars
+            )
+            member_info.append(
+                (e, wrapper, eq_mask & reqd_bits, eq_mask & opt_bits, keep_results)
+            )
+        self._members = member_info
+        self._required_mask = reqd_bits
+        self._initial_mask = (1 << len(members)) - 1
+        # Opts that add their default value if not matched, with the mask of
+        # the optional members equal to their expr
+        self._opt_defaults = [
+            (e, equal_members(e.expr) & opt_bits)
+            for e in self.exprs
+            if isinstance(e, Opt)
+        ]
+
+        # whitespace skipped by every member, which cannot start a match of any
+        # of them
+        white_sets = [set(e.whiteChars) if e.skipWhitespace else set() for e in members]
+        common_white = set.intersection(*white_sets) if white_sets else set()
+        self._skip_common_white = re.compile(
+            f"{CharSet(common_white).regex_class()}*" if common_white else ""
+        )
+
+        # mask of the members that can not be ruled out by looking at the
+        # next character, and the characters that can start each other member;
+        # members that contain a Forward can change while parsing, so are
+        # never ruled out
+        dynamic = [_contains_forward(e) for e in members]
+        self._any_char_mask = 0
+        self._member_lead_chars: list[tuple[int, CharSet]] = []
+        for i, e in enumerate(members):
+            lead_chars = None if dynamic[i] else e._lead_chars()
+            if lead_chars is None:
+                self._any_char_mask |= 1 << i
+            else:
+                self._member_lead_chars.append((1 << i, lead_chars))
+        self._char_masks: dict[str, int] = {}
+
+        # literal prefixes that members must start with, for members that do
+        # not skip anything but the common whitespace; the members are looked
+        # up by the first prefix_len characters of their prefixes
+        prefixes = {}
+        for i, e in enumerate(members):
+            prefix = "" if dynamic[i] else _literal_prefix(e)
+            if prefix and not e.ignoreExprs and white_sets[i] == common_white:
+                prefixes[1 << i] = prefix
+        self._prefix_bits = sum(prefixes)
+        self._prefix_len = min(map(len, prefixes.values()), default=0)
+        self._prefix_masks: dict[str, int] = {}
+        for bit, prefix in prefixes.items():
+            key = prefix[: self._prefix_len]
+            self._prefix_masks[key] = self._prefix_masks.get(key, 0) | bit
+        self._long_prefixes = [
+            (bit, prefix)
+            for bit, prefix in prefixes.items()
+            if len(prefix) > self._prefix_len
+        ]
+
+    def _candidate_mask(self, instring: str, loc: int) -> int:
+        # mask of members that could match at loc, based on the next character
+        # after whitespace and the members' literal prefixes
+        loc = self._skip_common_white.match(instring, loc).end()
+        c = instring[loc : loc + 1]
+        ret = self._char_masks.get(c)
+        if ret is None:
+            ret = self._any_char_mask
+            if c:
+                for bit, lead_chars in self._member_lead_chars:
+                    if c in lead_chars:
+                        ret |= bit
+            if len(self._char_masks) < 1024:
+                self._char_masks[c] = ret
+        if ret & self._prefix_bits:
+            key = instring[loc : loc + self._prefix_len]
+            ret &= ~self._prefix_bits | self._prefix_masks.get(key, 0)
+            for bit, prefix in self._long_prefixes:
+                if ret & bit and not instring.startswith(prefix, loc):
+                    ret ^= bit
+        return ret
+
     def parseImpl(self, instring, loc, do_actions=True) -> ParseImplReturnType:
         if self.initExprGroups:
-            self.opt1map = dict(
-                (id(e.expr), e) for e in self.exprs if isinstance(e, Opt)
-            )
-            opt1 = [e.expr for e in self.exprs if isinstance(e, Opt)]
-            opt2 = [
-                e
-                for e in self.exprs
-                if e.mayReturnEmpty and not isinstance(e, (Opt, Regex, ZeroOrMore))
-            ]
-            self.optionals = opt1 + opt2
-            self.multioptionals = [
-                e.expr.set_results_name(e.resultsName, list_all_matches=True)
-                for e in self.exprs
-                if isinstance(e, _MultipleMatch)
-            ]
-            self.multirequired = [
-                e.expr.set_results_name(e.resultsName, list_all_matches=True)
-                for e in self.exprs
-                if isinstance(e, OneOrMore)
-            ]
-            self.required = [
-                e for e in self.exprs if not isinstance(e, (Opt, ZeroOrMore, OneOrMore))
-            ]
-            self.required += self.multirequired
+            self._init_expr_groups()
             self.initExprGroups = False
 
+        members = self._members
+        remaining = self._initial_mask
         tmpLoc = loc
-        tmpReqd = self.required[:]
-        tmpOpt = self.optionals[:]
-        multis = self.multioptionals[:]
-        matchOrder: list[ParserElement] = []
+        # (start loc, member info, results) for each match, in the order found
+        matches: list[tuple[int, tuple, typing.Optional[ParseResults]]] = []
 
-        keepMatching = True
-        failed: list[ParserElement] = []
         fatals: list[ParseFatalException] = []
-        while keepMatching:
-            tmpExprs = tmpReqd + tmpOpt + multis
-            failed.clear()
+        while remaining:
+            # try each remaining member once, in order, advancing through the
+            # input as members match
             fatals.clear()
-            for e in tmpExprs:
+            round_mask = remaining
+            matched_any = False
+            candidates = round_mask & self._candidate_mask(instring, tmpLoc)
+            while candidates:
+                bit = candidates & -candidates
+                info = members[bit.bit_length() - 1]
+                e, _, eq_reqd, eq_opt, keep_results = info
                 try:
-                    tmpLoc = e.try_parse(instring, tmpLoc, raise_fatal=True)
+                    if keep_results:
+                        end_loc, results = e._parse(instring, tmpLoc, do_actions)
+                    else:
+                        end_loc = e.try_parse(instring, tmpLoc, raise_fatal=True)
+                        results = None
                 except ParseFatalException as pfe:
                     pfe.__traceback__ = None
                     pfe.parser_element = e
                     fatals.append(pfe)
-                    failed.append(e)
+                    candidates ^= bit
+                    continue
                 except ParseException:
-                    failed.append(e)
-                else:
-                    matchOrder.append(self.opt1map.get(id(e), e))
-                    if e in tmpReqd:
-                        tmpReqd.remove(e)
-                    elif e in tmpOpt:
-                        tmpOpt.remove(e)
-            if len(failed) == len(tmpExprs):
-                keepMatching = False
+                    candidates ^= bit
+                    continue
+
+                matched_any = True
+                matches.append((tmpLoc, info, results))
+                tmpLoc = end_loc
+                done = remaining & eq_reqd or remaining & eq_opt
+                remaining ^= done & -done
+                # only try the members after this one in this round
+                candidates = (
+                    round_mask
+                    & -(bit << 1)
+                    & self._candidate_mask(instring, tmpLoc)
+                )
+
+            if not matched_any:
+                break
 
         # look for any ParseFatalExceptions
         if fatals:
@@ -5111,22 +6731,31 @@ class Each(ParseExpression):
             max_fatal = fatals[0]
             raise max_fatal
 
-        if tmpReqd:
-            missing = ", ".join([str(e) for e in tmpReqd])
+        if remaining & self._required_mask:
+            missing = ", ".join(
+                str(info[0])
+                for i, info in enumerate(members)
+                if remaining & self._required_mask & (1 << i)
+            )
             raise ParseException(
                 instring,
                 loc,
                 f"Missing one or more required elements ({missing})",
             )
 
-        # add any unmatched Opts, in case they have default values defined
-        matchOrder += [e for e in self.exprs if isinstance(e, Opt) and e.expr in tmpOpt]
-
         total_results = ParseResults([])
-        for e in matchOrder:
-            loc, results = e._parse(instring, loc, do_actions)
+        for start_loc, (_, wrapper, *_), results in matches:
+            if results is None:
+                _, results = wrapper._parse(instring, start_loc, do_actions)
             total_results += results
 
+        # add any unmatched Opts, in case they have default values defined
+        loc = tmpLoc
+        for e, eq_opt in self._opt_defaults:
+            if remaining & eq_opt:
+                loc, results = e._parse(instring, loc, do_actions)
+                total_results += results
+
         return loc, total_results
 
     def _generateDefaultName(self) -> str:
@@ -5173,14 +6802,17 @@ class ParseElementEnhance(ParserElement):
         except ParseSyntaxException:
             raise
         except ParseBaseException as pbe:
-            pbe.pstr = pbe.pstr or instring
-            pbe.loc = pbe.loc or loc
-            pbe.parser_element = pbe.parser_element or self
-            if not isinstance(self, Forward) and self.customName is not None:
-                if self.errmsg:
-                    pbe.msg = self.errmsg
+            self._fill_in_exception(pbe, instring, loc)
             raise
 
+    def _fill_in_exception(self, pbe: ParseBaseException, instring: str, loc: int):
+        pbe.pstr = pbe.pstr or instring
+        pbe.loc = pbe.loc or loc
+        pbe.parser_element = pbe.parser_element or self
+        if not isinstance(self, Forward) and self.customName is not None:
+            if self.errmsg:
+                pbe.msg = self.errmsg
+
     def leave_whitespace(self, recursive: bool = True) -> ParserElement:
         """
         Extends ``leave_whitespace`` defined in base class, and also invokes ``leave_whitespace`` on
@@ -5344,17 +6976,16 @@ class IndentedBlock(ParseElementEnhance):
         self._recursive = recursive
         self._grouped = grouped
         self.parent_anchor = 1
+        self._anchor = Empty()
+        # expressions to match the block at each indent column, built on first use
+        self._block_exprs: dict[tuple, ParserElement] = {}
 
-    def parseImpl(self, instring, loc, do_actions=True) -> ParseImplReturnType:
-        # advance parse position to non-whitespace by using an Empty()
-        # this should be the column to be used for all subsequent indented lines
-        anchor_loc = Empty().preParse(instring, loc)
-
-        # see if self.expr matches at the current location - if not it will raise an exception
-        # and no further work is necessary
-        self.expr.try_parse(instring, anchor_loc, do_actions=do_actions)
+    def copy(self) -> ParserElement:
+        ret = super().copy()
+        ret._block_exprs = {}
+        return ret
 
-        indent_col = col(anchor_loc, instring)
+    def _make_block_expr(self, indent_col: int) -> ParserElement:
         peer_detect_expr = self._Indent(indent_col)
 
         inner_expr = Empty() + peer_detect_expr + self.expr
@@ -5376,9 +7007,24 @@ class IndentedBlock(ParseElementEnhance):
             wrapper = Group
         else:
             wrapper = lambda expr: expr  # type: ignore[misc, assignment]
-        return (wrapper(block) + Optional(trailing_undent)).parseImpl(
-            instring, anchor_loc, do_actions
-        )
+        return wrapper(block) + Optional(trailing_undent)
+
+    def parseImpl(self, instring, loc, do_actions=True) -> ParseImplReturnType:
+        # advance parse position to non-whitespace by using an Empty()
+        # this should be the column to be used for all subsequent indented lines
+        anchor_loc = self._anchor.preParse(instring, loc)
+        indent_col = col(anchor_loc, instring)
+
+        # the expression for the block only depends on the indent column and
+        # the parent anchor column (which may be updated by a parse action on
+        # the preceding expression), so reuse it for every block at the same
+        # columns; it fails at anchor_loc if self.expr does not match there,
+        # so no trial parse of self.expr is needed
+        key = (indent_col, self.parent_anchor, id(self.expr), self.debug)
+        block_expr = self._block_exprs.get(key)
+        if block_expr is None:
+            block_expr = self._block_exprs[key] = self._make_block_expr(indent_col)
+        return block_expr.parseImpl(instring, anchor_loc, do_actions)
 
 
 class AtStringStart(ParseElementEnhance):
@@ -5473,6 +7119,9 @@ class FollowedBy(ParseElementEnhance):
         super().__init__(expr)
         self._may_return_empty = True
 
+    def _first_chars(self, visited=None) -> typing.Optional[CharSet]:
+        return self.expr._lead_chars(visited)
+
     def parseImpl(self, instring, loc, do_actions=True) -> ParseImplReturnType:
         # by using self._expr.parse and deleting the contents of the returned ParseResults list
         # we keep any named results that were defined in the FollowedBy expression
@@ -5535,7 +7184,7 @@ class PrecededBy(ParseElementEnhance):
         self.retreat = retreat
         self.errmsg = f"not preceded by {expr}"
         self.skipWhitespace = False
-        self.parseAction.append(lambda s, l, t: t.__delitem__(slice(None, None)))
+        self.parseAction.append(_clear_tokens)
 
     def parseImpl(self, instring, loc=0, do_actions=True) -> ParseImplReturnType:
         if self.exact:
@@ -5595,6 +7244,10 @@ class Located(ParseElementEnhance):
         [18, ['lkkjj'], 23]
     """
 
+    def _first_chars(self, visited=None) -> typing.Optional[CharSet]:
+        # the wrapped expression's preParse is always called
+        return self.expr._lead_chars(visited)
+
     def parseImpl(self, instring, loc, do_actions=True) -> ParseImplReturnType:
         # skip leading whitespace before capturing the start location, so
         # locn_start marks the start of the match and not preceding whitespace,
@@ -5702,6 +7355,7 @@ class _MultipleMatch(ParseElementEnhance):
         if check_ender:
             try_not_ender(instring, loc)
         loc, tokens = self_expr_parse(instring, loc, do_actions)
+        results = _ParseResultsBuilder(tokens)
         match_count = 1
         try:
             hasIgnoreExprs = not not self.ignoreExprs
@@ -5713,12 +7367,12 @@ class _MultipleMatch(ParseElementEnhance):
                 else:
                     preloc = loc
                 loc, tmptokens = self_expr_parse(instring, preloc, do_actions)
-                tokens += tmptokens
+                results.add(tmptokens)
                 match_count += 1
         except (ParseException, IndexError):
             pass
 
-        return loc, tokens
+        return loc, results.build()
 
     def _setResultsName(self, name, list_all_matches=False) -> ParserElement:
         if (
@@ -5787,6 +7441,9 @@ class OneOrMore(_MultipleMatch):
         [['shape', 'SQUARE'], ['posn', 'upper left'], ['color', 'BLACK']]
     """
 
+    def _first_chars(self, visited=None) -> typing.Optional[CharSet]:
+        return self.expr._lead_chars(visited)
+
     def _generateDefaultName(self) -> str:
         return f"{{{self.expr}}}..."
 
@@ -5851,6 +7508,10 @@ class DelimitedList(ParseElementEnhance):
         ParseResults(['AA:BB:CC:DD:EE'], {})
 
     .. versionadded:: 3.1.0
+
+    .. versionchanged:: 3.3.3
+       Lists of simple tokens without parse actions or results names are matched
+       using regular expressions.
     """
 
     def __init__(
@@ -5883,22 +7544,184 @@ class DelimitedList(ParseElementEnhance):
         self.max = max
         self.allow_trailing_delim = allow_trailing_delim
 
-        delim_list_expr = self.content + (self.delim + self.content) * (
+        repeated_expr = (self.delim + self.content) * (
             self.min - 1,
             None if self.max is None else self.max - 1,
         )
+        delim_list_expr = self.content + repeated_expr
+        self._trailing_delim: typing.Optional[ParserElement] = None
         if self.allow_trailing_delim:
-            delim_list_expr += Opt(self.delim)
+            self._trailing_delim = Opt(self.delim)
+            delim_list_expr += self._trailing_delim
+
+        # the optional items are matched with a ZeroOrMore, which skips
+        # whitespace even if no items are matched; so does the empty And for
+        # max=1, if a trailing delimiter follows it
+        self._optional_items: typing.Optional[ParserElement] = None
+        if isinstance(repeated_expr, ZeroOrMore):
+            self._optional_items = repeated_expr
+        elif isinstance(repeated_expr, And):
+            if not repeated_expr.exprs:
+                if self.allow_trailing_delim:
+                    self._optional_items = repeated_expr
+            elif isinstance(repeated_expr.exprs[-1], ZeroOrMore):
+                self._optional_items = repeated_expr.exprs[-1]
+        self._content_error_stop = False
 
         if self.combine:
             delim_list_expr = Combine(delim_list_expr)
 
         super().__init__(delim_list_expr, savelist=True)
 
+        # the equivalent expression is kept for diagrams and generated parsers,
+        # but parsing is done directly in parseImpl, unless self.expr is later
+        # replaced by a modified copy
+        self._list_expr = delim_list_expr
+        self._plain_scan: typing.Any = None
+
     def _generateDefaultName(self) -> str:
         content_expr = self.content.streamline()
         return f"{content_expr} [{self.raw_delim} {content_expr}]..."
 
+    def streamline(self) -> ParserElement:
+        super().streamline()
+        # if a '-' in the content was merged into the list expression, it also
+        # applies to the required delimiters and items that follow
+        self._content_error_stop = isinstance(self.expr, And) and any(
+            type(e) is And._ErrorStop for e in self.expr.exprs
+        )
+        return self
+
+    def _make_plain_scan(self):
+        # if the content and delimiter are simple tokens without parse actions
+        # or results names, return matching functions for a list item, and for
+        # a delimiter with the whitespace around it, to parse the list without
+        # calling _parse; return False otherwise
+        delim = self.delim
+        if (
+            type(delim) is not Suppress
+            or delim.parseAction
+            or delim.resultsName
+            or delim.debug
+            or delim.ignoreExprs
+            or delim.failAction is not None
+        ):
+            return False
+        content_re = _plain_token_re(self.content)
+        delim_re = _plain_token_re(delim.expr)
+        if content_re is None or delim_re is None:
+            return False
+
+        delim_white = _skipped_white_pattern(delim)
+        content_white = _skipped_white_pattern(self.content)
+        if type(delim.expr) in (Literal, _SingleCharLiteral) and not (
+            delim.skipWhitespace and delim.expr.match[0] in delim.whiteChars
+        ):
+            delim_pattern = f"{delim_white}{re.escape(delim.expr.match)}"
+        elif delim_re.flags == re.UNICODE and not delim_re.groups:
+            # match the whitespace and the delimiter without backtracking into
+            # them, as _parse would
+            delim_pattern = f"(?=({delim_white}))\\1(?=({delim_re.pattern}))\\2"
+        else:
+            return False
+        sep_re = re.compile(f"{delim_pattern}{content_white}")
+        return content_re.match, sep_re.match, self._plain_scan_white()
+
+    def _plain_scan_white(self) -> tuple:
+        content, delim = self.content, self.delim
+        return (
+            content.skipWhitespace,
+            content.whiteChars,
+            delim.skipWhitespace,
+            delim.whiteChars,
+        )
+
+    def _plain_scan_changed(self) -> bool:
+        # the content and delimiter can be changed after the plain scan was
+        # made for them, by adding parse actions, ignore expressions, or
+        # debugging (which rule out a plain scan), or by changing whitespace
+        for e in (self.content, self.delim, self.delim.expr):
+            if e.parseAction or e.ignoreExprs or e.debug or e.failAction is not None:
+                return True
+        return self._plain_scan[2] != self._plain_scan_white()
+
+    def _parse_plain(self, instring, loc) -> typing.Optional[ParseImplReturnType]:
+        # parse a list of simple tokens using only regex matches; returns None
+        # if there is no match, to get the exception from the general case
+        content_match, sep_match, _ = self._plain_scan
+        match = content_match(instring, loc)
+        if match is None:
+            return None
+        loc = match.end()
+        tokens = [match[0]]
+        max_count = _MAX_INT if self.max is None else self.max
+        while len(tokens) < max_count:
+            sep = sep_match(instring, loc)
+            if sep is None:
+                break
+            match = content_match(instring, sep.end())
+            if match is None:
+                break
+            loc = match.end()
+            tokens.append(match[0])
+        if len(tokens) < self.min:
+            return None
+        if len(tokens) == self.min and self._optional_items is not None:
+            loc = self._optional_items.preParse(instring, loc)
+        if self._trailing_delim is not None:
+            loc = self._trailing_delim._parse(instring, loc, False)[0]
+        return loc, ParseResults(tokens)
+
+    def _parse_list(self, instring, loc, do_actions) -> ParseImplReturnType:
+        content_parse = self.content._parse
+        delim_parse = self.delim._parse
+        loc, tokens = content_parse(instring, loc, do_actions, callPreParse=False)
+        results = _ParseResultsBuilder(tokens)
+        count = 1
+        while self.max is None or count < self.max:
+            try:
+                delim_loc, delim_tokens = delim_parse(instring, loc, do_actions)
+                item_loc, item_tokens = content_parse(instring, delim_loc, do_actions)
+            except (ParseException, IndexError):
+                if count < self.min:
+                    raise
+                break
+            results.add(delim_tokens)
+            results.add(item_tokens)
+            loc = item_loc
+            count += 1
+        if count == self.min and self._optional_items is not None:
+            loc = self._optional_items.preParse(instring, loc)
+        if self._trailing_delim is not None:
+            loc, delim_tokens = self._trailing_delim._parse(instring, loc, do_actions)
+            results.add(delim_tokens)
+        return loc, results.build()
+
+    def parseImpl(self, instring, loc, do_actions=True) -> ParseImplReturnType:
+        if (
+            self.combine
+            or self.expr is not self._list_expr
+            or self._content_error_stop
+        ):
+            return super().parseImpl(instring, loc, do_actions)
+
+        if self._plain_scan is None or (
+            self._plain_scan and self._plain_scan_changed()
+        ):
+            self._plain_scan = self._make_plain_scan()
+        if self._plain_scan:
+            ret = self._parse_plain(instring, loc)
+            if ret is not None:
+                return ret
+
+        try:
+            return self._parse_list(instring, loc, do_actions)
+        except ParseSyntaxException:
+            raise
+        except ParseBaseException as pbe:
+            self._fill_in_exception(pbe, instring, loc)
+            raise
+
 
 class _NullToken:
     def __bool__(self):
@@ -5907,6 +7730,13 @@ class _NullToken:
     def __str__(self):
         return ""
 
+    def __reduce__(self):
+        # unpickle as the module-level instance, which Opt checks by identity
+        return "_null_token"
+
+
+_null_token = _NullToken()
+
 
 class Opt(ParseElementEnhance):
     """
@@ -5955,7 +7785,7 @@ class Opt(ParseElementEnhance):
         FAIL: Expected end of text, found '-'  (at char 5), (line:1, col:6)
     """
 
-    __optionalNotMatched = _NullToken()
+    __optionalNotMatched = _null_token
 
     def __init__(
         self, expr: Union[ParserElement, str], default: Any = __optionalNotMatched
@@ -6096,6 +7926,65 @@ class SkipTo(ParseElementEnhance):
             self.ignorer.ignore(e)
         if self.ignoreExpr:
             self.ignorer.ignore(self.ignoreExpr)
+        self._skip_re: Union[re.Pattern, None, bool] = False
+
+    def copy(self) -> ParserElement:
+        ret = cast(SkipTo, super().copy())
+        # do not share ignore expressions with the original
+        ret.ignorer = self.ignorer.copy()
+        return ret
+
+    def streamline(self) -> ParserElement:
+        super().streamline()
+        self._skip_re = False
+        return self
+
+    def _make_skip_re(self) -> typing.Optional[re.Pattern]:
+        # Build a regex whose search finds the next location at which the
+        # target, fail_on, or ignore expressions could match; every location
+        # skipped over would just have failed all of them, so parseImpl can
+        # jump straight to the next possible location. Returns None if the
+        # possible start characters of any of these cannot be determined, or
+        # can change after the regex is built.
+        fail_on = self.failOn
+        ignore_exprs = self.ignorer.ignoreExprs
+        target = self.expr
+        checked_exprs = [target, *ignore_exprs]
+        if fail_on is not None:
+            checked_exprs.append(fail_on)
+        if any(_contains_forward(e) for e in checked_exprs):
+            return None
+        if fail_on is None and not ignore_exprs:
+            if type(target) is Regex:
+                return target.re
+            prefix = _literal_prefix(target)
+            if prefix:
+                return re.compile(re.escape(prefix))
+
+        first_chars = target._first_chars()
+        if first_chars is None:
+            return None
+        patterns = [first_chars.regex_class()] if first_chars else []
+        for e in ([fail_on] if fail_on is not None else []) + ignore_exprs:
+            # these are parsed with callPreParse=True, so can start by skipping
+            # over whitespace
+            if e.ignoreExprs:
+                lead_chars = e._lead_chars()
+                if lead_chars is None:
+                    return None
+                patterns.append(lead_chars.regex_class())
+                continue
+            e_first_chars = e._first_chars()
+            if e_first_chars is None:
+                return None
+            if not e_first_chars:
+                continue
+            if e.skipWhitespace and e.whiteChars:
+                white = CharSet(e.whiteChars).regex_class()
+                patterns.append(f"{white}*{e_first_chars.regex_class()}")
+            else:
+                patterns.append(e_first_chars.regex_class())
+        return re.compile("|".join(patterns) or "(?!)")
 
     def ignore(self, expr):
         """
@@ -6105,6 +7994,7 @@ class SkipTo(ParseElementEnhance):
         """
         super().ignore(expr)
         self._update_ignorer()
+        return self
 
     def parseImpl(self, instring, loc, do_actions=True):
         startloc = loc
@@ -6114,9 +8004,19 @@ class SkipTo(ParseElementEnhance):
             self.failOn.can_parse_next if self.failOn is not None else None
         )
         ignorer_try_parse = self.ignorer.try_parse if self.ignorer.ignoreExprs else None
+        if self._skip_re is False:
+            self._skip_re = self._make_skip_re()
+        skip_search = self._skip_re.search if self._skip_re is not None else None
 
         tmploc = loc
         while tmploc <= instrlen:
+            if skip_search is not None:
+                # jump ahead to the next location where anything could match
+                skip_match = skip_search(instring, tmploc)
+                if skip_match is None:
+                    raise ParseException(instring, loc, self.errmsg, self)
+                tmploc = skip_match.start()
+
             if self_failOn_canParseNext is not None:
                 # break if failOn expression matches
                 if self_failOn_canParseNext(instring, tmploc):
@@ -6199,6 +8099,23 @@ class Forward(ParseElementEnhance):
         super().__init__(other, savelist=False)  # type: ignore[arg-type]
         self.lshift_line = None
 
+    def __getstate__(self):
+        # the traceback.FrameSummary objects saved for diagnostic warnings
+        # can't be pickled using protocols 0 and 1, so save them as tuples
+        state = self.__dict__.copy()
+        for attr in ("caller_frame", "lshift_line"):
+            frame = state.get(attr)
+            if frame is not None:
+                state[attr] = (frame.filename, frame.lineno, frame.name)
+        return state
+
+    def __setstate__(self, state):
+        for attr in ("caller_frame", "lshift_line"):
+            frame = state.get(attr)
+            if frame is not None:
+                state[attr] = traceback.FrameSummary(*frame, lookup_line=False)
+        self.__dict__.update(state)
+
     def __lshift__(self, other) -> Forward:
         if hasattr(self, "caller_frame"):
             del self.caller_frame
@@ -6355,6 +8272,16 @@ class Forward(ParseElementEnhance):
                             raise
                     prev_loc, prev_peek = memo[peek_key] = new_loc, new_peek
 
+    def _first_chars(self, visited=None) -> typing.Optional[CharSet]:
+        # memoize by id, so that each Forward is only evaluated once; a
+        # recursive reference back to this Forward cannot be resolved
+        visited = {} if visited is None else visited
+        if id(self) not in visited:
+            visited[id(self)] = None
+            if self.expr is not None:
+                visited[id(self)] = self.expr._first_chars(visited)
+        return visited[id(self)]
+
     def leave_whitespace(self, recursive: bool = True) -> ParserElement:
         """
         Extends ``leave_whitespace`` defined in base class.
@@ -6454,6 +8381,9 @@ class TokenConverter(ParseElementEnhance):
         super().__init__(expr)  # , savelist)
         self.saveAsList = False
 
+    def _first_chars(self, visited=None) -> typing.Optional[CharSet]:
+        return self.expr._first_chars(visited)
+
 
 class Combine(TokenConverter):
     """Converter to concatenate all matching tokens to a single string.
@@ -6728,6 +8658,252 @@ class Suppress(TokenConverter):
         return self
 
 
+# matches the rest of a buffer of streamed input, if it holds no more than
+# one word - a match attempt that fails there may succeed once more input is
+# read. This only looks at the location reported by the failure, so it is a
+# heuristic: a failure reported further back than the last word of the
+# buffer (such as a multi-word Literal cut off between its words, or an
+# alternative that backtracked over more than one word) is taken to be final,
+# and a failure in the last word that more input cannot fix is only reported
+# once more input has been read.
+_partial_word_at_end = re.compile(r"\S*\s*\Z").match
+
+
+def _relocate_exception(
+    exc: ParseBaseException, buffer: str, start: int, newlines: int, line_start: int
+) -> None:
+    # convert the location of an exception raised while parsing a buffer of
+    # streamed input to a location in the stream, given the stream location of
+    # the start of the buffer, the number of newlines before it, and the stream
+    # location of the start of its first line; pstr is left as the buffered
+    # text, so line and found only show the buffered part of the input
+    if exc.pstr is not buffer:
+        return
+    line_column = exc.col
+    lineno = exc.lineno
+    # compute these from the buffered text, before loc is changed
+    exc.line, exc.found, exc._line_column = exc.line, exc.found, line_column
+    if lineno == 1:
+        line_column += start - line_start
+    exc.lineno = lineno + newlines
+    exc.col = exc.column = line_column
+    exc.loc += start
+    exc.args = (exc.pstr, exc.loc, exc.msg)
+
+
+class IncrementalParser:
+    """
+    Push-style parser, for input that arrives in fragments, such as lines
+    read from a socket or a pipe. Data is passed in using :meth:`feed`, and
+    each time a complete match of the given expression is found in the
+    buffered input, its tokens are passed to ``callback`` - or, if no
+    callback is given, queued for iteration. Call :meth:`close` at the end
+    of the input, to flush the final match.
+
+    A match is only reported once the buffer contains input past the end of
+    the match (other than whitespace or ignorable expressions), so that
+    matches that span chunk boundaries, or that could be extended by more
+    input, are not reported prematurely. Similarly, if the expression fails
+    to match the buffered input, parsing is suspended until more data is
+    fed; the failure is only raised once :meth:`close` is called. A syntax
+    error raised by an :class:`ErrorStop` (``-``) is also treated as
+    incomplete input, if no more than one word of the buffered input follows
+    the error location. Input text that has been matched is
+    discarded from the buffer.
+
+    The location, line number and column of raised exceptions are relative
+    to the start of the input stream. Since consumed input is discarded, the
+    exception's input string and ``line`` only hold the buffered text.
+
+    Deciding whether a syntax error is caused by incomplete input only looks
+    at the location of the error, so an error reported more than one word
+    before the end of the buffer (such as a multi-word :class:`Literal` that
+    is cut off between its words) is raised without waiting for more input.
+
+    :param expr: the expression to match repeatedly in the input stream
+    :param callback: (default= ``None``) function to call with the
+                     :class:`ParseResults` of each match
+    :param max_buffer: (default= ``None``) if given, raise
+                       :class:`ParseException` if this many characters are
+                       buffered without completing a match
+
+    Tabs in the input are not expanded, since the column position of a chunk
+    is not known until all previous chunks have been parsed.
+
+    Example:
+
+    .. testcode::
+
+        integer = Word(nums).set_parse_action(lambda t: int(t[0]))
+        assignment = Word(alphas) + Suppress("=") + integer + Suppress(";")
+
+        parser = IncrementalParser(assignment)
+        for chunk in ["a = 1", "00; b", " = 2", "; c = 3;"]:
+            parser.feed(chunk)
+            for tokens in parser:
+                print(tokens)
+        parser.close()
+        for tokens in parser:
+            print(tokens)
+
+    prints:
+
+    .. testoutput::
+
+        ['a', 100]
+        ['b', 2]
+        ['c', 3]
+
+    .. versionadded:: 3.3.3
+    """
+
+    def __init__(
+        self,
+        expr: ParserElement,
+        callback: typing.Optional[Callable[[ParseResults], Any]] = None,
+        *,
+        max_buffer: typing.Optional[int] = None,
+    ) -> None:
+        self.expr = expr
+        self.callback = callback
+        self.max_buffer = max_buffer
+        self.closed = False
+        # number of characters of the stream that have been consumed and
+        # discarded from the buffer
+        self.consumed = 0
+        # number of newlines in the consumed input, and the stream location
+        # of the start of the line containing the start of the buffer
+        self._newlines = 0
+        self._line_start = 0
+        self._buffer = ""
+        self._results: deque[ParseResults] = deque()
+
+    def feed(self, data: str) -> list[ParseResults]:
+        """
+        Add ``data`` to the input buffer, and parse all complete matches.
+        Returns a list of the :class:`ParseResults` for the matches found.
+        """
+        if self.closed:
+            raise ValueError("cannot feed data to a closed IncrementalParser")
+        self._buffer += data
+        return self._parse_buffer(final=False)
+
+    def close(self) -> list[ParseResults]:
+        """
+        Mark the end of the input stream, and parse any remaining buffered
+        input. Raises :class:`ParseException` if there is buffered input that
+        does not match the expression. Returns a list of the
+        :class:`ParseResults` for the matches found.
+        """
+        if self.closed:
+            return []
+        self.closed = True
+        return self._parse_buffer(final=True)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> ParseResults:
+        # drain matches that have been found, but not yet iterated over
+        if self._results:
+            return self._results.popleft()
+        raise StopIteration
+
+    def _parse_buffer(self, final: bool) -> list[ParseResults]:
+        expr = self.expr
+        if not expr.streamlined:
+            expr.streamline()
+        for e in expr.ignoreExprs:
+            e.streamline()
+
+        instring = self._buffer
+        instrlen = len(instring)
+        parse_fn = expr._parse
+        found: list[ParseResults] = []
+        error: typing.Optional[ParseBaseException] = None
+        loc = 0
+        ParserElement.reset_cache()
+        try:
+            while True:
+                if expr.preParse(instring, loc) >= instrlen:
+                    # only whitespace or ignorables remain
+                    if final:
+                        loc = instrlen
+                    break
+                try:
+                    next_loc, tokens = parse_fn(instring, loc)
+                except ParseException as pe:
+                    if final:
+                        error = pe
+                    # else may be an incomplete match - wait for more data
+                    break
+                except ParseBaseException as pe:
+                    # a syntax error at the end of the buffer may also be
+                    # caused by an incomplete match
+                    if final or not self._at_buffer_end(instring, pe.loc):
+                        error = pe
+                    break
+
+                if next_loc <= loc:
+                    # empty match, no progress can be made
+                    if final:
+                        error = ParseException(instring, loc, expr.errmsg, expr)
+                    break
+                if not final and expr.preParse(instring, next_loc) >= instrlen:
+                    # match extends to the end of the buffer, more data may
+                    # change it - wait for more data
+                    break
+
+                found.append(tokens)
+                loc = next_loc
+        except ParseBaseException as exc:
+            error = exc
+        finally:
+            if error is not None:
+                _relocate_exception(
+                    error, instring, self.consumed, self._newlines, self._line_start
+                )
+            # discard consumed input
+            self._buffer = instring[loc:]
+            newlines = instring.count("\n", 0, loc)
+            if newlines:
+                self._newlines += newlines
+                self._line_start = self.consumed + instring.rfind("\n", 0, loc) + 1
+            self.consumed += loc
+            ParserElement.reset_cache()
+
+        if self.callback is not None:
+            for tokens in found:
+                self.callback(tokens)
+        else:
+            self._results.extend(found)
+
+        if (
+            error is None
+            and self.max_buffer is not None
+            and len(self._buffer) > self.max_buffer
+        ):
+            error = ParseException(
+                self._buffer,
+                0,
+                f"no match found in {len(self._buffer)} buffered characters",
+                expr,
+            )
+            _relocate_exception(
+                error, self._buffer, self.consumed, self._newlines, self._line_start
+            )
+        if error is not None:
+            if ParserElement.verbose_stacktrace:
+                raise error
+            raise error.with_traceback(None)
+
+        return found
+
+    def _at_buffer_end(self, instring: str, loc: int) -> bool:
+        loc = self.expr.preParse(instring, loc)
+        return _partial_word_at_end(instring, loc) is not None
+
+
 # XXX: Example needs to be re-done for updated output
 def trace_parse_action(f: ParseAction) -> ParseAction:
     """Decorator for debugging parse actions.
@@ -6822,7 +8998,7 @@ _reBracketExpr = (
 )
 
 
-def srange(s: str) -> str:
+def srange(s: Union[str, CharSet]) -> Union[str, CharSet]:
     r"""Helper to easily define string ranges for use in :class:`Word`
     construction. Borrows syntax from regexp ``'[]'`` string range
     definitions::
@@ -6847,7 +9023,16 @@ def srange(s: str) -> str:
       etc.)
     - any combination of the above (``'aeiouy'``,
       ``'a-zA-Z0-9_$'``, etc.)
+
+    If given a :class:`CharSet`, ``srange`` returns it unchanged. To create a
+    :class:`CharSet` using this range syntax, without expanding the ranges into
+    a string, use :meth:`CharSet.from_srange`.
+
+    .. versionchanged:: 3.3.3
+       Accepts a :class:`CharSet`.
     """
+    if isinstance(s, CharSet):
+        return s
 
     def _expanded(p):
         if isinstance(p, ParseResults):
@@ -6900,15 +9085,17 @@ def token_map(func, *args) -> ParseAction:
         ['Now Is The Winter Of Our Discontent Made Glorious Summer By This Sun Of York']
     """
 
-    def pa(s, l, t):
-        return [func(tokn, *args) for tokn in t]
-
+    pa = partial(_map_tokens, func, args)
     func_name = getattr(func, "__name__", getattr(func, "__class__").__name__)
-    pa.__name__ = func_name
+    pa.__name__ = func_name  # type: ignore [attr-defined]
 
     return pa
 
 
+def _map_tokens(func, args, s, l, t):
+    return [func(tokn, *args) for tokn in t]
+
+
 def autoname_elements() -> None:
     """
     Utility to simplify mass-naming of parser elements, for
@@ -6929,6 +9116,180 @@ def autoname_elements() -> None:
             var.set_name(name)
 
 
+class _ScanManyScanner:
+    # scanning state for each expression in scan_many
+    def __init__(
+        self, name: str, expr: ParserElement, always_skip_whitespace: bool
+    ) -> None:
+        self.name = name
+        self.expr = expr
+        self.parse_fn = expr._parse
+        self.loc = 0
+
+        if always_skip_whitespace:
+            preparser = Empty()
+            preparser.ignoreExprs = expr.ignoreExprs
+            preparser.whiteChars = expr.whiteChars
+        else:
+            preparser = expr
+        self.preparse_key = (
+            preparser.skipWhitespace,
+            set(preparser.whiteChars),
+            list(preparser.ignoreExprs),
+        )
+        self.preparse_group = 0
+        self.preparse_fn = preparser.preParse
+        self.skip_chars = preparser.whiteChars if preparser.skipWhitespace else ()
+
+        self.find_start, self.check_start = _start_finders(expr, preparser)
+
+
+def scan_many(
+    exprs: Mapping[str, Union[ParserElement, str]],
+    instring: str,
+    max_matches: int = _MAX_INT,
+    always_skip_whitespace: bool = True,
+) -> Generator[tuple[str, ParseResults, int, int], None, None]:
+    r"""
+    Scan the input string for matches of several expressions at once,
+    given as a mapping of names to expressions.  Yields a tuple of the
+    name of the matching expression, the matching tokens, and the start
+    and end locations for each match, in order of start location (and in
+    the order of ``exprs`` for matches at the same location).
+
+    The matches for each expression are the same as would be returned by
+    calling :class:`ParserElement.scan_string` for that expression, but the
+    input string is only scanned once: all of the expressions share the
+    skipping of whitespace and ignorable expressions at each location, and
+    an expression is only tried at locations that start with a character
+    that can begin a match of that expression (where this can be
+    determined from the expression). Expressions that do not use
+    ``ignore`` can also skip directly to their next possible match location.
+    This makes ``scan_many`` much faster than calling ``scan_string``
+    separately for each of a large number of expressions.
+
+    ``max_matches`` limits the total number of matches returned, for all
+    expressions. Tabs in ``instring`` are expanded, unless all of the
+    expressions have been set to keep tabs using
+    :class:`ParserElement.parse_with_tabs`.
+
+    Example:
+
+    .. testcode::
+
+        text = "Contact admin@example.com at 10.0.0.1 or web@example.org."
+        extractors = {
+            "email": Regex(r"[\w.]+@[\w.]+\w"),
+            "ip": pyparsing_common.ipv4_address,
+        }
+        for name, tokens, start, end in scan_many(extractors, text):
+            print(name, tokens[0], start, end)
+
+    prints:
+
+    .. testoutput::
+
+        email admin@example.com 8 25
+        ip 10.0.0.1 29 37
+        email web@example.org 41 56
+
+    .. versionadded:: 3.3.3
+    """
+
+    scanners: list[_ScanManyScanner] = []
+    for name, expr in exprs.items():
+        if isinstance(expr, str_type):
+            expr = ParserElement._literalStringClass(expr)
+        expr = typing.cast(ParserElement, expr)
+        expr.streamline()
+        for e in expr.ignoreExprs:
+            e.streamline()
+        scanners.append(_ScanManyScanner(name, expr, always_skip_whitespace))
+
+    if not all(sc.expr.keepTabs for sc in scanners):
+        instring = str(instring).expandtabs()
+    instrlen = len(instring)
+
+    # preparse results are shared by all scanners with the same whitespace
+    # and ignorables, while the scanners are at the same location; ignorables
+    # added using ignore() are copies, so are compared by value
+    preparse_keys: list[tuple] = []
+    for sc in scanners:
+        if sc.preparse_key not in preparse_keys:
+            preparse_keys.append(sc.preparse_key)
+        sc.preparse_group = preparse_keys.index(sc.preparse_key)
+    preparse_cache: dict[int, tuple[int, int]] = {}
+
+    def preparse(sc: _ScanManyScanner, loc: int) -> int:
+        cached = preparse_cache.get(sc.preparse_group)
+        if cached is not None and cached[0] == loc:
+            return cached[1]
+        preloc = sc.preparse_fn(instring, loc)
+        preparse_cache[sc.preparse_group] = (loc, preloc)
+        return preloc
+
+    def next_start(sc: _ScanManyScanner, loc: int) -> int:
+        # advance scanner to the next location to try, at or after loc;
+        # returns -1 if there are no more locations to try
+        if loc > instrlen:
+            return -1
+        if sc.find_start is not None:
+            match = sc.find_start(instring, loc)
+            if match is None:
+                return -1
+            start = match.start()
+            # scan_string would have tried (and failed) at every location before
+            # start that is not whitespace; sc.loc is only needed to compare
+            # with the end of an empty match
+            if start == loc or instring[start - 1] not in sc.skip_chars:
+                loc = start
+            sc.loc = loc
+            return start
+        sc.loc = loc
+        return preparse(sc, loc)
+
+    ParserElement.reset_cache()
+
+    # heap of (next location to try, scanner index)
+    pending: list[tuple[int, int]] = []
+    for i, sc in enumerate(scanners):
+        start = next_start(sc, 0)
+        if start >= 0:
+            pending.append((start, i))
+    heapq.heapify(pending)
+
+    matches = 0
+    try:
+        while pending and matches < max_matches:
+            preloc, i = pending[0]
+            sc = scanners[i]
+            if sc.check_start is not None and not sc.check_start(instring, preloc):
+                next_loc = -1
+            else:
+                try:
+                    next_loc, tokens = sc.parse_fn(instring, preloc, callPreParse=False)
+                except ParseException:
+                    next_loc = -1
+
+            if next_loc > sc.loc:
+                matches += 1
+                yield sc.name, tokens, preloc, next_loc
+                start = next_start(sc, next_loc)
+            else:
+                start = next_start(sc, preloc + 1)
+
+            if start >= 0:
+                heapq.heapreplace(pending, (start, i))
+            else:
+                heapq.heappop(pending)
+    except ParseBaseException as exc:
+        if ParserElement.verbose_stacktrace:
+            raise
+
+        # catch and re-raise exception from here, clears out pyparsing internal stack trace
+        raise exc.with_traceback(None)
+
+
 dbl_quoted_string = (
     Regex(r'"(?:[^"\n\r\\]|(?:"")|(?:\\(?:[^x]|x[0-9a-fA-F]+)))*"')
 ).set_name("string enclosed in double quotes")
@@ -6975,6 +9336,42 @@ _builtin_exprs: list[ParserElement] = [
     v for v in vars().values() if isinstance(v, ParserElement)
 ]
 
+# default whitespace characters when pyparsing is imported
+_import_white_chars = ParserElement.DEFAULT_WHITE_CHARS
+
+
+def _build_builtin_exprs(build: Callable[[], Any]) -> Any:
+    # call build() to create built-in expressions that are only built on
+    # first access, and register them with the other built-in expressions;
+    # build() must use explicit Literals instead of inline strings. If the
+    # default whitespace characters have been changed, the elements that
+    # copied them are reset to the defaults from import time, as if they had
+    # been built then, and the returned expressions get the current default,
+    # as set_default_whitespace_chars does for the other built-in expressions.
+    built = build()
+    exprs = list(built) if isinstance(built, tuple) else [built]
+
+    current_white_chars = ParserElement.DEFAULT_WHITE_CHARS
+    if set(current_white_chars) != set(_import_white_chars):
+        # other built-in expressions keep their own whitespace
+        seen = {id(e) for e in _builtin_exprs}
+        stack = exprs[:]
+        while stack:
+            e = stack.pop()
+            if id(e) in seen:
+                continue
+            seen.add(id(e))
+            if e.copyDefaultWhiteChars:
+                e.whiteChars = set(_import_white_chars)
+            stack.extend(e.recurse())
+            stack.extend(e.ignoreExprs)
+        for expr in exprs:
+            if expr.copyDefaultWhiteChars:
+                expr.whiteChars = set(current_white_chars)
+
+    _builtin_exprs.extend(exprs)
+    return built
+
 # Compatibility synonyms
 # fmt: off
 sglQuotedString = sgl_quoted_string
@@ -11,7 +11,6 @@ from functools import cached_property
 from .warnings import PyparsingDeprecationWarning
 from .unicode import pyparsing_unicode as ppu
 from .util import (
-    _collapse_string_to_ranges,
     col,
     deprecate_argument,
     line,
@@ -26,8 +25,8 @@ class _ExceptionWordUnicodeSet(
     pass
 
 
-_extract_alphanums = _collapse_string_to_ranges(_ExceptionWordUnicodeSet.alphanums)
-_exception_word_extractor = re.compile(rf"([{_extract_alphanums}]{{1,16}})|.")
+_extract_alphanums = _ExceptionWordUnicodeSet.alphanums_charset.regex_class()
+_exception_word_extractor = re.compile(rf"({_extract_alphanums}{{1,16}})|.")
 
 
 class ParseBaseException(Exception):
@@ -83,14 +82,14 @@ class ParseBaseException(Exception):
         exception's stack trace.
         """
         import inspect
-        from .core import ParserElement
+        from .core import ParserElement, _ConditionParseAction, _TrimArityWrapper
 
         if depth is None:
             depth = sys.getrecursionlimit()
         ret: list[str] = []
         if isinstance(exc, ParseBaseException):
             ret.append(exc.line)
-            ret.append(f"{'^':>{exc.column}}")
+            ret.append(f"{'^':>{exc._line_column}}")
         ret.append(f"{type(exc).__name__}: {exc}")
 
         if depth <= 0 or exc.__traceback__ is None:
@@ -112,6 +111,10 @@ class ParseBaseException(Exception):
                 self_type = type(f_self)
                 ret.append(f"{self_type.__module__}.{self_type.__name__} - {f_self}")
 
+            elif isinstance(f_self, (_TrimArityWrapper, _ConditionParseAction)):
+                # internal wrappers for calling parse actions and conditions
+                continue
+
             elif f_self is not None:
                 self_type = type(f_self)
                 ret.append(f"{self_type.__module__}.{self_type.__name__}")
@@ -165,6 +168,13 @@ class ParseBaseException(Exception):
         """
         return col(self.loc, self.pstr)
 
+    @cached_property
+    def _line_column(self) -> int:
+        # 1-based position of the exception location in line; differs from
+        # column for exceptions raised by IncrementalParser, if the start of
+        # the line has been discarded
+        return self.column
+
     @cached_property
     def found(self) -> str:
         if not self.pstr:
@@ -241,7 +251,7 @@ class ParseBaseException(Exception):
 
         markerString = marker_string if marker_string is not None else markerString
         line_str = self.line
-        line_column = self.column - 1
+        line_column = self._line_column - 1
         if markerString:
             line_str = f"{line_str[:line_column]}{markerString}{line_str[line_column:]}"
         return line_str.strip()
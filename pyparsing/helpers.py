@@ -1,12 +1,19 @@
 # helpers.py
 import html.entities
+import itertools
 import operator
 import re
 import sys
 import typing
+from functools import partial
+from threading import RLock
 
 from . import __diag__
 from .core import *
+from .core import _build_builtin_exprs
+from .core import _trim_arity, _plain_token_re, _skipped_white_pattern
+from .actions import _verify_attributes
+from .results import _ParseResultsWithOffset
 from .util import (
     _bslash,
     _flatten,
@@ -23,6 +30,54 @@ def _suppression(expr: Union[ParserElement, str]) -> ParserElement:
     return Suppress(expr)
 
 
+# parse actions used by the helper methods are defined at module level
+# (rather than as lambdas or closures), so that the expressions returned
+# by the helpers can be pickled
+
+
+def _define_counted_array(expr, array_expr, s, l, t):
+    n = t[0]
+    array_expr <<= (expr * n) if n else Empty()
+    # clear list contents, but keep any named results
+    del t[:]
+
+
+def _map_caseless_symbol(symbol_map, s, l, t):
+    return symbol_map[t[0].lower()]
+
+
+def _current_loc(s, l, t):
+    return l
+
+
+def _original_text(s, l, t):
+    return s[t._original_start : t._original_end]
+
+
+def _replace_with_original_text(s, l, t):
+    t[:] = [s[t.pop("_original_start") : t.pop("_original_end")]]
+
+
+def _first_token(t):
+    return t[0]
+
+
+def _lowercase_first_token(t):
+    return t[0].lower()
+
+
+def _strip_default_whitespace(t):
+    return t[0].strip(ParserElement.DEFAULT_WHITE_CHARS)
+
+
+def _is_empty_tag(s, l, t):
+    return t[0] == "/"
+
+
+def _add_start_tag_name(start_name, t):
+    t[start_name] = t.copy()
+
+
 #
 # global helpers
 #
@@ -82,19 +137,14 @@ def counted_array(
     intExpr = intExpr or int_expr
     array_expr = Forward()
 
-    def count_field_parse_action(s, l, t):
-        nonlocal array_expr
-        n = t[0]
-        array_expr <<= (expr * n) if n else Empty()
-        # clear list contents, but keep any named results
-        del t[:]
-
     if intExpr is None:
-        intExpr = Word(nums).set_parse_action(lambda t: int(t[0]))
+        intExpr = Word(nums).set_parse_action(token_map(int))
     else:
         intExpr = intExpr.copy()
     intExpr.set_name("arrayLen")
-    intExpr.add_parse_action(count_field_parse_action, call_during_try=True)
+    intExpr.add_parse_action(
+        partial(_define_counted_array, expr, array_expr), call_during_try=True
+    )
     return (intExpr + array_expr).set_name(f"(len) {expr}...")
 
 
@@ -116,21 +166,9 @@ def match_previous_literal(expr: ParserElement) -> ParserElement:
     enabled.
     """
     rep = Forward()
-
-    def copy_token_to_repeater(s, l, t):
-        if not t:
-            rep << Empty()
-            return
-
-        if len(t) == 1:
-            rep << t[0]
-            return
-
-        # flatten t tokens
-        tflat = _flatten(t.as_list())
-        rep << And(Literal(tt) for tt in tflat)
-
-    expr.add_parse_action(copy_token_to_repeater, call_during_try=True)
+    expr.add_parse_action(
+        partial(_copy_literal_to_repeater, rep), call_during_try=True
+    )
     rep.set_name(f"(prev) {expr}")
     return rep
 
@@ -167,44 +205,63 @@ def match_previous_expr(expr: ParserElement) -> ParserElement:
     e2 = expr.copy()
     rep <<= e2
 
-    # stack of (location, tokens) for matches of expr not yet paired with a
-    # match of rep, innermost last
-    match_stack: list[tuple[int, list]] = []
-    last_match: typing.Optional[tuple[int, list]] = None
+    matcher = _PreviousExprMatcher()
+    e2.add_parse_action(matcher.must_match_these_tokens, call_during_try=True)
+    expr.add_parse_action(matcher.copy_token_to_repeater, call_during_try=True)
+    rep.set_name(f"(prev) {expr}")
+    return rep
+
+
+def _copy_literal_to_repeater(rep, s, l, t):
+    if not t:
+        rep << Empty()
+        return
+
+    if len(t) == 1:
+        rep << t[0]
+        return
+
+    # flatten t tokens
+    tflat = _flatten(t.as_list())
+    rep << And(Literal(tt) for tt in tflat)
+
 
-    def copy_token_to_repeater(s, l, t):
-        nonlocal last_match
+class _PreviousExprMatcher:
+    # parse actions shared by the expression and repeater returned by
+    # match_previous_expr, implemented as methods so that they can be pickled
+
+    def __init__(self) -> None:
+        # stack of (location, tokens) for matches of expr not yet paired with a
+        # match of rep, innermost last
+        self.match_stack: list[tuple[int, list]] = []
+        self.last_match: typing.Optional[tuple[int, list]] = None
+
+    def copy_token_to_repeater(self, s, l, t):
+        match_stack = self.match_stack
 
         # entries at or after this location belong to a branch that was
         # abandoned on backtracking, and can never be paired
         while match_stack and match_stack[-1][0] >= l:
             match_stack.pop()
         match_stack.append((l, _flatten(t.as_list())))
-        last_match = None
-
-    def must_match_these_tokens(s, l, t):
-        nonlocal last_match
+        self.last_match = None
 
+    def must_match_these_tokens(self, s, l, t):
         these_tokens = _flatten(t.as_list())
 
         # a memoizing parser may run this action more than once for the
         # same match, which must not consume a second stack entry
-        if last_match == (l, these_tokens):
+        if self.last_match == (l, these_tokens):
             return
 
-        if not match_stack:
+        if not self.match_stack:
             raise ParseException(s, l, "no previous expression to match")
 
-        match_tokens = match_stack[-1][1]
+        match_tokens = self.match_stack[-1][1]
         if these_tokens != match_tokens:
             raise ParseException(s, l, f"Expected {match_tokens}, found{these_tokens}")
-        match_stack.pop()
-        last_match = (l, these_tokens)
-
-    e2.add_parse_action(must_match_these_tokens, call_during_try=True)
-    expr.add_parse_action(copy_token_to_repeater, call_during_try=True)
-    rep.set_name(f"(prev) {expr}")
-    return rep
+        self.match_stack.pop()
+        self.last_match = (l, these_tokens)
 
 
 def one_of(
@@ -212,6 +269,7 @@ def one_of(
     caseless: bool = False,
     use_regex: bool = True,
     as_keyword: bool = False,
+    engine: str = "regex",
     **kwargs,
 ) -> ParserElement:
     """Helper to quickly define a set of alternative :class:`Literal` s,
@@ -228,6 +286,10 @@ def one_of(
        ``as_keyword=True``, or if creating a :class:`Regex` raises an exception)
     :param as_keyword: bool - enforce :class:`Keyword`-style matching on the
        generated expressions
+    :param engine: str - ``"regex"`` (the default) to generate a :class:`Regex`
+       or :class:`MatchFirst` as described for ``use_regex``, or ``"trie"`` to
+       generate a :class:`LiteralSet`, which matches in time independent of the
+       number of literals; use ``"trie"`` for large vocabularies
 
     Parameters ``asKeyword`` and ``useRegex`` are retained for pre-PEP8
     compatibility, but will be removed in a future release.
@@ -248,6 +310,9 @@ def one_of(
     .. testoutput::
 
        [['B', '=', '12'], ['AA', '=', '23'], ['B', '<=', 'AA'], ['AA', '>', '12']]
+
+    .. versionchanged:: 3.3.3
+       Added ``engine`` argument.
     """
     useRegex: bool = deprecate_argument(kwargs, "useRegex", True)
     asKeyword: bool = deprecate_argument(kwargs, "asKeyword", False)
@@ -285,6 +350,12 @@ def one_of(
     if not symbols:
         return NoMatch()
 
+    if engine == "trie":
+        # LiteralSet always does longest matching, so no reordering is needed
+        return LiteralSet(symbols, caseless=caseless, as_keyword=asKeyword)
+    if engine != "regex":
+        raise ValueError(f"invalid engine {engine!r}, must be 'regex' or 'trie'")
+
     # reorder given symbols to take care to avoid masking longer choices with shorter ones
     # (but only if the given symbols are not just single characters)
     i = 0
@@ -322,7 +393,7 @@ def one_of(
                 # add parse action to return symbols as specified, not in random
                 # casing as found in input string
                 symbol_map = {sym.lower(): sym for sym in symbols}
-                ret.add_parse_action(lambda s, l, t: symbol_map[t[0].lower()])
+                ret.add_parse_action(partial(_map_caseless_symbol, symbol_map))
 
             return ret
 
@@ -446,18 +517,14 @@ def original_text_for(
 
     asString = asString and as_string
 
-    locMarker = Empty().set_parse_action(lambda s, loc, t: loc)
+    locMarker = Empty().set_parse_action(_current_loc)
     endlocMarker = locMarker.copy()
     endlocMarker.callPreparse = False
     matchExpr = locMarker("_original_start") + expr + endlocMarker("_original_end")
     if asString:
-        extractText = lambda s, l, t: s[t._original_start : t._original_end]
+        matchExpr.set_parse_action(_original_text)
     else:
-
-        def extractText(s, l, t):
-            t[:] = [s[t.pop("_original_start") : t.pop("_original_end")]]
-
-    matchExpr.set_parse_action(extractText)
+        matchExpr.set_parse_action(_replace_with_original_text)
     matchExpr.ignoreExprs = expr.ignoreExprs
     matchExpr.suppress_warning(Diagnostics.warn_ungrouped_named_tokens_in_collection)
     return matchExpr
@@ -467,7 +534,7 @@ def ungroup(expr: ParserElement) -> ParserElement:
     """Helper to undo pyparsing's default grouping of And expressions,
     even if all but one are non-empty.
     """
-    return TokenConverter(expr).add_parse_action(lambda t: t[0])
+    return TokenConverter(expr).add_parse_action(_first_token)
 
 
 def locatedExpr(expr: ParserElement) -> ParserElement:
@@ -494,7 +561,7 @@ def locatedExpr(expr: ParserElement) -> ParserElement:
         stacklevel=2,
     )
 
-    locator = Empty().set_parse_action(lambda ss, ll, tt: ll)
+    locator = Empty().set_parse_action(_current_loc)
     return Group(
         locator("locn_start")
         + expr("value")
@@ -543,6 +610,10 @@ def nested_expr(
     :class:`quoted_string`, but if no expressions are to be ignored, then
     pass ``None`` for this argument.
 
+    If no ``content`` expression is needed, :class:`NestedBlock` matches
+    the same nested lists much faster, and can also return just the
+    matched text of the block.
+
     Example:
 
     .. testcode::
@@ -646,9 +717,7 @@ def nested_expr(
 
         # for these internally-created context expressions, simulate whitespace-skipping
         if ParserElement.DEFAULT_WHITE_CHARS:
-            content.set_parse_action(
-                lambda t: t[0].strip(ParserElement.DEFAULT_WHITE_CHARS)
-            )
+            content.set_parse_action(_strip_default_whitespace)
 
     ret = Forward()
     if ignoreExpr is not None:
@@ -669,30 +738,365 @@ def nested_expr(
     return ret
 
 
+class NestedBlock(Token):
+    """Token for matching a block of text enclosed in opening and closing
+    delimiters, which may be nested. Matches the same text and returns
+    the same nested lists of whitespace-delimited values as
+    :class:`nested_expr` with no ``content`` expression, but scans the
+    block in a single pass instead of matching its contents one character
+    at a time, and without recursion, so is much faster for skipping
+    over large or deeply nested blocks.
+
+    :param opener: str - opening string for a nested block
+       (default= ``"("``)
+
+    :param closer: str - closing string for a nested block
+       (default= ``")"``)
+
+    :param ignore_expr: expression for ignoring opening and closing delimiters
+       (default = :class:`quoted_string`); pass ``None`` if no expressions
+       are to be ignored
+
+    :param as_string: if ``True``, return the matched block, including
+       the opening and closing delimiters, as a single string instead of as
+       nested lists (default= ``False``)
+
+    Example:
+
+    .. testcode::
+
+       code_body = NestedBlock('{', '}', ignore_expr=(quoted_string | c_style_comment))
+       source_code = '''{
+           if (c == '}') { /* closing brace } */ return 1; }
+       }'''
+       print(code_body.parse_string(source_code))
+
+       code_body = NestedBlock(
+           '{', '}', ignore_expr=(quoted_string | c_style_comment), as_string=True
+       )
+       c_function = Word(alphas) + Word(alphas) + "()" + code_body("body")
+       print(c_function.parse_string("int main() { return f({1, 2}); }").body)
+
+    prints:
+
+    .. testoutput::
+
+       [['if', '(c', '==', "'}'", ')', ['/* closing brace } */', 'return', '1;']]]
+       { return f({1, 2}); }
+
+    .. versionadded:: 3.3.3
+    """
+
+    def __init__(
+        self,
+        opener: str = "(",
+        closer: str = ")",
+        ignore_expr: typing.Optional[ParserElement] = _NO_IGNORE_EXPR_GIVEN,
+        *,
+        as_string: bool = False,
+    ) -> None:
+        super().__init__()
+        if not (isinstance(opener, str_type) and isinstance(closer, str_type)):
+            raise ValueError("opening and closing arguments must be strings")
+        if not (opener and closer):
+            raise ValueError("opening and closing strings cannot be empty")
+        if opener == closer:
+            raise ValueError("opening and closing strings cannot be the same")
+        if ignore_expr is _NO_IGNORE_EXPR_GIVEN:
+            ignore_expr = quoted_string()
+
+        self.opener = opener
+        self.closer = closer
+        self.ignore_expr = ignore_expr
+        self.as_string = as_string
+        self.mayReturnEmpty = False
+        self.mayIndexError = False
+        self.saveAsList = not as_string
+        self.errmsg = f"Expected {self.name}"
+        self._scan_res: typing.Optional[tuple] = None
+
+    def _generateDefaultName(self) -> str:
+        return f"nested {self.opener}{self.closer} expression"
+
+    def _first_chars(self, visited=None) -> typing.Optional[CharSet]:
+        return CharSet(self.opener[0])
+
+    def _make_scan_res(self) -> tuple:
+        # Build the regexes used to jump over characters that cannot end a
+        # content value or start an ignored expression, opener, or closer.
+        # The ignore expression is only tried at locations that are not
+        # whitespace, so its leading whitespace characters are not included.
+        white = CharSet(self.whiteChars)
+        special = white | self.opener[0] | self.closer[0]
+        ignore_chars: typing.Optional[CharSet] = None
+        if self.ignore_expr is not None:
+            lead_chars = self.ignore_expr._lead_chars()
+            if lead_chars is not None:
+                ignore_chars = lead_chars - white
+                special |= ignore_chars
+
+        def skip_re(stop_chars: typing.Optional[CharSet]) -> re.Pattern:
+            # regex to skip up to the next character in stop_chars, where
+            # None means that any character might need to be checked
+            if stop_chars is None:
+                return re.compile("")
+            if not stop_chars:
+                return re.compile(".*", re.DOTALL)
+            return re.compile(f"[^{stop_chars._collapsed_ranges()}]*")
+
+        skip_white = re.compile(f"{white.regex_class()}*" if white else "")
+        if self.ignore_expr is not None and ignore_chars is None:
+            skip_content = skip_re(None)
+        else:
+            skip_content = skip_re(special)
+            if self.as_string:
+                # content values are not needed, so just skip over them
+                # along with the whitespace
+                skip_white = skip_re(special - white)
+        return skip_white, skip_content, ignore_chars
+
+    def parseImpl(self, instring, loc, do_actions=True):
+        opener = self.opener
+        closer = self.closer
+        if not instring.startswith(opener, loc):
+            raise ParseException(instring, loc, self.errmsg, self)
+
+        if self._scan_res is None:
+            self._scan_res = self._make_scan_res()
+        skip_white, skip_content, ignore_chars = self._scan_res
+        ignore_expr = self.ignore_expr
+        as_string = self.as_string
+        white = self.whiteChars
+        instrlen = len(instring)
+
+        # stack of the token lists of the enclosing blocks
+        stack: list[typing.Optional[ParseResults]] = []
+        tokens = None if as_string else ParseResults([])
+        cur = loc + len(opener)
+        while True:
+            cur = skip_white.match(instring, cur).end()
+            if cur >= instrlen:
+                raise ParseException(instring, loc, self.errmsg, self)
+
+            if ignore_expr is not None and (
+                ignore_chars is None or instring[cur] in ignore_chars
+            ):
+                try:
+                    ignore_loc, ignored = ignore_expr._parse(
+                        instring, cur, do_actions
+                    )
+                except (ParseException, IndexError):
+                    pass
+                else:
+                    if ignore_loc > cur:
+                        if tokens is not None:
+                            tokens += ignored
+                        cur = ignore_loc
+                        continue
+
+            if instring.startswith(opener, cur):
+                stack.append(tokens)
+                tokens = None if as_string else ParseResults([])
+                cur += len(opener)
+                continue
+
+            if instring.startswith(closer, cur):
+                cur += len(closer)
+                if not stack:
+                    break
+                block, tokens = tokens, stack.pop()
+                if tokens is not None:
+                    tokens.append(block)
+                continue
+
+            # content value - runs up to the next whitespace, opener, closer,
+            # or ignored expression
+            content_start = cur
+            cur += 1
+            while True:
+                cur = skip_content.match(instring, cur).end()
+                if (
+                    cur >= instrlen
+                    or instring[cur] in white
+                    or instring.startswith(opener, cur)
+                    or instring.startswith(closer, cur)
+                ):
+                    break
+                if ignore_expr is not None and (
+                    ignore_chars is None or instring[cur] in ignore_chars
+                ):
+                    try:
+                        ignore_loc = ignore_expr.try_parse(
+                            instring, cur, do_actions=do_actions
+                        )
+                    except (ParseException, IndexError):
+                        pass
+                    else:
+                        if ignore_loc > cur:
+                            break
+                cur += 1
+            if tokens is not None:
+                tokens.append(instring[content_start:cur])
+
+        if as_string:
+            return cur, instring[loc:cur]
+        return cur, [tokens]
+
+
+class _OpenTag(ParseElementEnhance):
+    """
+    Opening tag expression created by :class:`make_html_tags` and
+    :class:`make_xml_tags`. Matches the same tags as the tag grammar
+    it contains, but if possible locates and matches a tag with a single
+    compiled regex, and builds the attribute results directly from the
+    regex match.
+    """
+
+    def __init__(
+        self,
+        expr: ParserElement,
+        tag_re: typing.Optional[re.Pattern],
+        attr_re: typing.Optional[re.Pattern],
+        tag_keyword: typing.Optional[Keyword],
+        xml: bool,
+    ) -> None:
+        super().__init__(expr)
+        # tag_re and attr_re are only valid for the original tag grammar
+        self._tag_grammar = expr
+        self._tag_re = tag_re
+        self._attr_re = attr_re
+        self._tag_keyword = tag_keyword
+        self._xml = xml
+
+    def _can_match_re(self) -> bool:
+        return (
+            self._tag_re is not None
+            and self.expr is self._tag_grammar
+            and not self.ignoreExprs
+        )
+
+    def _first_chars(self, visited=None) -> typing.Optional[CharSet]:
+        return self.expr._first_chars(visited)
+
+    def _start_regex(self, skip_chars: frozenset[str]) -> typing.Optional[re.Pattern]:
+        return self._tag_re if self._can_match_re() else None
+
+    def parseImpl(self, instring, loc, do_actions=True) -> ParseImplReturnType:
+        match = self._can_match_re() and self._tag_re.match(instring, loc)
+        if not match:
+            # parse with the tag grammar, which also raises the same exception
+            # as when it is used by itself
+            return self.expr._parse(instring, loc, do_actions, callPreParse=False)
+
+        tag = match["tag"]
+        if self._tag_keyword is not None:
+            # the regex matches the tag name ignoring case, and does not check
+            # for a keyword boundary, so the keyword must confirm the match
+            try:
+                tag = self._tag_keyword.parseImpl(instring, match.start("tag"))[1]
+            except (ParseException, IndexError):
+                return self.expr._parse(
+                    instring, loc, do_actions, callPreParse=False
+                )
+
+        tokens: list = [tag]
+        attrs: list[tuple[str, str]] = []
+        for attr in self._attr_re.finditer(
+            instring, match.start("attrs"), match.end("attrs")
+        ):
+            name = attr["name"] if self._xml else attr["name"].lower()
+            if attr.lastgroup == "quoted":
+                value = attr["quoted"][1:-1]
+                tokens.append(ParseResults([name, value]))
+            elif attr.lastgroup == "value":
+                value = attr["value"]
+                tokens.append(ParseResults([name, value]))
+            else:
+                # attribute without a value
+                value = ""
+                tokens.append(ParseResults([name]))
+            attrs.append((name, value))
+
+        if (
+            (do_actions or self.callDuringTry)
+            and not self.debug
+            and self.failAction is None
+        ):
+            self._check_attributes(instring, loc, dict(attrs))
+
+        tokens.append(match["empty"] is not None)
+        ret = ParseResults(tokens)
+        ret["tag"] = _ParseResultsWithOffset(tag, 0)
+        for i, (name, value) in enumerate(attrs, start=1):
+            ret[name] = _ParseResultsWithOffset(value, i)
+        ret["empty"] = _ParseResultsWithOffset(tokens[-1], len(tokens) - 1)
+        return match.end(), ret
+
+    def _check_attributes(self, instring, loc, attrs: dict[str, str]) -> None:
+        # run the checks of the leading with_attribute or with_class parse
+        # actions on the attribute values, before creating the tag's
+        # ParseResults; checks stop at the first attribute name that is also
+        # a results name, which only the parse action can check
+        result_names = {"tag", "empty", self.resultsName}
+        for fn in self.parseAction:
+            fn = getattr(fn, "func", fn)
+            if not isinstance(fn, partial):
+                return
+            if fn.func is _add_start_tag_name:
+                result_names.add(fn.args[0])
+            elif fn.func is _verify_attributes:
+                attrs_list = list(
+                    itertools.takewhile(
+                        lambda attr: attr[0] not in result_names, fn.args[0]
+                    )
+                )
+                _verify_attributes(attrs_list, instring, loc, attrs)
+                if len(attrs_list) < len(fn.args[0]):
+                    return
+            else:
+                return
+
+
 def _makeTags(tagStr, xml, suppress_LT=Suppress("<"), suppress_GT=Suppress(">")):
     """Internal helper to construct opening and closing tag expressions,
     given a tag name"""
     if isinstance(tagStr, str_type):
         resname = tagStr
-        tagStr = Keyword(tagStr, caseless=not xml)
+        tagStr = tag_keyword = Keyword(tagStr, caseless=not xml)
+        # the regex matches the tag name ignoring case, and the keyword then
+        # checks the match
+        tag_pattern = re.escape(resname) if resname.isascii() else None
+        if tag_pattern and not xml:
+            tag_pattern = f"(?i:{tag_pattern})"
     else:
         resname = tagStr.name
+        tag_keyword = None
+        tag_re = _plain_token_re(tagStr)
+        tag_pattern = tag_re.pattern if tag_re and not tag_re.groups else None
 
     tagAttrName = Word(alphas, alphanums + "_-:")
+    tagAttrEquals = Suppress("=")
+    emptyTag = Opt(Literal("/"), default=[False])
+    name_pattern = _plain_token_re(tagAttrName).pattern
     if xml:
         tagAttrValue = dbl_quoted_string.copy().set_parse_action(remove_quotes)
+        value_pattern = f"(?P<quoted>{dbl_quoted_string.re.pattern})"
         openTag = (
             suppress_LT
             + tagStr("tag")
-            + Dict(ZeroOrMore(Group(tagAttrName + Suppress("=") + tagAttrValue)))
-            + Opt("/", default=[False])("empty").set_parse_action(
-                lambda s, l, t: t[0] == "/"
-            )
+            + Dict(ZeroOrMore(Group(tagAttrName + tagAttrEquals + tagAttrValue)))
+            + emptyTag("empty").set_parse_action(_is_empty_tag)
             + suppress_GT
         )
     else:
-        tagAttrValue = quoted_string.copy().set_parse_action(remove_quotes) | Word(
-            printables, exclude_chars=">"
+        unquotedAttrValue = Word(printables, exclude_chars=">")
+        tagAttrValue = (
+            quoted_string.copy().set_parse_action(remove_quotes) | unquotedAttrValue
+        )
+        value_pattern = (
+            f"(?P<quoted>{dbl_quoted_string.re.pattern}"
+            f"|{sgl_quoted_string.re.pattern})"
+            f"|(?P<value>{_plain_token_re(unquotedAttrValue).pattern})"
         )
         openTag = (
             suppress_LT
@@ -700,23 +1104,57 @@ def _makeTags(tagStr, xml, suppress_LT=Suppress("<"), suppress_GT=Suppress(">"))
             + Dict(
                 ZeroOrMore(
                     Group(
-                        tagAttrName.set_parse_action(lambda t: t[0].lower())
-                        + Opt(Suppress("=") + tagAttrValue)
+                        tagAttrName.set_parse_action(_lowercase_first_token)
+                        + Opt(tagAttrEquals + tagAttrValue)
                     )
                 )
             )
-            + Opt("/", default=[False])("empty").set_parse_action(
-                lambda s, l, t: t[0] == "/"
-            )
+            + emptyTag("empty").set_parse_action(_is_empty_tag)
             + suppress_GT
         )
-    closeTag = Combine(Literal("</") + tagStr + ">", adjacent=False)
+    closeTag = Combine(Literal("</") + tagStr + Literal(">"), adjacent=False)
+
+    # build regexes for the opening tag and its attributes, which can only
+    # be used if all the elements of the tag grammar skip the same whitespace
+    tag_re = attr_re = None
+    white_patterns = {
+        _skipped_white_pattern(e)
+        for e in (
+            tagStr,
+            tagAttrName,
+            tagAttrEquals,
+            tagAttrValue,
+            *getattr(tagAttrValue, "exprs", ()),
+            emptyTag,
+            emptyTag.expr,
+            suppress_GT,
+        )
+    }
+    if tag_pattern is not None and len(white_patterns) == 1:
+        ws = white_patterns.pop()
+        if xml:
+            attr_pattern = f"{ws}(?P<name>{name_pattern}){ws}={ws}{value_pattern}"
+        else:
+            attr_pattern = (
+                f"{ws}(?P<name>{name_pattern})(?:{ws}={ws}(?:{value_pattern}))?"
+            )
+        # the grammar does not backtrack into the tag name or the attributes
+        # once they are matched, so match them atomically, using a lookahead
+        # and backreference
+        tag_re = re.compile(
+            f"<{ws}(?=(?P<tag>{tag_pattern}))(?P=tag)"
+            f"(?=(?P<attrs>(?:{attr_pattern})*))(?P=attrs)"
+            f"{ws}(?P<empty>/)?{ws}>"
+        )
+        attr_re = re.compile(attr_pattern)
 
+    openTag = _OpenTag(openTag, tag_re, attr_re, tag_keyword, xml)
     openTag.set_name(f"<{resname}>")
     # add start<tagname> results name in parse action now that ungrouped names are not reported at two levels
     openTag.add_parse_action(
-        lambda t: t.__setitem__(
-            "start" + "".join(resname.replace(":", " ").title().split()), t.copy()
+        partial(
+            _add_start_tag_name,
+            "start" + "".join(resname.replace(":", " ").title().split()),
         )
     )
     closeTag = closeTag(
@@ -755,6 +1193,12 @@ def make_html_tags(
     .. testoutput::
 
        pyparsing -> https://github.com/pyparsing/pyparsing/wiki
+
+    .. versionchanged:: 3.3.3
+       The opening tag expression matches tags using a single compiled
+       regex, and checks the attributes required by any leading
+       :class:`with_attribute` or :class:`with_class` parse actions before
+       creating the tag's results.
     """
     return _makeTags(tag_str, False)
 
@@ -766,15 +1210,30 @@ def make_xml_tags(
     given a tag name. Matches tags only in the given upper/lower case.
 
     Example: similar to :class:`make_html_tags`
+
+    .. versionchanged:: 3.3.3
+       See :class:`make_html_tags`.
     """
     return _makeTags(tag_str, True)
 
 
 any_open_tag: ParserElement
 any_close_tag: ParserElement
-any_open_tag, any_close_tag = make_html_tags(
-    Word(alphas, alphanums + "_:").set_name("any tag")
-)
+
+
+def _make_any_tags() -> None:
+    # any_open_tag and any_close_tag are built on first access (see __getattr__
+    # at the end of this module), instead of when pyparsing is imported
+    open_tag, close_tag = _build_builtin_exprs(
+        lambda: make_html_tags(Word(alphas, alphanums + "_:").set_name("any tag"))
+    )
+    globals().update(
+        any_open_tag=open_tag,
+        any_close_tag=close_tag,
+        anyOpenTag=open_tag,
+        anyCloseTag=close_tag,
+    )
+
 
 _htmlEntityMap = {k.rstrip(";"): v for k, v in html.entities.html5.items()}
 _most_common_entities = "nbsp lt gt amp quot apos cent pound euro copy".replace(
@@ -790,6 +1249,16 @@ def replace_html_entity(s, l, t):
     return _htmlEntityMap.get(t.entity)
 
 
+class _FB(FollowedBy):
+    # lookahead used by infix_notation, that only checks for a match
+    def parseImpl(self, instring, loc, doActions=True):
+        self.expr.try_parse(instring, loc)
+        return loc, []
+
+
+_FB.__name__ = "FollowedBy>"
+
+
 class OpAssoc(Enum):
     """Enumeration of operator associativity
     - used in constructing InfixNotationOperatorSpec for :class:`infix_notation`"""
@@ -816,11 +1285,288 @@ InfixNotationOperatorSpec = Union[
 ]
 
 
+def _infix_notation_levels(
+    op_list: list[InfixNotationOperatorSpec],
+) -> typing.Iterator[
+    tuple[typing.Any, int, OpAssoc, typing.Optional[ParseAction], str]
+]:
+    # validate the operator definitions passed to infix_notation, and yield
+    # (op_expr, arity, assoc, parse_action, term_name) for each of them
+    arity: int
+    rightLeftAssoc: OpAssoc
+    pa: typing.Optional[ParseAction]
+    for operDef in op_list:
+        opExpr, arity, rightLeftAssoc, pa = (operDef + (None,))[:4]  # type: ignore[assignment]
+        if isinstance(opExpr, str_type):
+            opExpr = ParserElement._literalStringClass(opExpr)
+        if arity == 3:
+            if not isinstance(opExpr, (tuple, list)) or len(opExpr) != 2:
+                raise ValueError(
+                    "if numterms=3, opExpr must be a tuple or list of two expressions"
+                )
+            opExpr1, opExpr2 = opExpr
+            term_name = f"{opExpr1}{opExpr2} operations"
+        else:
+            term_name = f"{opExpr} operations"
+
+        if not 1 <= arity <= 3:
+            raise ValueError("operator must be unary (1), binary (2), or ternary (3)")
+
+        if rightLeftAssoc not in (OpAssoc.LEFT, OpAssoc.RIGHT):
+            raise ValueError("operator must indicate right or left associativity")
+
+        yield opExpr, arity, rightLeftAssoc, pa, term_name
+
+
+class OperatorPrecedence(ParseElementEnhance):
+    """
+    Expression of operators working in a precedence hierarchy, as defined
+    for :class:`infix_notation`, that parses the operators and operands in a
+    single left-to-right pass.
+
+    ``infix_notation`` builds a separate expression for each precedence level,
+    each using a lookahead to check for a complete operation before parsing it
+    again, so that operands can be reparsed many times over when there are
+    many precedence levels or deeply nested expressions (unless packrat
+    parsing is enabled). ``OperatorPrecedence`` parses each operand and operator
+    only once, in time linear in the length of the expression, and returns
+    the same grouped results, calling the same parse actions for each level.
+    Syntax errors are reported at the same locations, with the same
+    ``"Expected <operators> operations"`` messages for each level.
+
+    ``OperatorPrecedence`` is usually created by calling ``infix_notation``
+    with ``engine="pratt"``.
+
+    :param operand: expression for the operands; unlike the ``base_expr``
+       passed to ``infix_notation``, this must include any parenthesized
+       nested expressions
+    :param op_list: list of operator precedence levels, in the same form
+       as for ``infix_notation``
+
+    Example:
+
+    .. testcode::
+
+       arith_expr = infix_notation(
+           pyparsing_common.integer,
+           [
+               ('-', 1, OpAssoc.RIGHT),
+               (one_of('* /'), 2, OpAssoc.LEFT),
+               (one_of('+ -'), 2, OpAssoc.LEFT),
+           ],
+           engine="pratt",
+       )
+       print(arith_expr.parse_string("-2 + 3 * (4 - 5) - 6"))
+
+    prints:
+
+    .. testoutput::
+
+       [[['-', 2], '+', [3, '*', [4, '-', 5]], '-', 6]]
+
+    .. versionadded:: 3.3.3
+    """
+
+    def __init__(
+        self,
+        operand: Union[ParserElement, str],
+        op_list: list[InfixNotationOperatorSpec],
+    ) -> None:
+        super().__init__(operand)
+        self.operators: list[ParserElement] = []
+        # each level is (arity, assoc, indexes of its operators in self.operators,
+        # or () if the operands are just juxtaposed, parse actions, error message)
+        self._levels: list[tuple[int, OpAssoc, tuple[int, ...], list, str]] = []
+        for opExpr, arity, assoc, pa, term_name in _infix_notation_levels(op_list):
+            if opExpr is None:
+                ops = []
+            elif arity == 3:
+                ops = [
+                    self._literalStringClass(e) if isinstance(e, str_type) else e
+                    for e in opExpr
+                ]
+            elif assoc is OpAssoc.RIGHT and arity == 1 and isinstance(opExpr, Opt):
+                ops = [opExpr.expr]
+            else:
+                ops = [opExpr]
+            n_ops = len(self.operators)
+            self.operators.extend(ops)
+            if pa is None:
+                actions = []
+            elif isinstance(pa, (tuple, list)):
+                actions = [_trim_arity(fn) for fn in pa]
+            else:
+                actions = [_trim_arity(pa)]
+            self._levels.append(
+                (
+                    arity,
+                    assoc,
+                    tuple(range(n_ops, len(self.operators))),
+                    actions,
+                    f"Expected {term_name}",
+                )
+            )
+
+    def recurse(self) -> list[ParserElement]:
+        return [self.expr, *self.operators]
+
+    def leave_whitespace(self, recursive: bool = True) -> ParserElement:
+        super().leave_whitespace(recursive)
+        if recursive:
+            self.operators = [e.copy() for e in self.operators]
+            for e in self.operators:
+                e.leave_whitespace(recursive)
+        return self
+
+    def ignore_whitespace(self, recursive: bool = True) -> ParserElement:
+        super().ignore_whitespace(recursive)
+        if recursive:
+            self.operators = [e.copy() for e in self.operators]
+            for e in self.operators:
+                e.ignore_whitespace(recursive)
+        return self
+
+    def ignore(self, other) -> ParserElement:
+        super().ignore(other)
+        for e in self.operators:
+            e.ignore(self.ignoreExprs[-1])
+        return self
+
+    def streamline(self) -> ParserElement:
+        super().streamline()
+        for e in self.operators:
+            e.streamline()
+        return self
+
+    def _generateDefaultName(self) -> str:
+        return f"{type(self).__name__}:({self.expr})"
+
+    def parseImpl(self, instring, loc, do_actions=True):
+        return self._parse_level(len(self._levels), instring, loc, do_actions)
+
+    def _parse_level(
+        self, level: int, instring: str, loc: int, do_actions: bool
+    ) -> tuple[int, ParseResults]:
+        # parse an expression at the given precedence level, as matched by
+        # (match_expr | <next lower level>) in infix_notation; like that
+        # expression, report a failure at the start of the level using the
+        # level's name
+        if level == 0:
+            return self.expr._parse(instring, loc, do_actions)
+
+        try:
+            return self._parse_operation(level, instring, loc, do_actions)
+        except ParseException as pe:
+            if pe.loc == self.preParse(instring, loc):
+                pe.msg = self._levels[level - 1][4]
+            raise
+
+    def _parse_operation(
+        self, level: int, instring: str, loc: int, do_actions: bool
+    ) -> tuple[int, ParseResults]:
+        arity, assoc, op_indexes, actions, _ = self._levels[level - 1]
+        ops = [self.operators[i] for i in op_indexes]
+        start = loc
+
+        if assoc is OpAssoc.RIGHT and arity == 1:
+            # prefix operator, followed by an operand at this same level
+            try:
+                loc, op_tokens = ops[0]._parse(instring, loc, do_actions)
+                loc, operand_tokens = self._parse_level(
+                    level, instring, loc, do_actions
+                )
+            except ParseException as prefix_exc:
+                try:
+                    return self._parse_level(level - 1, instring, start, do_actions)
+                except ParseException as pe:
+                    # raise the failure furthest into the input, as MatchFirst does
+                    if prefix_exc.loc >= pe.loc:
+                        raise prefix_exc from None
+                    raise
+            except IndexError:
+                return self._parse_level(level - 1, instring, start, do_actions)
+            parts = [op_tokens, operand_tokens]
+            lhs_loc, lhs_tokens = None, None
+        else:
+            loc, lhs_tokens = self._parse_level(level - 1, instring, loc, do_actions)
+            lhs_loc = loc
+            parts = [lhs_tokens]
+            # left associative operations repeat operands of the next lower
+            # level; right associative operations recurse into this level
+            rhs_level = level - 1 if assoc is OpAssoc.LEFT else level
+            if arity == 1:
+                # postfix operators
+                seq = ops
+            elif arity == 2:
+                # binary operators, or juxtaposed operands if no operator
+                seq = ops + [None]
+            else:
+                seq = [ops[0], None, ops[1], None]
+            while True:
+                seq_parts = []
+                try:
+                    seq_loc = loc
+                    for op in seq:
+                        if op is None:
+                            seq_loc, tokens = self._parse_level(
+                                rhs_level, instring, seq_loc, do_actions
+                            )
+                        else:
+                            seq_loc, tokens = op._parse(instring, seq_loc, do_actions)
+                        seq_parts.append(tokens)
+                except (ParseException, IndexError):
+                    break
+                loc = seq_loc
+                parts.extend(seq_parts)
+                if assoc is OpAssoc.RIGHT and arity == 3:
+                    break
+            if len(parts) == 1:
+                return loc, lhs_tokens
+
+        try:
+            return loc, self._operation_results(
+                actions, instring, start, parts, do_actions
+            )
+        except ParseException:
+            # parse action rejected the operation, fall back to the next level
+            if lhs_loc is None:
+                return self._parse_level(level - 1, instring, start, do_actions)
+            return lhs_loc, lhs_tokens
+
+    def _operation_results(
+        self,
+        actions: list,
+        instring: str,
+        start: int,
+        parts: list[ParseResults],
+        do_actions: bool,
+    ) -> ParseResults:
+        # group the results of an operation, and call the level's parse
+        # actions, as done by the Group in infix_notation
+        tokens = ParseResults([])
+        for part in parts:
+            tokens += part
+        ret_tokens = ParseResults([tokens])
+        if actions and do_actions:
+            tokens_start = self.expr.preParse(instring, start)
+            for fn in actions:
+                try:
+                    fn_tokens = fn(instring, tokens_start, ret_tokens)
+                except IndexError as parse_action_exc:
+                    exc = ParseException("exception raised in parse action")
+                    raise exc from parse_action_exc
+
+                if fn_tokens is not None and fn_tokens is not ret_tokens:
+                    ret_tokens = ParseResults(fn_tokens)
+        return ret_tokens
+
+
 def infix_notation(
     base_expr: ParserElement,
     op_list: list[InfixNotationOperatorSpec],
     lpar: Union[str, ParserElement] = Suppress("("),
     rpar: Union[str, ParserElement] = Suppress(")"),
+    engine: str = "default",
 ) -> Forward:
     """Helper method for constructing grammars of expressions made up of
     operators working in a precedence hierarchy.  Operators may be unary
@@ -832,7 +1578,7 @@ def infix_notation(
     Note: if you define a deep operator list, you may see performance
     issues when using infix_notation. See
     :class:`ParserElement.enable_packrat` for a mechanism to potentially
-    improve your parser performance.
+    improve your parser performance, or pass ``engine="pratt"``.
 
     Parameters:
 
@@ -866,6 +1612,10 @@ def infix_notation(
        str, then will be parsed as ``Suppress(rpar)``. If rpar is passed as
        an expression (such as ``Literal(')')``), then it will be kept in
        the parsed results, and grouped with them. (default= ``Suppress(')')``)
+    :param engine: ``"default"`` to build a separate expression for each
+       precedence level, or ``"pratt"`` to parse all levels in a single pass
+       with an :class:`OperatorPrecedence` expression, which gives the same
+       results in linear time. (default= ``"default"``)
 
     Example:
 
@@ -907,16 +1657,12 @@ def infix_notation(
 
        -2--11
        [[['-', 2], '-', ['-', 11]]]
+
+    .. versionchanged:: 3.3.3
+       Added ``engine`` argument.
     """
 
     # captive version of FollowedBy that does not do parse actions or capture results names
-    class _FB(FollowedBy):
-        def parseImpl(self, instring, loc, doActions=True):
-            self.expr.try_parse(instring, loc)
-            return loc, []
-
-    _FB.__name__ = "FollowedBy>"
-
     ret = Forward()
     ret.set_name(f"{base_expr.name}_expression")
     if isinstance(lpar, str):
@@ -932,33 +1678,22 @@ def infix_notation(
     else:
         lastExpr = base_expr | nested_expr
 
-    arity: int
-    rightLeftAssoc: opAssoc
-    pa: typing.Optional[ParseAction]
+    if engine == "pratt":
+        ret <<= OperatorPrecedence(lastExpr, op_list)
+        return ret
+    if engine != "default":
+        raise ValueError(f"invalid engine {engine!r}, must be 'default' or 'pratt'")
+
     opExpr1: ParserElement
     opExpr2: ParserElement
     matchExpr: ParserElement
     match_lookahead: ParserElement
-    for operDef in op_list:
-        opExpr, arity, rightLeftAssoc, pa = (operDef + (None,))[:4]  # type: ignore[assignment]
-        if isinstance(opExpr, str_type):
-            opExpr = ParserElement._literalStringClass(opExpr)
-        opExpr = typing.cast(ParserElement, opExpr)
+    for opExpr, arity, rightLeftAssoc, pa, term_name in _infix_notation_levels(
+        op_list
+    ):
         if arity == 3:
-            if not isinstance(opExpr, (tuple, list)) or len(opExpr) != 2:
-                raise ValueError(
-                    "if numterms=3, opExpr must be a tuple or list of two expressions"
-                )
             opExpr1, opExpr2 = opExpr
-            term_name = f"{opExpr1}{opExpr2} operations"
-        else:
-            term_name = f"{opExpr} operations"
-
-        if not 1 <= arity <= 3:
-            raise ValueError("operator must be unary (1), binary (2), or ternary (3)")
-
-        if rightLeftAssoc not in (OpAssoc.LEFT, OpAssoc.RIGHT):
-            raise ValueError("operator must indicate right or left associativity")
+        opExpr = typing.cast(ParserElement, opExpr)
 
         thisExpr: ParserElement = Forward().set_name(term_name)
         thisExpr = typing.cast(Forward, thisExpr)
@@ -1228,8 +1963,6 @@ def delimited_list(
 # Compatibility synonyms
 # fmt: off
 opAssoc = OpAssoc
-anyOpenTag = any_open_tag
-anyCloseTag = any_close_tag
 commonHTMLEntity = common_html_entity
 cStyleComment = c_style_comment
 htmlComment = html_comment
@@ -1252,3 +1985,16 @@ makeXMLTags = replaced_by_pep8("makeXMLTags", make_xml_tags)
 replaceHTMLEntity = replaced_by_pep8("replaceHTMLEntity", replace_html_entity)
 infixNotation = replaced_by_pep8("infixNotation", infix_notation)
 # fmt: on
+
+
+_lazy_tag_names = {"any_open_tag", "any_close_tag", "anyOpenTag", "anyCloseTag"}
+_lazy_tag_lock = RLock()
+
+
+def __getattr__(name: str):
+    if name in _lazy_tag_names:
+        with _lazy_tag_lock:
+            if name not in globals():
+                _make_any_tags()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -11,6 +11,7 @@ from collections.abc import (
     Iterable,
 )
 import pprint
+import types
 from typing import Any, NamedTuple
 
 from .util import deprecate_argument, _is_iterable, _flatten
@@ -26,6 +27,12 @@ class _ParseResultsWithOffset(NamedTuple):
     offset: int
 
 
+# Most ParseResults never get a results name, so they all share these read-only
+# empty name tables; a private dict or set is allocated on first assignment
+_EMPTY_TOKDICT: Mapping[str, list[_ParseResultsWithOffset]] = types.MappingProxyType({})
+_NO_NAMES: frozenset[str] = frozenset()
+
+
 class ParseResults:
     """Structured parse results, to provide multiple means of access to
     the parsed data:
@@ -82,7 +89,7 @@ class ParseResults:
 
     _name: str
     _parent: ParseResults
-    _all_names: set[str]
+    _all_names: set[str] | frozenset[str]
     _toklist: list[Any]
     _tokdict: dict[str, list[_ParseResultsWithOffset]]
     _is_dict_context: bool
@@ -173,7 +180,7 @@ class ParseResults:
         self = object.__new__(cls)
         self._name = None
         self._parent = None
-        self._all_names = set()
+        self._all_names = _NO_NAMES
         self._is_dict_context = False
 
         if toklist is None:
@@ -186,7 +193,7 @@ class ParseResults:
             )
         else:
             self._toklist = [toklist]
-        self._tokdict = {}
+        self._tokdict = _EMPTY_TOKDICT  # type: ignore[assignment]
         return self
 
     # Performance tuning: we construct a *lot* of these, so keep this
@@ -200,10 +207,12 @@ class ParseResults:
         isinstance=isinstance,
         **kwargs,
     ) -> None:
-        asList = deprecate_argument(kwargs, "asList", True, new_name="aslist")
-
-        asList = asList and aslist
-        self._tokdict: dict[str, list[_ParseResultsWithOffset]]
+        # only the deprecated asList argument arrives in kwargs, so skip its
+        # processing entirely for the usual constructor calls
+        if kwargs:
+            aslist = aslist and deprecate_argument(
+                kwargs, "asList", True, new_name="aslist"
+            )
 
         if name is None or name == "":
             return
@@ -219,10 +228,10 @@ class ParseResults:
         if toklist in self._null_values:
             return
 
-        if isinstance(toklist, (str_type, type)):
+        if isinstance(toklist, (str_type, collections.UserString, type)):
             toklist = [toklist]
 
-        if asList:
+        if aslist:
             if isinstance(toklist, ParseResults):
                 self[name] = _ParseResultsWithOffset(ParseResults(toklist._toklist), 0)
             else:
@@ -260,7 +269,7 @@ class ParseResults:
         if isinstance(v, _ParseResultsWithOffset):
             cur_tokdict_value = self._tokdict.get(k, no_value)
             if cur_tokdict_value is no_value:
-                self._tokdict[k] = [v]
+                self._own_tokdict()[k] = [v]
             else:
                 cur_tokdict_value.append(v)
             sub = v.result
@@ -270,15 +279,24 @@ class ParseResults:
         else:
             cur_tokdict_value = self._tokdict.get(k, no_value)
             if cur_tokdict_value is no_value:
-                self._tokdict[k] = [_ParseResultsWithOffset(v, 0)]
+                self._own_tokdict()[k] = [_ParseResultsWithOffset(v, 0)]
             else:
                 cur_tokdict_value.append(_ParseResultsWithOffset(v, 0))
             sub = v
         if isinstance(sub, ParseResults):
             sub._parent = self
 
+    def _own_tokdict(self) -> dict[str, list[_ParseResultsWithOffset]]:
+        # replace the shared empty names table with a private dict before the
+        # first results name is added
+        if self._tokdict is _EMPTY_TOKDICT:
+            self._tokdict = {}
+        return self._tokdict
+
     def __delitem__(self, i):
         if not isinstance(i, (int, slice)):
+            if i not in self._tokdict:
+                raise KeyError(i)
             del self._tokdict[i]
             return
 
@@ -526,7 +544,7 @@ class ParseResults:
         Clear all elements and results names.
         """
         del self._toklist[:]
-        self._tokdict.clear()
+        self._tokdict = _EMPTY_TOKDICT  # type: ignore[assignment]
 
     def __getattr__(self, name):
         try:
@@ -575,7 +593,8 @@ class ParseResults:
                     v.result._parent = self
 
         self._toklist += other._toklist
-        self._all_names |= other._all_names
+        if other._all_names:
+            self._all_names = {*self._all_names, *other._all_names}
         return self
 
     def __radd__(self, other) -> ParseResults:
@@ -704,10 +723,13 @@ class ParseResults:
         # the occurrence lists are shared with the original; the only methods
         # that renumber them (__delitem__, insert) copy before writing, so a
         # copy can never renumber the original's offsets
-        ret._tokdict = {**self._tokdict}
+        ret._tokdict = (
+            {**self._tokdict} if self._tokdict else _EMPTY_TOKDICT  # type: ignore[assignment]
+        )
         ret._parent = self._parent
-        ret._all_names = {*self._all_names}
+        ret._all_names = {*self._all_names} if self._all_names else _NO_NAMES
         ret._name = self._name
+        ret._is_dict_context = self._is_dict_context
         return ret
 
     def deepcopy(self) -> ParseResults:
@@ -741,6 +763,8 @@ class ParseResults:
 
         # rebuild the results-name dict so that named results point at the
         # deep-copied tokens, instead of remaining linked to the original
+        if not self._tokdict:
+            return ret
         ret._tokdict = {
             name: [
                 _ParseResultsWithOffset(memo.get(id(value), value), offset)
@@ -934,7 +958,9 @@ class ParseResults:
             self._name,
             self._is_dict_context,
         ) = state
-        self._all_names = set(inAccumNames)
+        if not self._tokdict:
+            self._tokdict = _EMPTY_TOKDICT  # type: ignore[assignment]
+        self._all_names = set(inAccumNames) if inAccumNames else _NO_NAMES
         self._parent = None
 
     def __getnewargs__(self):
@@ -979,3 +1005,143 @@ class ParseResults:
 
 MutableMapping.register(ParseResults)
 MutableSequence.register(ParseResults)
+
+
+class _ParseResultsBuilder:
+    """
+    Accumulates the results of a sequence of matches into the first of them,
+    with the same outcome as ``first += other`` for each match, but in time
+    linear in the number of tokens and results names.
+
+    Tokens are appended directly to the first results' token list. Results
+    names are collected into new occurrence lists, which are installed in the
+    first results by :meth:`build`; lists already in the first results may
+    be shared with copies of it, and so are never appended to.
+    """
+
+    __slots__ = ("first", "toklist", "names", "all_names")
+
+    def __init__(self, first: ParseResults) -> None:
+        self.first = first
+        self.toklist = first._toklist
+        self.names: dict[str, list[_ParseResultsWithOffset]] = {}
+        self.all_names: set[str] | None = None
+
+    def add(self, other: ParseResults) -> None:
+        if not (other._toklist or other._tokdict):
+            return
+
+        if other is self.first:
+            # the names added so far must be visible in other
+            self.build()
+
+        if other._tokdict:
+            first = self.first
+            names = self.names
+            offset = len(self.toklist)
+            for name, occurrences in other._tokdict.items():
+                dest = names.get(name)
+                if dest is None:
+                    dest = names[name] = list(first._tokdict.get(name, ()))
+                for value, value_offset in occurrences:
+                    dest.append(
+                        _ParseResultsWithOffset(
+                            value,
+                            offset if value_offset < 0 else value_offset + offset,
+                        )
+                    )
+                    if isinstance(value, ParseResults):
+                        value._parent = first
+
+        self.toklist += other._toklist
+        if other._all_names:
+            if self.all_names is None:
+                self.all_names = {*self.first._all_names}
+            self.all_names |= other._all_names
+
+    def build(self) -> ParseResults:
+        first = self.first
+        if self.names:
+            first._tokdict = {**first._tokdict, **self.names}
+            self.names = {}
+        if self.all_names is not None:
+            first._all_names = self.all_names
+            self.all_names = None
+        return first
+
+
+# Compact representation of ParseResults for transfer between processes. The
+# results are converted to nested lists and tuples of builtin types, which
+# pickle much faster and smaller than ParseResults objects.
+def _pack_results(res: ParseResults) -> tuple:
+    packed_toks = list(res._toklist)
+    nested = []
+    index_of_nested: dict[int, int] = {}
+    for i, tok in enumerate(packed_toks):
+        if isinstance(tok, ParseResults):
+            packed_toks[i] = _pack_results(tok)
+            nested.append(i)
+            index_of_nested[id(tok)] = i
+
+    if not (res._tokdict or res._name or res._all_names or res._is_dict_context):
+        return packed_toks, nested
+
+    # results name values are encoded as (offset, kind, value), where kind is
+    # 0 for a plain value, 1 for the index of a nested ParseResults in the token
+    # list, and 2 for a packed ParseResults
+    packed_names = {}
+    for name, occurrences in res._tokdict.items():
+        packed_occurrences = []
+        for value, offset in occurrences:
+            if isinstance(value, ParseResults):
+                if id(value) in index_of_nested:
+                    packed_occurrences.append((offset, 1, index_of_nested[id(value)]))
+                else:
+                    packed_occurrences.append((offset, 2, _pack_results(value)))
+            else:
+                packed_occurrences.append((offset, 0, value))
+        packed_names[name] = packed_occurrences
+
+    return (
+        packed_toks,
+        nested,
+        packed_names,
+        res._name,
+        list(res._all_names),
+        res._is_dict_context,
+    )
+
+
+def _unpack_results(packed: tuple) -> ParseResults:
+    ret: ParseResults = object.__new__(ParseResults)
+    toks, nested = packed[0], packed[1]
+    for i in nested:
+        toks[i] = sub = _unpack_results(toks[i])
+        sub._parent = ret
+    ret._toklist = toks
+    ret._parent = None  # type: ignore[assignment]
+
+    if len(packed) == 2:
+        ret._tokdict = _EMPTY_TOKDICT  # type: ignore[assignment]
+        ret._name = None  # type: ignore[assignment]
+        ret._all_names = _NO_NAMES
+        ret._is_dict_context = False
+        return ret
+
+    packed_names, ret._name, all_names, ret._is_dict_context = packed[2:]
+    ret._all_names = set(all_names) if all_names else _NO_NAMES
+    if not packed_names:
+        ret._tokdict = _EMPTY_TOKDICT  # type: ignore[assignment]
+        return ret
+    ret._tokdict = tokdict = {}
+    for name, packed_occurrences in packed_names.items():
+        occurrences = []
+        for offset, kind, value in packed_occurrences:
+            if kind == 1:
+                value = toks[value]
+            elif kind == 2:
+                value = _unpack_results(value)
+                value._parent = ret
+            occurrences.append(_ParseResultsWithOffset(value, offset))
+        tokdict[name] = occurrences
+    return ret
@@ -0,0 +1,900 @@
+"""
+Ahead-of-time code generator for pyparsing grammars.
+
+Converts a pyparsing grammar into the source of a standalone Python module
+of specialized recursive-descent functions, one per parser element, with
+precompiled regular expressions and inlined whitespace skipping. Importing
+the generated module does not construct or streamline any parser elements,
+so it loads much faster than the grammar it was generated from, while
+still returning :class:`ParseResults` and raising :class:`ParseException`
+as pyparsing does.
+
+The generated module defines:
+
+- ``parse_string(instring, parse_all=False)`` - parse ``instring`` as done
+  by :meth:`ParserElement.parse_string`
+- ``scan_string(instring, max_matches=sys.maxsize)`` - generator of
+  ``(tokens, start, end)`` tuples, as done by :meth:`ParserElement.scan_string`
+
+Element classes that the generator does not specialize (such as ``Each``,
+``SkipTo``, or ``QuotedString``), and elements with debugging or fail actions
+enabled, are embedded in the generated module in pickled form, and parsed
+by pyparsing at runtime. Parse actions are also embedded in pickled form, so
+they must be defined at module level (not as lambdas or nested functions).
+Since the pickled values depend on the pyparsing version, the generated module
+records the version of pyparsing that generated it, and raises ``ImportError``
+if it is imported with a different version; it must then be regenerated.
+
+Example::
+
+    from pyparsing.tools.codegen import generate
+
+    source = generate(my_grammar)
+    Path("my_grammar_parser.py").write_text(source, encoding="utf-8")
+
+    import my_grammar_parser
+    result = my_grammar_parser.parse_string(text, parse_all=True)
+
+or from the command line::
+
+    python -m pyparsing.tools.codegen my_package.grammar:my_grammar -o my_grammar_parser.py
+
+.. versionadded:: 3.3.3
+"""
+
+from __future__ import annotations
+
+import base64
+import itertools
+import pickle
+import re
+import typing
+
+import pyparsing as pp
+from pyparsing.core import ParserElement, _ParseActionIndexError
+from pyparsing.helpers import _FB
+
+__all__ = ["generate", "ParseActionIndexError"]
+
+# raised in place of an IndexError raised by a parse action, so that it is not
+# taken to be a failed match; unwrapped by the entry points of generated modules
+ParseActionIndexError = _ParseActionIndexError
+
+_PRELUDE = '''\
+import base64
+import pickle
+import re
+import sys
+from operator import itemgetter
+
+from pyparsing import (
+    ParseBaseException,
+    ParseException,
+    ParseFatalException,
+    ParseResults,
+    ParseSyntaxException,
+    __version__ as _pyparsing_version,
+)
+
+# the embedded constants are pickled pyparsing objects, which can only be
+# loaded by the pyparsing version that generated this module
+if _pyparsing_version != _GENERATED_BY:
+    raise ImportError(
+        f"{__name__} was generated by pyparsing {_GENERATED_BY}, and cannot be"
+        f" used with pyparsing {_pyparsing_version}; regenerate it using"
+        " pyparsing.tools.codegen"
+    )
+
+from pyparsing.tools.codegen import ParseActionIndexError
+
+__all__ = ["parse_string", "scan_string"]
+
+
+def _match_keyword(instring, loc, match, caseless_match, ident_chars, errmsg):
+    match_len = len(match)
+    if caseless_match is not None:
+        found = instring[loc : loc + match_len].upper() == caseless_match
+        prev_char = instring[loc - 1 : loc].upper()
+        next_char = instring[loc + match_len : loc + match_len + 1].upper()
+    else:
+        found = instring.startswith(match, loc)
+        prev_char = instring[loc - 1 : loc]
+        next_char = instring[loc + match_len : loc + match_len + 1]
+    errloc = loc
+    if found:
+        if loc == 0 or prev_char not in ident_chars:
+            if not next_char or next_char not in ident_chars:
+                return loc + match_len, match
+            errmsg += (
+                ", keyword was immediately followed by keyword character"
+                if caseless_match is None
+                else ", was immediately followed by keyword character"
+            )
+            errloc = loc + match_len
+        else:
+            errmsg += ", keyword was immediately preceded by keyword character"
+            errloc = loc - 1
+    raise ParseException(instring, errloc, errmsg)
+
+
+def _combine(tokens, join_string, modal, results_name):
+    ret = tokens.copy()
+    del ret[:]
+    ret += ParseResults(["".join(tokens._asStringList(join_string))], modal=modal)
+    if results_name and ret.haskeys():
+        return [ret]
+    return ret
+
+
+def _parse_longest(instring, loc, do_actions, alternatives, errmsg, start_loc):
+    max_exc = None
+    matches = []
+    fatals = []
+    for alt in alternatives:
+        try:
+            alt_loc, _ = alt(instring, loc, False)
+        except ParseFatalException as pfe:
+            pfe.__traceback__ = None
+            fatals.append(pfe)
+            max_exc = None
+        except ParseException as err:
+            if not fatals and (max_exc is None or err.loc > max_exc.loc):
+                err.__traceback__ = None
+                max_exc = err
+        else:
+            matches.append((alt_loc, alt))
+
+    if matches:
+        matches.sort(key=itemgetter(0), reverse=True)
+        if not do_actions:
+            return matches[0][1](instring, loc, do_actions)
+
+        longest = -1, None
+        for match_loc, alt in matches:
+            if match_loc <= longest[0]:
+                return longest
+            try:
+                alt_loc, toks = alt(instring, loc, do_actions)
+            except ParseException as err:
+                if max_exc is None or err.loc > max_exc.loc:
+                    err.__traceback__ = None
+                    max_exc = err
+            else:
+                if alt_loc >= match_loc:
+                    return alt_loc, toks
+                elif alt_loc > longest[0]:
+                    longest = alt_loc, toks
+
+        if longest != (-1, None):
+            return longest
+
+    if fatals:
+        raise max(fatals, key=lambda pfe: pfe.loc)
+
+    if max_exc is not None:
+        if max_exc.loc == start_loc:
+            max_exc.msg = errmsg
+        raise max_exc
+
+    raise ParseException(instring, loc, "no defined alternatives to match")
+'''
+
+_PACKRAT_PRELUDE = '''
+
+_packrat_cache = {}
+
+
+def _packrat(parse_fn):
+    # memoize parse_fn results, as done by ParserElement.enable_packrat()
+    cache = _packrat_cache
+
+    def parse(instring, loc, do_actions=True, call_pre_parse=True):
+        key = parse_fn, instring, loc, do_actions, call_pre_parse
+        value = cache.get(key)
+        if value is None:
+            try:
+                next_loc, tokens = parse_fn(instring, loc, do_actions, call_pre_parse)
+            except ParseBaseException as pe:
+                # cache a copy of the exception, without the traceback
+                cache[key] = pe.__class__(*pe.args)
+                raise
+            cache[key] = next_loc, tokens.copy()
+            return next_loc, tokens
+        if isinstance(value, Exception):
+            raise value
+        return value[0], value[1].copy()
+
+    return parse
+'''
+
+_PARSE_STRING = '''
+
+def parse_string(instring: str, parse_all: bool = False) -> ParseResults:
+    """
+    Parse ``instring`` using the generated parser, returning the parsed
+    tokens as a :class:`ParseResults`, or raising a :class:`ParseException`.
+    Equivalent to calling ``parse_string`` on the original grammar.
+    """
+{expand_tabs}{clear_cache}    try:
+        loc, tokens = {root}(instring, 0)
+        if parse_all:
+{pre_parse_all}            if loc < len(instring):
+                raise ParseException(instring, loc, "Expected end of text")
+    except ParseActionIndexError as pa_exc:
+        raise pa_exc.exc
+    except ParseBaseException as exc:
+        raise exc.with_traceback(None)
+    return tokens
+
+
+def scan_string(instring: str, max_matches: int = sys.maxsize):
+    """
+    Scan ``instring`` for matches of the generated parser, yielding
+    ``(tokens, start, end)`` tuples for each match. Equivalent to calling
+    ``scan_string`` on the original grammar.
+    """
+{expand_tabs}{clear_cache}    instrlen = len(instring)
+    loc = 0
+    matches = 0
+    try:
+        while loc <= instrlen and matches < max_matches:
+            preloc = {scan_pre_parse}
+            try:
+                next_loc, tokens = {root}(instring, preloc, True, False)
+            except ParseException:
+                loc = preloc + 1
+            else:
+                if next_loc > loc:
+                    matches += 1
+                    yield tokens, preloc, next_loc
+                    loc = next_loc
+                else:
+                    loc = preloc + 1
+    except ParseActionIndexError as pa_exc:
+        raise pa_exc.exc
+    except ParseBaseException as exc:
+        raise exc.with_traceback(None)
+'''
+
+
+def _comment(expr: ParserElement) -> str:
+    # safe, single-line description of expr, for comments in generated code
+    desc = ascii(str(expr))[1:-1]
+    return desc if len(desc) <= 70 else f"{desc[:67]}..."
+
+
+def _indent(lines: list[str], levels: int = 1) -> list[str]:
+    prefix = "    " * levels
+    return [f"{prefix}{line}" if line else line for line in lines]
+
+
+class _CodeGenerator:
+    """
+    Generates a function for each parser element in a grammar, recursively.
+    """
+
+    def __init__(self, packrat: bool = False) -> None:
+        self.packrat = packrat
+        self.counter = itertools.count(1)
+        # parser element id -> generated function name
+        self.functions: dict[int, str] = {}
+        # keep references to all visited elements, so that ids are not reused
+        self.elements: list[ParserElement] = []
+        self.constants: list[typing.Any] = []
+        self.header_lines: list[str] = []
+        self.function_defs: list[str] = []
+        self.trailer_lines: list[str] = []
+        self.regexes: dict[tuple[str, int], str] = {}
+        self.skippers: dict[tuple, str] = {}
+
+    def _next_name(self, prefix: str) -> str:
+        return f"{prefix}_{next(self.counter)}"
+
+    def constant(self, value: typing.Any, prefix: str) -> str:
+        """Embed a (pickled) value in the generated module, returning its name."""
+        name = self._next_name(prefix)
+        self.header_lines.append(f"{name} = _constants[{len(self.constants)}]")
+        self.constants.append(value)
+        return name
+
+    def regex_match(self, pattern: str, flags: int = 0) -> str:
+        """Precompile a regex, returning the name of its match method."""
+        key = pattern, flags
+        if key not in self.regexes:
+            name = self._next_name("_re")
+            self.header_lines.append(f"{name} = re.compile({pattern!r}, {flags}).match")
+            self.regexes[key] = name
+        return self.regexes[key]
+
+    def whitespace_skipper(self, white_chars) -> typing.Optional[str]:
+        if not white_chars:
+            return None
+        escaped = "".join(re.escape(c) for c in sorted(white_chars))
+        return self.regex_match(f"[{escaped}]*")
+
+    def skipper(self, ignore_exprs, white_chars) -> typing.Optional[str]:
+        """
+        Return the name of a function to skip ignorable expressions and
+        whitespace, or None if there is nothing to skip.
+        """
+        ws_match = self.whitespace_skipper(white_chars)
+        if not ignore_exprs:
+            return f"{ws_match}(instring, {{loc}}).end()" if ws_match else None
+
+        ignore_fns = tuple(self.compile(e) for e in ignore_exprs)
+        key = ignore_fns, ws_match
+        if key not in self.skippers:
+            name = self._next_name("_skip")
+            self.skippers[key] = name
+            ws_skip = f"{ws_match}(instring, loc).end()" if ws_match else "loc"
+            self.function_defs.append(
+                "\n".join(
+                    [
+                        f"def {name}(instring, loc):",
+                        "    last_loc = loc",
+                        "    while True:",
+                        "        found = False",
+                        f"        for ignore_fn in ({', '.join(ignore_fns)},):",
+                        "            try:",
+                        "                while True:",
+                        "                    loc, _ = ignore_fn(instring, loc)",
+                        "                    found = True",
+                        "            except ParseException:",
+                        "                pass",
+                        "        if not found or loc == last_loc:",
+                        "            break",
+                        "        last_loc = loc",
+                        f"    return {ws_skip}",
+                    ]
+                )
+            )
+        return f"{self.skippers[key]}(instring, {{loc}})"
+
+    def pre_parse(self, expr: ParserElement, loc: str = "loc") -> typing.Optional[str]:
+        """Return an expression for expr's pre-parse location, or None."""
+        white_chars = expr.whiteChars if expr.skipWhitespace else ()
+        skip = self.skipper(expr.ignoreExprs, white_chars)
+        return skip.format(loc=loc) if skip else None
+
+    def _can_compile(self, expr: ParserElement) -> bool:
+        if expr.debug or expr.failAction:
+            return False
+        if isinstance(expr, pp.Forward) and ParserElement._left_recursion_enabled:
+            # left-recursive grammars are parsed using pyparsing's bounded recursion
+            return False
+        if type(expr).preParse is not ParserElement.preParse:
+            return False
+        return type(expr) in self._impl_generators
+
+    def compile(self, expr: ParserElement) -> str:
+        """Generate the function for expr, returning the function name."""
+        if id(expr) in self.functions:
+            return self.functions[id(expr)]
+
+        name = self._next_name("_parse")
+        self.functions[id(expr)] = name
+        self.elements.append(expr)
+
+        if not self._can_compile(expr):
+            self.function_defs.append(self._fallback_function(expr, name))
+            return name
+
+        def_name = f"{name}_no_cache" if self.packrat else name
+        lines = [
+            f"def {def_name}(instring, loc, do_actions=True, call_pre_parse=True):",
+            f"    # {_comment(expr)}",
+        ]
+        pre = self.pre_parse(expr) if expr.callPreparse else None
+        if pre:
+            lines += ["    if call_pre_parse:", f"        loc = {pre}"]
+        if expr.parseAction:
+            lines.append("    tokens_start = loc")
+        impl = self._impl_generators[type(expr)](self, expr)
+        if impl is None:
+            # expression uses a feature that can't be generated
+            self.function_defs.append(self._fallback_function(expr, name))
+            return name
+        lines += _indent(impl)
+        lines += _indent(self._results_code(expr))
+        lines.append("    return loc, ret_tokens")
+        if self.packrat:
+            lines += ["", "", f"{name} = _packrat({def_name})"]
+        self.function_defs.append("\n".join(lines))
+        return name
+
+    def _fallback_function(self, expr: ParserElement, name: str) -> str:
+        elem = self.constant(expr, "_element")
+        return "\n".join(
+            [
+                f"def {name}(instring, loc, do_actions=True, call_pre_parse=True):",
+                f"    # {_comment(expr)} (parsed by pyparsing)",
+                f"    return {elem}._parse(instring, loc, do_actions, call_pre_parse)",
+            ]
+        )
+
+    def _results_code(self, expr: ParserElement) -> list[str]:
+        results_name = expr.resultsName
+        if results_name:
+            lines = [
+                f"ret_tokens = ParseResults(tokens, {results_name!r},"
+                f" aslist={expr.saveAsList}, modal={expr.modalResults})"
+            ]
+        else:
+            lines = ["ret_tokens = ParseResults(tokens)"]
+        if not expr.parseAction:
+            return lines
+
+        actions = self.constant(list(expr.parseAction), "_actions")
+        if results_name:
+            new_results = (
+                f"ret_tokens = ParseResults(tokens, {results_name!r},"
+                f" aslist={expr.saveAsList} and isinstance(tokens, (ParseResults, list)),"
+                f" modal={expr.modalResults})"
+            )
+        else:
+            new_results = "ret_tokens = ParseResults(tokens)"
+        action_lines = [
+            f"for fn in {actions}:",
+            "    try:",
+            "        tokens = fn(instring, tokens_start, ret_tokens)",
+            "    except IndexError as parse_action_exc:",
+            '        exc = ParseException("exception raised in parse action")',
+            "        raise exc from parse_action_exc",
+            "    if tokens is not None and tokens is not ret_tokens:",
+            f"        {new_results}",
+        ]
+        if expr.callDuringTry:
+            return lines + action_lines
+        return lines + ["if do_actions:"] + _indent(action_lines)
+
+    @staticmethod
+    def _raise(errmsg: typing.Optional[str], loc: str = "loc") -> str:
+        return f"raise ParseException(instring, {loc}, {errmsg or ''!r})"
+
+    # generators for the parseImpl (and postParse) code of each supported class;
+    # each returns a list of code lines that set loc and tokens, or None if the
+    # expression can't be generated
+
+    def _gen_empty(self, expr):
+        return ["tokens = []"]
+
+    def _gen_no_match(self, expr):
+        return [self._raise(expr.errmsg)]
+
+    def _gen_literal(self, expr):
+        return [
+            f"if not instring.startswith({expr.match!r}, loc):",
+            f"    {self._raise(expr.errmsg)}",
+            f"loc += {expr.matchLen}",
+            f"tokens = {expr.match!r}",
+        ]
+
+    def _gen_caseless_literal(self, expr):
+        return [
+            f"if instring[loc : loc + {expr.matchLen}].upper() != {expr.match!r}:",
+            f"    {self._raise(expr.errmsg)}",
+            f"loc += {expr.matchLen}",
+            f"tokens = {expr.returnString!r}",
+        ]
+
+    def _gen_keyword(self, expr):
+        ident_chars = "".join(sorted(expr.identChars))
+        caseless_match = expr.caselessmatch if expr.caseless else None
+        return [
+            f"loc, tokens = _match_keyword(instring, loc, {expr.match!r},"
+            f" {caseless_match!r}, {ident_chars!r}, {expr.errmsg or ''!r})"
+        ]
+
+    def _gen_word(self, expr):
+        if getattr(expr, "re_match", None) is None:
+            return None
+        match = self.regex_match(expr.re.pattern, expr.re.flags)
+        return [
+            f"match = {match}(instring, loc)",
+            "if match is None:",
+            f"    {self._raise(expr.errmsg)}",
+            "loc = match.end()",
+            "tokens = match.group()",
+        ]
+
+    def _gen_regex(self, expr):
+        if expr.asGroupList or expr.asMatch:
+            return None
+        match = self.regex_match(expr.re.pattern, expr.re.flags)
+        lines = []
+        if expr.mayReturnEmpty:
+            lines += ["if loc > len(instring):", f"    {self._raise(expr.errmsg)}"]
+        lines += [
+            f"match = {match}(instring, loc)",
+            "if match is None:",
+            f"    {self._raise(expr.errmsg)}",
+            "loc = match.end()",
+            "tokens = ParseResults(match.group())",
+        ]
+        if expr.re.groupindex:
+            lines += [
+                "for name, value in match.groupdict().items():",
+                "    tokens[name] = value",
+            ]
+        return lines
+
+    def _gen_and(self, expr):
+        exprs = expr.exprs
+        if not exprs:
+            return ["tokens = ParseResults([])"]
+        lines = [
+            f"loc, tokens = {self.compile(exprs[0])}(instring, loc, do_actions, False)"
+        ]
+        error_stop = False
+        for e in exprs[1:]:
+            if type(e) is pp.And._ErrorStop:
+                error_stop = True
+                continue
+            parse_line = f"loc, more = {self.compile(e)}(instring, loc, do_actions)"
+            if error_stop:
+                lines += [
+                    "try:",
+                    f"    {parse_line}",
+                    "except ParseSyntaxException:",
+                    "    raise",
+                    "except ParseBaseException as pe:",
+                    "    pe.__traceback__ = None",
+                    "    raise ParseSyntaxException._from_exception(pe)",
+                ]
+            else:
+                lines.append(parse_line)
+            lines.append("tokens += more")
+        return lines
+
+    def _alternatives(self, expr) -> str:
+        name = self._next_name("_alternatives")
+        alternatives = [self.compile(e) for e in expr.exprs]
+        self.trailer_lines.append(f"{name} = ({', '.join(alternatives)},)")
+        return name
+
+    def _gen_match_first(self, expr):
+        if not expr.exprs:
+            return [self._raise("no defined alternatives to match")]
+        alternatives = self._alternatives(expr)
+        start_loc = self.pre_parse(expr, "loc") or "loc"
+        return [
+            "max_exc = None",
+            f"for alt in {alternatives}:",
+            "    try:",
+            "        loc, tokens = alt(instring, loc, do_actions)",
+            "        break",
+            "    except ParseFatalException:",
+            "        raise",
+            "    except ParseException as err:",
+            "        if max_exc is None or err.loc > max_exc.loc:",
+            "            max_exc = err",
+            "else:",
+            f"    if max_exc.loc == {start_loc}:",
+            f"        max_exc.msg = {expr.errmsg or ''!r}",
+            "    raise max_exc",
+        ]
+
+    def _gen_or(self, expr):
+        alternatives = self._alternatives(expr)
+        pre = self.pre_parse(expr, "loc")
+        lines = []
+        if pre and all(e.callPreparse for e in expr.exprs):
+            lines.append(f"loc = {pre}")
+        return lines + [
+            f"loc, tokens = _parse_longest(instring, loc, do_actions, {alternatives},"
+            f" {expr.errmsg or ''!r}, {pre or 'loc'})"
+        ]
+
+    def _gen_enhance(self, expr):
+        if expr.expr is None:
+            return [self._raise("No expression defined")]
+        parse_line = (
+            f"loc, tokens = {self.compile(expr.expr)}(instring, loc, do_actions, False)"
+        )
+        if (
+            not isinstance(expr, pp.Forward)
+            and expr.customName is not None
+            and expr.errmsg
+        ):
+            # use this expression's error message in place of the contained
+            # expression's message
+            return [
+                "try:",
+                f"    {parse_line}",
+                "except ParseSyntaxException:",
+                "    raise",
+                "except ParseBaseException as pbe:",
+                f"    pbe.msg = {expr.errmsg!r}",
+                "    raise",
+            ]
+        return [parse_line]
+
+    def _gen_group(self, expr):
+        lines = self._gen_enhance(expr)
+        if expr._asPythonList:
+            return lines + [
+                "tokens = ParseResults.List(",
+                "    tokens.as_list() if isinstance(tokens, ParseResults) else list(tokens)",
+                ")",
+            ]
+        return lines + ["tokens = [tokens]"]
+
+    def _gen_suppress(self, expr):
+        return self._gen_enhance(expr) + ["tokens = []"]
+
+    def _gen_combine(self, expr):
+        return self._gen_enhance(expr) + [
+            f"tokens = _combine(tokens, {expr.joinString!r}, {expr.modalResults},"
+            f" {expr.resultsName!r})"
+        ]
+
+    def _gen_followed_by(self, expr):
+        return [
+            f"_, tokens = {self.compile(expr.expr)}(instring, loc, do_actions)",
+            "del tokens[:]",
+        ]
+
+    def _gen_lookahead(self, expr):
+        # infix_notation's lookahead, which only checks for a match
+        return [
+            "try:",
+            f"    {self.compile(expr.expr)}(instring, loc, False)",
+            "except ParseFatalException:",
+            f"    {self._raise(expr.expr.errmsg)}",
+            "tokens = []",
+        ]
+
+    def _gen_not_any(self, expr):
+        return [
+            "try:",
+            f"    {self.compile(expr.expr)}(instring, loc, False)",
+            "except (ParseBaseException, IndexError):",
+            "    tokens = []",
+            "else:",
+            f"    {self._raise(expr.errmsg)}",
+        ]
+
+    def _gen_opt(self, expr):
+        lines = [
+            "try:",
+            f"    loc, tokens = {self.compile(expr.expr)}(instring, loc, do_actions, False)",
+            "except (ParseException, IndexError):",
+        ]
+        default_value = expr.defaultValue
+        if default_value is pp.Opt._Opt__optionalNotMatched:
+            return lines + ["    tokens = []"]
+        default = self.constant(default_value, "_default")
+        if expr.expr.resultsName:
+            return lines + [
+                f"    tokens = ParseResults([{default}])",
+                f"    tokens[{expr.expr.resultsName!r}] = {default}",
+            ]
+        return lines + [f"    tokens = [{default}]"]
+
+    def _gen_one_or_more(self, expr):
+        parse_fn = self.compile(expr.expr)
+        lines = []
+        ender_line = None
+        if expr.not_ender is not None:
+            ender_line = f"{self.compile(expr.not_ender)}(instring, loc, False)"
+            lines.append(ender_line)
+        lines += [f"loc, tokens = {parse_fn}(instring, loc, do_actions)"]
+        loop = []
+        if ender_line:
+            loop.append(ender_line)
+        skip = self.skipper(expr.ignoreExprs, ())
+        preloc = skip.format(loc="loc") if skip else "loc"
+        loop.append(f"loc, more = {parse_fn}(instring, {preloc}, do_actions)")
+        loop.append("tokens += more")
+        if expr.max_count is not None:
+            lines.append("match_count = 1")
+            loop.append("match_count += 1")
+            loop_header = f"while match_count < {expr.max_count}:"
+        else:
+            loop_header = "while True:"
+        return lines + [
+            "try:",
+            f"    {loop_header}",
+            *_indent(loop, 2),
+            "except (ParseException, IndexError):",
+            "    pass",
+        ]
+
+    def _gen_zero_or_more(self, expr):
+        return [
+            "try:",
+            *_indent(self._gen_one_or_more(expr)),
+            "except (ParseException, IndexError):",
+            f"    tokens = ParseResults([], name={expr.resultsName!r})",
+        ]
+
+    _impl_generators: dict[type, typing.Callable] = {
+        pp.Empty: _gen_empty,
+        pp.NoMatch: _gen_no_match,
+        pp.Literal: _gen_literal,
+        pp.core._SingleCharLiteral: _gen_literal,
+        pp.CaselessLiteral: _gen_caseless_literal,
+        pp.Keyword: _gen_keyword,
+        pp.CaselessKeyword: _gen_keyword,
+        pp.Word: _gen_word,
+        pp.Char: _gen_word,
+        pp.CharsNotIn: _gen_word,
+        pp.White: _gen_word,
+        pp.Regex: _gen_regex,
+        pp.And: _gen_and,
+        pp.MatchFirst: _gen_match_first,
+        pp.Or: _gen_or,
+        pp.ParseElementEnhance: _gen_enhance,
+        pp.TokenConverter: _gen_enhance,
+        pp.Forward: _gen_enhance,
+        pp.DelimitedList: _gen_enhance,
+        pp.Group: _gen_group,
+        pp.Suppress: _gen_suppress,
+        pp.Combine: _gen_combine,
+        pp.FollowedBy: _gen_followed_by,
+        pp.NotAny: _gen_not_any,
+        _FB: _gen_lookahead,
+        pp.Opt: _gen_opt,
+        pp.OneOrMore: _gen_one_or_more,
+        pp.ZeroOrMore: _gen_zero_or_more,
+    }
+
+
+def _raise_unpicklable(constants: list) -> typing.NoReturn:
+    # find the parse action or expression that could not be pickled, for the
+    # error message
+    for value in constants:
+        values = value if isinstance(value, list) else [value]
+        for obj in values:
+            try:
+                pickle.dumps(obj)
+            except Exception as e:
+                if isinstance(obj, ParserElement):
+                    desc = f"expression {_comment(obj)!r}"
+                else:
+                    desc = f"parse action {getattr(obj, '__name__', obj)!r}"
+                raise TypeError(
+                    f"cannot generate parser: {desc} cannot be pickled"
+                    f" ({type(e).__name__}: {e}); parse actions must be functions"
+                    " defined at module level, not lambdas or nested functions"
+                ) from None
+    raise TypeError("cannot generate parser: values cannot be pickled")
+
+
+def generate(
+    expr: ParserElement,
+    *,
+    packrat: typing.Optional[bool] = None,
+    source_name: str = "",
+) -> str:
+    """
+    Generate the source code of a standalone Python module for parsing
+    with ``expr``. The expression is streamlined before generating code,
+    and any parse actions and embedded expressions must be picklable.
+
+    :param expr: the grammar to generate a parser for
+    :param packrat: if ``True``, the generated functions memoize their
+       results, as done by :meth:`ParserElement.enable_packrat`, for grammars
+       that rely on packrat parsing for acceptable performance (such as those
+       using :class:`infix_notation`); the default is to use packrat parsing
+       if it is enabled when the module is generated
+    :param source_name: optional description of where ``expr`` was defined,
+       to include in the header comment of the generated module
+
+    Returns the generated module source as a ``str``.
+    """
+    expr.streamline()
+    for e in expr.ignoreExprs:
+        e.streamline()
+
+    if packrat is None:
+        packrat = ParserElement._packratEnabled
+    gen = _CodeGenerator(packrat)
+    root = gen.compile(expr)
+
+    # preparsing for parse_all, as done by Empty() + StringEnd() in parse_string
+    root_pre = gen.pre_parse(expr, "loc")
+    end_pre = gen.skipper((), ParserElement.DEFAULT_WHITE_CHARS)
+    pre_parse_all = []
+    if root_pre:
+        pre_parse_all.append(f"loc = {root_pre}")
+    if end_pre:
+        pre_parse_all.append(f"loc = {end_pre.format(loc='loc')}")
+
+    # preparsing for scan_string, to always skip whitespace between matches
+    scan_pre = gen.skipper(expr.ignoreExprs, expr.whiteChars)
+    scan_pre_parse = scan_pre.format(loc="loc") if scan_pre else "loc"
+
+    try:
+        constants = pickle.dumps(gen.constants)
+    except Exception:
+        _raise_unpicklable(gen.constants)
+
+    header = [
+        "# This module was generated by pyparsing.tools.codegen"
+        f" (pyparsing {pp.__version__}),",
+        f"# from grammar {ascii(source_name or str(expr))[1:-1][:60]}",
+        "# - do not edit; regenerate from the grammar instead.",
+        "",
+        f"_GENERATED_BY = {pp.__version__!r}",
+        "",
+        _PRELUDE + (_PACKRAT_PRELUDE if packrat else ""),
+    ]
+    if gen.constants:
+        encoded = base64.b85encode(constants).decode("ascii")
+        chunks = [encoded[i : i + 76] for i in range(0, len(encoded), 76)]
+        header.append("_constants = pickle.loads(base64.b85decode(")
+        header += [f"    {chunk!r}" for chunk in chunks]
+        header.append("))")
+    header += gen.header_lines
+
+    expand_tabs = "" if expr.keepTabs else "    instring = instring.expandtabs()\n"
+    entry_points = _PARSE_STRING.format(
+        root=root,
+        expand_tabs=expand_tabs,
+        clear_cache="    _packrat_cache.clear()\n" if packrat else "",
+        pre_parse_all="".join(f"            {line}\n" for line in pre_parse_all),
+        scan_pre_parse=scan_pre_parse,
+    )
+
+    sections = [
+        "\n".join(header),
+        *gen.function_defs,
+        "\n".join(gen.trailer_lines),
+    ]
+    return "\n\n\n".join(s for s in sections if s) + "\n" + entry_points
+
+
+def _load_expression(spec: str) -> ParserElement:
+    import importlib
+
+    module_name, _, attr_path = spec.partition(":")
+    if not module_name or not attr_path:
+        raise ValueError(f"expected 'module:expression', not {spec!r}")
+    obj: typing.Any = importlib.import_module(module_name)
+    for attr in attr_path.split("."):
+        obj = getattr(obj, attr)
+    if not isinstance(obj, ParserElement):
+        raise TypeError(f"{spec} is not a pyparsing ParserElement")
+    return obj
+
+
+def main(args: typing.Optional[list[str]] = None) -> None:
+    import argparse
+    import sys
+
+    argparser = argparse.ArgumentParser(
+        prog="python -m pyparsing.tools.codegen",
+        description=(
+            "Generate a standalone Python parser module from a pyparsing grammar."
+        ),
+    )
+    argparser.add_argument(
+        "expression",
+        help="grammar to generate, given as 'module:expression'"
+        " (for example 'my_package.grammar:program')",
+    )
+    argparser.add_argument(
+        "--output", "-o", help="file to write the generated module (default: stdout)"
+    )
+    argparser.add_argument(
+        "--encoding",
+        default="utf-8",
+        help="encoding of the output file (default: utf-8)",
+    )
+    parsed = argparser.parse_args(args)
+
+    # make modules in the current directory importable, as when running a script
+    sys.path.insert(0, "")
+    source = generate(
+        _load_expression(parsed.expression), source_name=parsed.expression
+    )
+    if parsed.output:
+        with open(parsed.output, "w", encoding=parsed.encoding) as outfile:
+            outfile.write(source)
+    else:
+        sys.stdout.write(source)
+
+
+if __name__ == "__main__":
+    main()
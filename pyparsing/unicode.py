@@ -1,8 +1,13 @@
 # unicode.py
+from __future__ import annotations
 
 import sys
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator, Set
 from itertools import filterfalse
-from typing import Union
+from typing import Callable, Union
+
+from .util import _escape_re_range_char
 
 
 class _lazyclassproperty:
@@ -28,6 +33,273 @@ class _lazyclassproperty:
 UnicodeRangeList = list[Union[tuple[int, int], tuple[int]]]
 
 
+class CharSet(Set):
+    """
+    An immutable set of characters, stored as a sorted list of ranges of
+    code points instead of as a string of all the characters in the set.
+    This makes it practical to define :class:`Word`, :class:`Char`, and
+    :class:`CharsNotIn` expressions using very large character sets, such
+    as the sets in :class:`pyparsing_unicode`, without materializing (and
+    later sorting and re-collapsing) tens of thousands of characters.
+
+    A ``CharSet`` can be created from a string (or any iterable) of
+    characters, from a list of code point ranges, or from a regex-style
+    range string as used by :class:`srange`; ``unicode_set`` classes
+    provide ``CharSet`` versions of their ``alphas``, ``nums``, etc.
+    Set operations (``|``, ``&``, ``-``, and ``+`` as a synonym for
+    ``|``) work on the ranges directly, and accept plain strings as
+    operands.
+
+    Example:
+
+    .. testcode::
+
+        cjk_word = Word(pyparsing_unicode.CJK.alphas_charset)
+        print(cjk_word.parse_string("漢字テスト"))
+
+        hex_digits = CharSet.from_srange("[0-9a-fA-F]")
+        print(hex_digits.regex_class())
+        print((hex_digits - "abcdef").regex_class())
+
+    prints:
+
+    .. testoutput::
+
+        ['漢字テスト']
+        [0-9A-Fa-f]
+        [0-9A-F]
+
+    .. versionadded:: 3.3.3
+    """
+
+    def __init__(self, chars: Union[str, Iterable[str]] = "") -> None:
+        if isinstance(chars, CharSet):
+            self._set_ranges(chars.ranges)
+            return
+
+        ranges: list[tuple[int, int]] = []
+        for c in sorted(set(map(ord, chars))):
+            if ranges and c == ranges[-1][1] + 1:
+                ranges[-1] = (ranges[-1][0], c)
+            else:
+                ranges.append((c, c))
+        self._set_ranges(ranges)
+
+    def _set_ranges(self, ranges: Iterable[tuple[int, int]]) -> None:
+        # ranges must already be sorted, non-overlapping, and non-adjacent
+        self.ranges: tuple[tuple[int, int], ...] = tuple(ranges)
+        self._firsts = [first for first, _ in self.ranges]
+        self._lasts = [last for _, last in self.ranges]
+
+    @classmethod
+    def from_ranges(cls, ranges: UnicodeRangeList) -> CharSet:
+        """
+        Create a ``CharSet`` from a list of code point ranges, given as
+        left- and right-inclusive 2-tuples, or 1-tuples for a single code
+        point (the same form as used for ``unicode_set._ranges``).
+        """
+        merged: list[tuple[int, int]] = []
+        for first, last in sorted((rr[0], rr[-1]) for rr in ranges):
+            if first > last:
+                continue
+            if merged and first <= merged[-1][1] + 1:
+                if last > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], last)
+            else:
+                merged.append((first, last))
+        ret = cls.__new__(cls)
+        ret._set_ranges(merged)
+        return ret
+
+    @classmethod
+    def from_srange(cls, s: str) -> CharSet:
+        """
+        Create a ``CharSet`` from a regex-style range string, using the same
+        syntax as :class:`srange`, such as ``"[a-zA-Z_]"`` or
+        ``"[\\u4e00-\\u9fff]"``, without expanding the ranges into strings.
+        """
+        from .core import _reBracketExpr, ParseResults
+
+        try:
+            parts = _reBracketExpr.parse_string(s).body
+        except Exception:
+            return cls()
+        return cls.from_ranges(
+            [
+                (ord(p[0]), ord(p[1])) if isinstance(p, ParseResults) else (ord(p),)
+                for p in parts
+            ]
+        )
+
+    def filter(self, predicate: Callable[[str], bool]) -> CharSet:
+        """
+        Return a new ``CharSet`` of the characters in this set for which
+        ``predicate`` returns True. The predicate is called for each character,
+        but the result is built as ranges, not as a string.
+        """
+        ranges: list[tuple[int, int]] = []
+        for first, last in self.ranges:
+            run_start = None
+            for c in range(first, last + 1):
+                if predicate(chr(c)):
+                    if run_start is None:
+                        run_start = c
+                elif run_start is not None:
+                    ranges.append((run_start, c - 1))
+                    run_start = None
+            if run_start is not None:
+                ranges.append((run_start, last))
+        ret = type(self).__new__(type(self))
+        ret._set_ranges(ranges)
+        return ret
+
+    def regex_class(self) -> str:
+        """
+        Return a regular expression character class (such as ``"[a-z_]"``)
+        that matches any character in this set.
+        """
+        return f"[{self._collapsed_ranges()}]"
+
+    def _collapsed_ranges(self, re_escape: bool = True) -> str:
+        # same form as util._collapse_string_to_ranges, but built from the ranges
+        escape: Callable[[str], str] = (
+            _escape_re_range_char if re_escape else lambda c: c
+        )
+        parts = []
+        for first, last in self.ranges:
+            if first == last:
+                parts.append(escape(chr(first)))
+            elif first + 1 == last:
+                parts.append(escape(chr(first)) + escape(chr(last)))
+            else:
+                parts.append(f"{escape(chr(first))}-{escape(chr(last))}")
+        return "".join(parts)
+
+    @staticmethod
+    def _coerce(other) -> CharSet:
+        return other if isinstance(other, CharSet) else CharSet(other)
+
+    def union(self, *others: Union[str, Iterable[str]]) -> CharSet:
+        """Return a new ``CharSet`` of the characters in this set or in any of ``others``."""
+        ranges = list(self.ranges)
+        for other in others:
+            ranges.extend(self._coerce(other).ranges)
+        return CharSet.from_ranges(ranges)
+
+    def intersection(self, other: Union[str, Iterable[str]]) -> CharSet:
+        """Return a new ``CharSet`` of the characters in both this set and ``other``."""
+        other_ranges = self._coerce(other).ranges
+        ranges: list[tuple[int, int]] = []
+        i = j = 0
+        while i < len(self.ranges) and j < len(other_ranges):
+            first = max(self.ranges[i][0], other_ranges[j][0])
+            last = min(self.ranges[i][1], other_ranges[j][1])
+            if first <= last:
+                ranges.append((first, last))
+            if self.ranges[i][1] < other_ranges[j][1]:
+                i += 1
+            else:
+                j += 1
+        ret = CharSet.__new__(CharSet)
+        ret._set_ranges(ranges)
+        return ret
+
+    def difference(self, other: Union[str, Iterable[str]]) -> CharSet:
+        """Return a new ``CharSet`` of the characters in this set but not in ``other``."""
+        other_ranges = self._coerce(other).ranges
+        ranges: list[tuple[int, int]] = []
+        j = 0
+        for first, last in self.ranges:
+            while j < len(other_ranges) and other_ranges[j][1] < first:
+                j += 1
+            k = j
+            while k < len(other_ranges) and other_ranges[k][0] <= last:
+                if other_ranges[k][0] > first:
+                    ranges.append((first, other_ranges[k][0] - 1))
+                first = max(first, other_ranges[k][1] + 1)
+                k += 1
+            if first <= last:
+                ranges.append((first, last))
+        ret = CharSet.__new__(CharSet)
+        ret._set_ranges(ranges)
+        return ret
+
+    def __or__(self, other):
+        if not isinstance(other, (str, Iterable)):
+            return NotImplemented
+        return self.union(other)
+
+    def __and__(self, other):
+        if not isinstance(other, (str, Iterable)):
+            return NotImplemented
+        return self.intersection(other)
+
+    def __sub__(self, other):
+        if not isinstance(other, (str, Iterable)):
+            return NotImplemented
+        return self.difference(other)
+
+    def __rsub__(self, other):
+        if not isinstance(other, (str, Iterable)):
+            return NotImplemented
+        return CharSet(other).difference(self)
+
+    __ror__ = __or__
+    __rand__ = __and__
+    # support "+" so that CharSets can be combined with strings the same way
+    # as the alphas, nums, etc. strings
+    __add__ = __or__
+    __radd__ = __or__
+
+    def __contains__(self, c) -> bool:
+        if not isinstance(c, str) or len(c) != 1:
+            return False
+        code = ord(c)
+        i = bisect_right(self._firsts, code) - 1
+        return i >= 0 and code <= self._lasts[i]
+
+    def __iter__(self) -> Iterator[str]:
+        for first, last in self.ranges:
+            yield from map(chr, range(first, last + 1))
+
+    def __len__(self) -> int:
+        return sum(last - first + 1 for first, last in self.ranges)
+
+    def __bool__(self) -> bool:
+        return bool(self.ranges)
+
+    def __le__(self, other) -> bool:
+        if isinstance(other, CharSet):
+            return not self.difference(other)
+        return super().__le__(other)
+
+    def __ge__(self, other) -> bool:
+        if isinstance(other, CharSet):
+            return not other.difference(self)
+        return super().__ge__(other)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, CharSet):
+            return self.ranges == other.ranges
+        if isinstance(other, Set):
+            return self.ranges == CharSet(other).ranges
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        # CharSets are immutable, so the hash only needs to be computed once
+        try:
+            return self._hash_value
+        except AttributeError:
+            self._hash_value: int = hash(self.ranges)
+            return self._hash_value
+
+    def __str__(self) -> str:
+        return "".join(self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}.from_ranges({list(self.ranges)!r})"
+
+
 class unicode_set:
     """
     A set of Unicode characters, for language-specific strings for
@@ -117,7 +389,58 @@ class unicode_set:
         """
         from pyparsing import Word
 
-        return Word(cls.identchars, cls.identbodychars)
+        return Word(cls.identchars_charset, cls.identbodychars_charset)
+
+    # CharSet versions of the character strings above, built directly from
+    # the code point ranges without materializing the characters as strings
+
+    @_lazyclassproperty
+    def charset(cls) -> CharSet:
+        """:class:`CharSet` of all characters in this range"""
+        ranges: UnicodeRangeList = []
+        for cc in cls.__mro__:  # type: ignore[attr-defined]
+            if cc is unicode_set:
+                break
+            ranges.extend(getattr(cc, "_ranges", ()))
+        return CharSet.from_ranges(ranges)
+
+    @_lazyclassproperty
+    def printables_charset(cls) -> CharSet:
+        """:class:`CharSet` of all non-whitespace characters in this range"""
+        return cls.charset.filter(lambda c: not c.isspace())
+
+    @_lazyclassproperty
+    def alphas_charset(cls) -> CharSet:
+        """:class:`CharSet` of all alphabetic characters in this range"""
+        return cls.charset.filter(str.isalpha)
+
+    @_lazyclassproperty
+    def nums_charset(cls) -> CharSet:
+        """:class:`CharSet` of all numeric digit characters in this range"""
+        return cls.charset.filter(str.isdigit)
+
+    @_lazyclassproperty
+    def alphanums_charset(cls) -> CharSet:
+        """:class:`CharSet` of all alphanumeric characters in this range"""
+        return cls.alphas_charset | cls.nums_charset
+
+    @_lazyclassproperty
+    def identchars_charset(cls) -> CharSet:
+        """:class:`CharSet` of the characters in :attr:`identchars`"""
+        return cls.charset.filter(str.isidentifier) | (
+            "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyzªµº"
+            "ÀÁÂÃÄÅÆÇÈÉÊËÌÍÎÏÐÑÒÓÔÕÖØÙÚÛÜÝÞßàáâãäåæçèéêëìíîïðñòóôõöøùúûüýþÿ"
+            "_"
+        )
+
+    @_lazyclassproperty
+    def identbodychars_charset(cls) -> CharSet:
+        """:class:`CharSet` of the characters in :attr:`identbodychars`"""
+        return (
+            cls.charset.filter(lambda c: f"_{c}".isidentifier())
+            | cls.identchars_charset
+            | "0123456789·"
+        )
 
 
 class pyparsing_unicode(unicode_set):
@@ -29,6 +29,26 @@ def bench(
     return name, mean, stdev, times
 
 
+def bench_memory(name: str, fn: Callable[[], object]) -> tuple[str, float, float]:
+    # trace the memory allocated while running fn, reporting both the memory
+    # still held by its return value and the peak while it was running, in KiB
+    import tracemalloc
+
+    fn()
+
+    tracemalloc.start()
+    try:
+        retained = fn()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del retained
+
+    print(f"{name}_retained_kib,{current / 1024:.1f},0.0,1")
+    print(f"{name}_peak_kib,{peak / 1024:.1f},0.0,1")
+    return name, current / 1024, peak / 1024
+
+
 def with_packrat(enabled: bool):
     pp.ParserElement.disable_memoization()
     if enabled:
@@ -142,7 +162,7 @@ def arithmetic_grammar_left_recursive():
     return E
 
 
-def arithmetic_grammar_non_recursive():
+def arithmetic_grammar_non_recursive(engine="default"):
     integer = pp.Word(pp.nums)#.add_parse_action(lambda t: int(t[0]))
     expr = pp.infix_notation(
         integer,
@@ -153,6 +173,7 @@ def arithmetic_grammar_non_recursive():
             (pp.one_of("* / %"), 2, pp.OpAssoc.LEFT),
             (pp.one_of("+ -"), 2, pp.OpAssoc.LEFT),
         ],
+        engine=engine,
     )
     return expr
 
@@ -193,12 +214,12 @@ def bench_csv_parse(rows=3000, cols=8):
     return run
 
 
-def bench_expr_parse(n_terms=200, use_left_recursion=False):
+def bench_expr_parse(n_terms=200, use_left_recursion=False, engine="default"):
     text = gen_expr_sequence(n_terms)
     if use_left_recursion:
         g = arithmetic_grammar_left_recursive()
     else:
-        g = arithmetic_grammar_non_recursive()
+        g = arithmetic_grammar_non_recursive(engine)
 
     def run():
         g.parse_string(text, parse_all=True)
@@ -232,6 +253,203 @@ def bench_transform_upper(n_lines=20000):
     return run
 
 
+def bench_search_sparse(n_lines=20000):
+    # search_string for a pattern that only occurs in a few lines, so that
+    # most locations in the input cannot start a match
+    text = gen_log(n_lines)
+    g = pp.Literal("[ERROR] message_99") + pp.Word(pp.nums)
+
+    def run():
+        g.search_string(text)
+
+    return run
+
+
+def bench_skip_to(n_lines=20000):
+    # SkipTo over a large unstructured section, ignoring quoted strings
+    text = gen_log(n_lines) + "\nEND 42"
+    g = pp.SkipTo(pp.Keyword("END"), ignore=pp.quoted_string) + "END" + pp.Word(pp.nums)
+
+    def run():
+        g.parse_string(text)
+
+    return run
+
+
+def bench_nested_block(n_stmts=2000, as_string=False):
+    # skip over a large C-like code block containing nested blocks, and
+    # quoted strings and comments containing braces
+    body = "\n".join(
+        f'    if (x > {i}) {{ y = "}}" + foo({i}); /* }} */ }}' for i in range(n_stmts)
+    )
+    text = f"{{\n{body}\n}}"
+    g = pp.NestedBlock("{", "}", pp.quoted_string | pp.c_style_comment, as_string=as_string)
+
+    def run():
+        g.parse_string(text)
+
+    return run
+
+
+def bench_indented_block(n_blocks=1000):
+    # Python-like source with many nested indented blocks
+    lines = []
+    for i in range(n_blocks):
+        lines += [f"def f{i}:", f"    x = {i}", "    if x:", "        y = x", "    z = 1"]
+    text = "\n".join(lines)
+
+    stmt = pp.Forward()
+    assignment = pp.Word(pp.alphas) + "=" + pp.Word(pp.alphanums)
+    compound = pp.Group(
+        pp.Word(pp.alphas) + pp.Word(pp.alphanums) + ":" + pp.IndentedBlock(stmt)
+    )
+    stmt <<= pp.Group(assignment) | compound
+    g = stmt[1, ...]
+
+    def run():
+        g.parse_string(text, parse_all=True)
+
+    return run
+
+
+def bench_each(n_options=20, n_stanzas=200, seed=5):
+    # config stanzas with many options given in any order
+    rnd = random.Random(seed)
+    names = [f"option{i}" for i in range(n_options)]
+    value = pp.Word(pp.alphanums + "_.")
+    options = [pp.Keyword(name) + pp.Suppress("=") + value(name) for name in names]
+    stanza = pp.Group(
+        pp.Keyword("section")
+        + pp.Word(pp.alphanums)
+        + pp.Each(options[:3] + [pp.Opt(opt) for opt in options[3:]])
+        + pp.Keyword("end")
+    )
+    g = stanza[1, ...]
+
+    stanzas = []
+    for i in range(n_stanzas):
+        given = names[:3] + rnd.sample(names[3:], rnd.randint(0, n_options - 3))
+        rnd.shuffle(given)
+        body = "\n".join(f"  {name} = value_{i}" for name in given)
+        stanzas.append(f"section s{i}\n{body}\nend")
+    text = "\n".join(stanzas)
+
+    def run():
+        g.parse_string(text, parse_all=True)
+
+    return run
+
+
+def bench_delimited_list(n_items=20000, with_actions=False):
+    # one long comma-separated list of identifiers or integers
+    if with_actions:
+        g = pp.DelimitedList(pp.pyparsing_common.integer)
+        text = ", ".join(str(i) for i in range(n_items))
+    else:
+        g = pp.DelimitedList(pp.Word(pp.alphas, pp.alphanums))
+        text = ", ".join(f"field{i}" for i in range(n_items))
+
+    def run():
+        g.parse_string(text, parse_all=True)
+
+    return run
+
+
+def bench_close_match_scan(n_chars=100000, allow_indels=False, seed=7):
+    # scan a long random DNA sequence for close matches of a short sequence
+    rnd = random.Random(seed)
+    text = "".join(rnd.choice("ACGT") for _ in range(n_chars))
+    g = pp.CloseMatch("TTAAATCTAGAAGAT", 3, allow_indels=allow_indels)
+
+    def run():
+        for _ in g.scan_string(text, overlap=True):
+            pass
+
+    return run
+
+
+def bench_quoted_strings(n_strings=5000, lazy_unquote=False, seed=8):
+    # quoted strings, some with escapes, parsed as key-value pairs or as
+    # plain values; plain values are parsed twice, backtracking from the pair
+    rnd = random.Random(seed)
+    qs = pp.QuotedString('"', esc_char="\\", lazy_unquote=lazy_unquote)
+    g = (pp.Group(qs + ":" + qs) | qs)[...]
+    words = "alpha beta gamma delta epsilon zeta eta theta iota kappa lambda mu".split()
+    words += [r"tab\there", r"say \"hi\""]
+    text = " ".join(
+        '"{}"'.format(" ".join(rnd.choices(words, k=4)))
+        + (': "{}"'.format(rnd.choice(words)) if rnd.random() < 0.3 else "")
+        for _ in range(n_strings)
+    )
+
+    def run():
+        g.parse_string(text)
+
+    return run
+
+
+def bench_numbers(n_vals=20000, expr="number", seed=9):
+    # comma-separated numbers of all numeric forms
+    rnd = random.Random(seed)
+    forms = [
+        lambda: str(rnd.randint(-1000, 1000)),
+        lambda: f"{rnd.uniform(-1000, 1000):.4f}",
+        lambda: f"{rnd.uniform(-1, 1):.3e}",
+    ]
+    text = ", ".join(rnd.choice(forms)() for _ in range(n_vals))
+    if expr == "array":
+        g = pp.pyparsing_common.fast_number_array()
+    else:
+        g = pp.DelimitedList(getattr(pp.pyparsing_common, expr))
+
+    def run():
+        g.parse_string(text)
+
+    return run
+
+
+def bench_html_tags(n_rows=2000, with_class=False, seed=10):
+    # scan a generated HTML table for links, or for cells with a given class
+    rnd = random.Random(seed)
+    rows = []
+    for i in range(n_rows):
+        cls = rnd.choice(["odd", "even", "total"])
+        rows.append(
+            f'<tr id="row{i}" class="{cls}"><td class="{cls}" align=right>{i}</td>'
+            f'<td><a href="https://example.com/{i}" target=_blank>link {i}</a>'
+            f"<br/></td></tr>"
+        )
+    html = "<html><body><table>\n" + "\n".join(rows) + "\n</table></body></html>"
+    if with_class:
+        td, td_end = pp.make_html_tags("td")
+        g = td().add_parse_action(pp.with_class("total")) + pp.SkipTo(td_end) + td_end
+    else:
+        a, a_end = pp.make_html_tags("a")
+        g = a + pp.SkipTo(a_end)("text") + a_end
+
+    def run():
+        for _ in g.scan_string(html):
+            pass
+
+    return run
+
+
+def bench_parse_results_memory(n_rows=5000, seed=11):
+    # parse and keep many small grouped results, most of them without names
+    rnd = random.Random(seed)
+    text = "\n".join(
+        f"{rnd.choice(['INFO', 'WARN', 'ERROR'])} {rnd.randint(0, 10_000)} x{i}"
+        for i in range(n_rows)
+    )
+    level = pp.one_of("INFO WARN ERROR")
+    g = pp.Group(pp.Group(level + pp.Word(pp.nums)) + pp.Word(pp.alphanums))[...]
+
+    def run():
+        return g.parse_string(text, parse_all=True)
+
+    return run
+
+
 def bench_matchfirst_vs_or(n_alts=2000, seed=4):
     rnd = random.Random(seed)
     # create many similar alternatives to stress dispatch
@@ -262,6 +480,20 @@ def bench_results_accumulator(n_vals: int = 1000, modal: bool = False, seed: int
     return run
 
 
+def bench_import_time():
+    # import pyparsing in a fresh interpreter each time, so that the cost of
+    # building module-level expressions is included
+    import subprocess
+    import sys
+
+    cmd = [sys.executable, "-c", "import pyparsing"]
+
+    def run():
+        subprocess.run(cmd, check=True)
+
+    return run
+
+
 def bench_packrat_effect(base_fn_factory: Callable[[], Callable[[], None]]):
     def run_packrat_on():
         with_packrat(True)
@@ -329,6 +561,52 @@ def main():
         bench("results_name_accumulator_modal", bench_results_accumulator(modal=True))
         bench("results_name_accumulator_nonmodal", bench_results_accumulator(modal=False))
 
+        # 9) Import time (fresh interpreter per run)
+        bench("import_pyparsing", bench_import_time(), iters=10)
+
+        # 10) search_string for sparse matches
+        bench("search_sparse", bench_search_sparse())
+
+        # 11) SkipTo over a large section
+        bench("skip_to", bench_skip_to())
+
+        # 12) Expression parse via infix_notation(engine="pratt") (packrat off)
+        bench("expr_pratt", bench_expr_parse(engine="pratt"))
+
+        # 13) NestedBlock over a large code block
+        bench("nested_block", bench_nested_block())
+        bench("nested_block_as_string", bench_nested_block(as_string=True))
+
+        # 14) IndentedBlock over many nested blocks
+        bench("indented_block", bench_indented_block())
+
+        # 15) Each with many unordered options
+        bench("each_many", bench_each())
+
+        # 16) DelimitedList of simple tokens, and of tokens with parse actions
+        bench("delimited_list", bench_delimited_list())
+        bench("delimited_list_actions", bench_delimited_list(with_actions=True))
+
+        # 17) Scanning for CloseMatch matches, with and without insertions/deletions
+        bench("close_match_scan", bench_close_match_scan())
+        bench("close_match_scan_indels", bench_close_match_scan(allow_indels=True))
+
+        # 18) QuotedStrings with and without escapes, with eager and lazy unquoting
+        bench("quoted_strings", bench_quoted_strings())
+        bench("quoted_strings_lazy", bench_quoted_strings(lazy_unquote=True))
+
+        # 19) Lists of numbers, parsed with number, fast_number, and fast_number_array
+        bench("numbers", bench_numbers())
+        bench("numbers_fast_number", bench_numbers(expr="fast_number"))
+        bench("numbers_array", bench_numbers(expr="array"))
+
+        # 20) Scanning HTML for tags, and for tags with a given class
+        bench("html_tags", bench_html_tags())
+        bench("html_tags_with_class", bench_html_tags(with_class=True))
+
+        # 21) Memory allocated for parse results, measured with tracemalloc
+        bench_memory("parse_results_memory", bench_parse_results_memory())
+
     elapsed = time.perf_counter() - start
     print(f"\aTotal elapsed: {str(timedelta(seconds=elapsed))[:-5]}")
 
@@ -0,0 +1,187 @@
+import importlib.util
+import itertools
+
+import pytest
+
+import pyparsing as pp
+from pyparsing.tools.codegen import generate, main
+
+ppc = pp.pyparsing_common
+
+_module_counter = itertools.count()
+
+
+def load_module(path):
+    spec = importlib.util.spec_from_file_location(f"generated_{next(_module_counter)}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_generated(expr, tmp_path, **kwargs):
+    path = tmp_path / "generated_parser.py"
+    path.write_text(generate(expr, **kwargs), encoding="utf-8")
+    return load_module(path)
+
+
+def parse_outcome(parse_fn, instring):
+    try:
+        result = parse_fn(instring, parse_all=True)
+    except pp.ParseBaseException as pe:
+        return type(pe).__name__, str(pe)
+    return result.as_list(), result.as_dict()
+
+
+def make_grammars():
+    from examples.jsonParser import jsonObject
+
+    ident = pp.Word(pp.alphas + "_", pp.alphanums + "_")
+    let_stmt = pp.Group(
+        pp.Keyword("let")
+        + ident("name")
+        + "="
+        + (ppc.number | pp.quoted_string)("value")
+        + pp.Opt(";", default=";")
+    )
+    nested_list = pp.Forward()
+    nested_list <<= pp.Group(
+        pp.Suppress("[") + pp.DelimitedList(nested_list | ppc.integer) + pp.Suppress("]")
+    )
+
+    return [
+        (
+            jsonObject,
+            ['{"a": [1, 2.5, "x", true, null], "b": {"c": -3e2}}', '{"a": }'],
+        ),
+        (
+            let_stmt[1, ...].ignore(pp.python_style_comment),
+            ["let x = 1; # comment\nlet y='s'", "let x = 1 let", "letx = 1"],
+        ),
+        (nested_list, ["[1, [2, 3], [[4]]]", "[1, [2,]"]),
+        (
+            pp.Combine(pp.Word(pp.nums) + "." + pp.Word(pp.nums))("real")
+            | pp.CaselessKeyword("inf"),
+            ["1.5", "INF", "inf2"],
+        ),
+        (
+            (pp.Word(pp.alphas) ^ pp.Word(pp.alphanums))
+            + pp.Char(",")[...]
+            + pp.Regex(r"(?P<num>\d+)"),
+            ["abc1, 2", "ab,,3", "ab 3 4"],
+        ),
+        (
+            pp.OneOrMore(pp.Word(pp.nums), stop_on="end", max=3) - pp.Literal("end"),
+            ["1 2 end", "1 2 3 4 end", "1 x"],
+        ),
+        (
+            pp.ZeroOrMore(pp.Word(pp.nums))("nums")
+            + pp.Opt(pp.Word(pp.alphas)("word"), default="none")
+            + pp.Dict(pp.Group(pp.Word(pp.alphas) + ":" + pp.Word(pp.nums))[...]),
+            ["1 2 a x:1 y:2", "b", ""],
+        ),
+        (
+            ~pp.Literal("x")
+            + pp.FollowedBy(pp.Word(pp.alphas)("first"))
+            + pp.Word(pp.alphas)
+            + pp.SkipTo("end")
+            + "end",
+            ["abc def end", "xbc end"],
+        ),
+    ]
+
+
+@pytest.mark.parametrize("expr, instrings", make_grammars())
+def test_generated_parser_matches_grammar(expr, instrings, tmp_path):
+    generated = load_generated(expr, tmp_path)
+    for instring in instrings:
+        assert parse_outcome(generated.parse_string, instring) == parse_outcome(
+            expr.parse_string, instring
+        ), instring
+
+
+def test_generated_parser_returns_parse_results(tmp_path):
+    expr = ppc.integer("value")
+    generated = load_generated(expr, tmp_path)
+
+    result = generated.parse_string("  42  ")
+    assert isinstance(result, pp.ParseResults)
+    assert result.value == 42
+
+    with pytest.raises(pp.ParseException):
+        generated.parse_string("abc")
+
+
+def test_generated_scan_string(tmp_path):
+    expr = pp.Word(pp.nums)("num") + pp.Opt(pp.Word(pp.alphas))
+    instring = "12 ab, 3; 456 c"
+    generated = load_generated(expr, tmp_path)
+
+    assert [
+        (tokens.as_list(), start, end)
+        for tokens, start, end in generated.scan_string(instring)
+    ] == [(tokens.as_list(), start, end) for tokens, start, end in expr.scan_string(instring)]
+    assert len(list(generated.scan_string(instring, max_matches=2))) == 2
+
+
+def test_generated_packrat_parser(tmp_path):
+    operand = ppc.integer | pp.Word(pp.alphas)
+    expr = pp.infix_notation(
+        operand,
+        [
+            ("-", 1, pp.OpAssoc.RIGHT),
+            (pp.one_of("* /"), 2, pp.OpAssoc.LEFT),
+            (pp.one_of("+ -"), 2, pp.OpAssoc.LEFT),
+        ],
+    )
+    generated = load_generated(expr, tmp_path, packrat=True)
+    assert "_packrat(" in (tmp_path / "generated_parser.py").read_text(encoding="utf-8")
+
+    for instring in ["1 + 2 * -x", "((a + b) * (c - 4)) / 2", "1 +"]:
+        assert parse_outcome(generated.parse_string, instring) == parse_outcome(
+            expr.parse_string, instring
+        )
+
+
+def test_generate_unpicklable_parse_action():
+    expr = pp.Word(pp.nums).add_parse_action(lambda t: int(t[0]))
+    with pytest.raises(TypeError, match="parse action '<lambda>'.*module level"):
+        generate(expr)
+
+
+def test_generate_command_line(tmp_path):
+    from examples.jsonParser import jsonObject
+
+    output = tmp_path / "json_parser.py"
+    main(["examples.jsonParser:jsonObject", "--output", str(output)])
+    generated = load_module(output)
+
+    instring = '{"name": "pyparsing", "tags": ["parsing", 3.14]}'
+    assert parse_outcome(generated.parse_string, instring) == parse_outcome(
+        jsonObject.parse_string, instring
+    )
+
+
+def test_generated_parser_parse_action_index_error(tmp_path):
+    from operator import itemgetter
+
+    expr = pp.Word(pp.nums).add_parse_action(itemgetter(5)) | pp.Word(pp.alphas)
+    generated = load_generated(expr, tmp_path)
+
+    assert generated.parse_string("abc").as_list() == ["abc"]
+    # an IndexError raised by a parse action is raised, not taken as a failed match
+    with pytest.raises(IndexError):
+        generated.parse_string("123")
+
+
+def test_generated_module_checks_pyparsing_version(tmp_path):
+    source = generate(ppc.integer + pp.Word(pp.alphas).add_parse_action(ppc.upcase_tokens))
+    imports = [line for line in source.splitlines() if line.startswith(("from ", "import "))]
+    assert not any("pyparsing.core" in line for line in imports)
+
+    path = tmp_path / "generated_parser.py"
+    path.write_text(
+        source.replace(f"_GENERATED_BY = {pp.__version__!r}", "_GENERATED_BY = '3.0.0'"),
+        encoding="utf-8",
+    )
+    with pytest.raises(ImportError, match="generated by pyparsing 3.0.0.*regenerate"):
+        load_module(path)
@@ -1782,6 +1782,26 @@ class Test02_WithoutPackrat(ppt.TestParseResultsAsserts, TestCase):
             msg=f"Incorrect list for attribute pred, {queryRes.pred.as_list()}",
         )
 
+    def testParseExpressionResultsAccumulateAfterBacktracking(self):
+        # the results of an And or repetition that fails partway must not leave
+        # names behind in results that are reused (as from the packrat cache)
+        # when the same expressions are retried in another alternative
+        item = pp.Word(pp.alphas)("word*") + pp.Word(pp.nums)("num")
+        expr = (item + item + "?") | (item + item + "!")
+        self.assertParseAndCheckDict(
+            expr, "a 1 b 2 !", {"word": ["a", "b"], "num": "2"}
+        )
+
+        expr = (item[1, ...] + "?") | (item[1, ...] + "!")
+        self.assertParseAndCheckDict(
+            expr, "a 1 b 2 c 3 !", {"word": ["a", "b", "c"], "num": "3"}
+        )
+
+        expr = (pp.DelimitedList(item) + "?") | (pp.DelimitedList(item) + "!")
+        self.assertParseAndCheckDict(
+            expr, "a 1, b 2 !", {"word": ["a", "b"], "num": "2"}
+        )
+
     def testReStringRange(self):
         testCases = (
             r"[A-Z]",
@@ -2046,6 +2066,67 @@ class Test02_WithoutPackrat(ppt.TestParseResultsAsserts, TestCase):
         # pyparsing 3.1.0 -> ['*', '', '*']
         self.assertParseAndCheckList(expr, "*a_*_a*", ["*", "a_*_a", "*"])
 
+    def testSkipToJumpsToPossibleMatches(self):
+        text = "lorem 'END' ipsum /* END */ dolor # sit\n" * 50 + "END 42"
+        first_end = text.index("END")
+        last_end = text.index("END 42")
+        for target, expected_skip_len in [
+            ("END", first_end),
+            (pp.Keyword("END"), first_end),
+            (pp.one_of("END STOP"), first_end),
+            (pp.one_of("END STOP", engine="trie"), first_end),
+            (pp.Regex(r"E\w+ \d+"), last_end),
+            (pp.Literal("END") + pp.Word(pp.nums), last_end),
+        ]:
+            with self.subTest(target=target):
+                skip = pp.SkipTo(target)
+                self.assertEqual(expected_skip_len, len(skip.parse_string(text)[0]))
+
+                skip_ignoring = pp.SkipTo(target, ignore=pp.quoted_string)
+                skip_ignoring.ignore(pp.c_style_comment)
+                self.assertEqual(last_end, len(skip_ignoring.parse_string(text)[0]))
+
+                skip_failing = pp.SkipTo(target, ignore=pp.quoted_string, fail_on="/*")
+                self.assertEqual(
+                    text.index(" /*"), len(skip_failing.parse_string(text)[0])
+                )
+
+        self.assertParseAndCheckList(
+            pp.SkipTo(pp.Literal("END") + pp.Word(pp.nums), include=True),
+            "x END y END 42",
+            ["x END y ", "END", "42"],
+        )
+
+        # ignore expressions added to a copy do not affect the original
+        skip = pp.SkipTo("END")
+        skip_copy = skip.copy().ignore(pp.quoted_string)
+        self.assertEqual("x 'END' ", skip_copy.parse_string("x 'END' END")[0])
+        self.assertEqual("x '", skip.parse_string("x 'END' END")[0])
+
+        # caseless targets that start with a non-ASCII character
+        text = "lorem ipsum dolor " * 10 + "ÉLAN"
+        for target in [pp.CaselessLiteral("élan"), pp.CaselessKeyword("élan")]:
+            with self.subTest(target=target):
+                self.assertParseAndCheckList(
+                    pp.SkipTo(target, include=True),
+                    text,
+                    [text[: text.index("ÉLAN")], "élan"],
+                    verbose=False,
+                )
+
+        # Located targets skip whitespace before the match
+        skip = pp.SkipTo(pp.Located(pp.Literal("abc")))
+        self.assertEqual(["xx"], skip.parse_string("xx abc").as_list())
+        skip = pp.Literal("s") + pp.SkipTo(pp.Located(pp.Word(pp.nums)))
+        self.assertEqual(["s", "abc"], skip.parse_string("s abc 12").as_list())
+
+        # targets whose contents change while parsing
+        first = pp.Word(pp.alphas)
+        second = pp.match_previous_literal(first)
+        grammar = first + pp.SkipTo(second) + second
+        self.assertParseAndCheckList(grammar, "abc 1 2 abc", ["abc", "1 2 ", "abc"])
+        self.assertParseAndCheckList(grammar, "def 3 4 def", ["def", "3 4 ", "def"])
+
     def testEllipsisRepetition(self):
         word = pp.Word(pp.alphas).set_name("word")
         num = pp.Word(pp.nums).set_name("num")
@@ -3122,6 +3203,78 @@ class Test02_WithoutPackrat(ppt.TestParseResultsAsserts, TestCase):
 
         # fmt: on
 
+    def testInfixNotationPrattEngine(self):
+        count = 0
+
+        def evaluate_int(t):
+            nonlocal count
+            count += 1
+            return int(t[0])
+
+        def not_equal_operands(t):
+            return t[0][0] != t[0][2]
+
+        operand = pp.Word(pp.nums).add_parse_action(evaluate_int) | ppc.identifier
+        # fmt: off
+        op_list = [
+            ("!", 1, pp.OpAssoc.LEFT),
+            ("-", 1, pp.OpAssoc.RIGHT),
+            ("**", 2, pp.OpAssoc.RIGHT),
+            (pp.one_of("* /"), 2, pp.OpAssoc.LEFT, lambda t: ["mul", *t[0]]),
+            ("==", 2, pp.OpAssoc.LEFT, pp.condition_as_parse_action(not_equal_operands)),
+            (("?", ":"), 3, pp.OpAssoc.RIGHT),
+        ]
+        # fmt: on
+        default_expr = pp.infix_notation(operand, op_list)
+        pratt_expr = pp.infix_notation(operand, op_list, engine="pratt")
+
+        tests = [
+            "1",
+            "-x!",
+            "--2 ** 3 ** -y",
+            "2 * y / -4",
+            "(1 * 2) / (3!)",
+            "a == b ? 1 : c ? 2 : 3",
+            "1 * 2 *",
+        ]
+        for test in tests:
+            with self.subTest(test=test):
+                self.assertEqual(
+                    default_expr.parse_string(test).as_list(),
+                    pratt_expr.parse_string(test).as_list(),
+                )
+
+        # syntax errors are reported at the same locations, using the names of
+        # the precedence levels
+        error_tests = [
+            ("", 0, "Expected ?: operations"),
+            ("*", 0, "Expected ?: operations"),
+            ("-", 1, "Expected '-' operations"),
+            ("1 ? 2", 2, "Expected end of text"),
+            ("- (x ** )", 5, "Expected ')'"),
+        ]
+        for test, loc, msg in error_tests:
+            for expr in (default_expr, pratt_expr):
+                with self.subTest(test=test, expr=expr):
+                    try:
+                        expr.parse_string(test, parse_all=True)
+                    except pp.ParseException as pe:
+                        self.assertEqual((loc, msg), (pe.loc, pe.msg))
+                    else:
+                        self.fail(f"failed to raise exception parsing {test!r}")
+
+        # operation rejected by the condition parse action
+        self.assertEqual(["a"], pratt_expr.parse_string("a == a").as_list())
+
+        # each operand is only parsed once
+        count = 0
+        test = " * ".join(f"({i} ** -x / {i})" for i in range(50))
+        pratt_expr.parse_string(test, parse_all=True)
+        self.assertEqual(100, count)
+
+        with self.assertRaises(ValueError):
+            pp.infix_notation(operand, op_list, engine="unknown")
+
     def testParseResultsPickle(self):
         import pickle
 
@@ -4354,6 +4507,33 @@ class Test02_WithoutPackrat(ppt.TestParseResultsAsserts, TestCase):
         del r2[0]
         self.assertEqual("b", r2.get_name())
 
+    def testParseResultsUnnamedResultsAreIndependent(self):
+        # results without names share a read-only empty names table, so adding
+        # a name to one of them must not add it to any other
+        expr = pp.Group(pp.Word(pp.alphas) + pp.Word(pp.nums))[...]
+        result = expr.parse_string("a 1 b 2")
+        first, second = result
+        self.assertFalse(first.haskeys())
+
+        first["label"] = "x"
+        self.assertEqual({"label": "x"}, first.as_dict())
+        self.assertEqual({}, second.as_dict())
+        self.assertEqual({}, result.as_dict())
+
+        r2 = second.copy()
+        r2["label"] = "y"
+        r2 += pp.ParseResults(["3"], name="num", aslist=False, modal=False)
+        self.assertEqual({"label": "y", "num": ["3"]}, r2.as_dict())
+        self.assertEqual({}, second.as_dict())
+        self.assertFalse(pp.ParseResults([]).haskeys())
+
+        first.clear()
+        self.assertFalse(first)
+        first["label"] = "z"
+        self.assertEqual({"label": "z"}, first.as_dict())
+        with self.assertRaises(KeyError):
+            del second["label"]
+
     def testParseResultsDeepcopy(self):
         expr = (
             pp.Word(pp.nums)
@@ -4560,6 +4740,55 @@ class Test02_WithoutPackrat(ppt.TestParseResultsAsserts, TestCase):
             else:
                 print("BAD!!!")
 
+    def testParseHTMLTagsMatchGrammar(self):
+        # tags matched using the tag regex must give the same results and
+        # exceptions as the tag grammar
+        def parse_outcome(expr, instring):
+            try:
+                result = expr.parse_string(instring)
+            except pp.ParseException as pe:
+                return str(pe)
+            return result.as_list(), result.as_dict(), result.dump()
+
+        tests = [
+            "<a>",
+            "<A HREF='x' Target=_blank checked>",
+            '< a href = "x" / >',
+            '<a href="a""b" data-x:y=1/>',
+            "<a b=c/>",
+            "<ab>",
+            "<a-b>",
+            '<a href="x>',
+            '<a href=x tag="q">',
+            "<a href=>",
+            "<ns:tag x='1'>",
+        ]
+        html_a = pp.make_html_tags("a")[0]
+        xml_a = pp.make_xml_tags("a")[0]
+        for open_tag in [
+            html_a,
+            xml_a,
+            pp.any_open_tag,
+            html_a().add_parse_action(pp.with_attribute(href="x")),
+            html_a().set_parse_action(pp.with_attribute(("tag", "a"), ("b", "c/"))),
+            xml_a().add_parse_action(pp.with_class("q")),
+        ]:
+            grammar = open_tag.expr.copy().set_parse_action(*open_tag.parseAction)
+            for instring in tests:
+                with self.subTest(open_tag=open_tag, instring=instring):
+                    self.assertEqual(
+                        parse_outcome(grammar, instring),
+                        parse_outcome(open_tag, instring),
+                    )
+
+        # scanning finds only the matching tags
+        td = pp.make_html_tags("td")[0]().add_parse_action(pp.with_class("total"))
+        html = '<tr><td class="odd">1</td><TD CLASS=total>2</TD><td>3</td></tr>'
+        self.assertEqual(
+            [(["td", ["class", "total"], False], 26)],
+            [(t.as_list(), s) for t, s, e in td.scan_string(html)],
+        )
+
     def testSetParseActionUncallableErr(self):
         """raise a TypeError in set_parse_action() by adding uncallable arg"""
 
@@ -6092,6 +6321,64 @@ class Test02_WithoutPackrat(ppt.TestParseResultsAsserts, TestCase):
                 verbose=False,
             )
 
+    def testNestedBlock(self):
+        ignore_exprs = [pp.quoted_string, None, pp.quoted_string | pp.c_style_comment]
+        tests = [
+            "(a (b c) 'd)' (e (f)))",
+            "(a /* ) */ \"b)\" ((c)d) e)",
+            "(  )",
+            "(a(b)c'(')",
+            "(a (b",
+            "a (b)",
+        ]
+        for ignore_expr in ignore_exprs:
+            for opener, closer in [("(", ")"), ("<<", ">>")]:
+                nested = pp.nested_expr(opener, closer, ignore_expr=ignore_expr)
+                block = pp.NestedBlock(opener, closer, ignore_expr=ignore_expr)
+                raw_block = pp.NestedBlock(
+                    opener, closer, ignore_expr=ignore_expr, as_string=True
+                )
+                for test in tests:
+                    test = test.replace("(", opener).replace(")", closer)
+                    with self.subTest(ignore_expr=ignore_expr, test=test):
+                        try:
+                            expected = nested.parse_string(
+                                test, parse_all=True
+                            ).as_list()
+                        except pp.ParseException:
+                            with self.assertRaises(pp.ParseException):
+                                block.parse_string(test, parse_all=True)
+                            with self.assertRaises(pp.ParseException):
+                                raw_block.parse_string(test, parse_all=True)
+                        else:
+                            self.assertParseAndCheckList(
+                                block, test, expected, verbose=False
+                            )
+                            self.assertParseAndCheckList(
+                                raw_block,
+                                test,
+                                pp.original_text_for(nested)
+                                .parse_string(test, parse_all=True)
+                                .as_list(),
+                                verbose=False,
+                            )
+
+        # deep nesting does not hit the recursion limit
+        depth = 5 * sys.getrecursionlimit()
+        deep = "(" * depth + "x" + ")" * depth
+        result = pp.NestedBlock().parse_string(deep, parse_all=True)
+        for _ in range(depth):
+            result = result[0]
+        self.assertEqual(["x"], result.as_list())
+        self.assertParseAndCheckList(
+            pp.NestedBlock(as_string=True), deep, [deep], verbose=False
+        )
+
+        # results names in ignored expressions are kept in the block's results
+        comment = pp.Regex(r"#.*")("comment")
+        result = pp.NestedBlock(ignore_expr=comment).parse_string("(a #xyz\n)")
+        self.assertEqual("#xyz", result[0].comment)
+
     def testWordMinMaxArgs(self):
         parsers = [
             "A" + pp.Word(pp.nums),
@@ -6554,6 +6841,47 @@ class Test02_WithoutPackrat(ppt.TestParseResultsAsserts, TestCase):
             "failed to parse embedded numeric escapes",
         )
 
+    def testQuotedStringLazyUnquote(self):
+        import pickle
+
+        eager = pp.QuotedString('"', esc_char="\\", esc_quote='""')
+        lazy = pp.QuotedString('"', esc_char="\\", esc_quote='""', lazy_unquote=True)
+
+        # bodies without escapes are returned as plain strings
+        for expr in (eager, lazy):
+            token = expr.parse_string('"no escapes here"')[0]
+            self.assertEqual("no escapes here", token)
+            self.assertIs(str, type(token))
+
+        for instring in [
+            r'"tab\tand \"quote\""',
+            '"sql ""quoted"" text"',
+            r'"numeric \x41\101\u00b7"',
+            r'"back\\slash"',
+        ]:
+            expected = eager.parse_string(instring)[0]
+            token = lazy.parse_string(instring)[0]
+            self.assertNotIsInstance(token, str)
+            self.assertIsNotNone(token._unquote, "token unescaped before first use")
+            self.assertEqual(expected, str(token))
+            self.assertIsNone(token._unquote, "token not unescaped on first use")
+            self.assertEqual(expected, token)
+            self.assertEqual(hash(expected), hash(token))
+            self.assertEqual(expected, pickle.loads(pickle.dumps(token)))
+
+        # lazy tokens combine and convert like str tokens
+        combined = pp.Combine(lazy + pp.Word(pp.nums))
+        self.assertParseAndCheckList(combined, r'"a\tb"12', ["a\tb12"])
+
+        # named lazy tokens are kept whole, not split into characters
+        instring = r'"a\"b\tc"'
+        expected = eager.parse_string(instring)[0]
+        result = lazy("s").parse_string(instring)
+        self.assertEqual(expected, str(result.s))
+        self.assertIn(f"- s: {expected!r}", result.dump())
+        result = lazy("s*").parse_string(instring)
+        self.assertEqual([expected], [str(t) for t in result.s])
+
     def testWordBoundaryExpressions(self):
         ws = pp.WordStart()
         we = pp.WordEnd()
@@ -6809,6 +7137,60 @@ class Test02_WithoutPackrat(ppt.TestParseResultsAsserts, TestCase):
                 result = spec.parse_string(test, parse_all=True)
                 self.assertParseResultsEquals(result, expected_dict=expected_dict)
 
+    def testEachManyMembers(self):
+        parsed = []
+        value = pp.Word(pp.alphanums).add_parse_action(lambda t: parsed.append(t[0]))
+        names = [f"option{i}" for i in range(20)]
+        options = [pp.Keyword(name) + "=" + value(name) for name in names]
+        config = pp.Each(options[:2] + [pp.Opt(opt) for opt in options[2:]])
+        config &= pp.Opt("debug" + pp.Keyword("on"))("debug")
+        config &= pp.Opt(pp.Keyword("level") + pp.Word(pp.nums), default="0")("level")
+
+        given = names[::-1][:12] + names[:2]
+        test = " ".join(f"{name} = v{name[6:]}" for name in given) + " debug on"
+        result = config.parse_string(test, parse_all=True)
+        expected = {name: f"v{name[6:]}" for name in given}
+        expected.update(debug=["debug", "on"], level=["0"])
+        self.assertEqual(expected, result.as_dict())
+        # each value is only parsed once, in input order
+        self.assertEqual([f"v{name[6:]}" for name in given], parsed)
+        self.assertEqual(["debug", "on", "0"], result.as_list()[-3:])
+
+        with self.assertRaisesParseException(
+            expected_msg="Missing one or more required elements"
+        ):
+            config.parse_string("option0 = a option2 = b")
+
+        # conditions are checked when matching each member
+        short_value = pp.Word(pp.alphas).add_condition(lambda t: len(t[0]) < 3)
+        expr = short_value("short") & pp.Word(pp.alphas)("long")
+        self.assertParseAndCheckDict(
+            expr, "abcd ab", {"short": "ab", "long": "abcd"}, verbose=False
+        )
+
+        # members starting with caseless non-ASCII characters
+        expr = pp.Each(
+            [
+                pp.CaselessKeyword("élan")("elan"),
+                pp.Word(pp.nums)("num"),
+                pp.Opt(pp.CaselessLiteral("über")("uber")),
+            ]
+        )
+        self.assertParseAndCheckDict(
+            expr,
+            "12 ÜBER ÉLAN",
+            {"elan": "élan", "num": "12", "uber": "über"},
+            verbose=False,
+        )
+
+        # members whose contents change while parsing
+        first = pp.Word(pp.alphas)
+        expr = first + pp.Each(
+            [pp.match_previous_literal(first), pp.Word(pp.nums)("n")]
+        )
+        self.assertParseAndCheckList(expr, "abc 1 abc", ["abc", "1", "abc"])
+        self.assertParseAndCheckList(expr, "def 2 def", ["def", "2", "def"])
+
     def testSumParseResults(self):
         samplestr1 = "garbage;DOB 10-10-2010;more garbage\nID PARI12345678;more garbage"
         samplestr2 = "garbage;ID PARI12345678;more garbage\nDOB 10-10-2010;more garbage"
@@ -8233,6 +8615,47 @@ class Test02_WithoutPackrat(ppt.TestParseResultsAsserts, TestCase):
 
         self.assertTrue(all_pass, "failed one or more numeric tests")
 
+    def testFastNumber(self):
+        from itertools import product
+
+        def parse_outcome(expr, instring):
+            try:
+                result = expr.parse_string(instring)
+            except pp.ParseException:
+                return None
+            return [(type(t), t) for t in result]
+
+        # fast_number must match and convert the same as number
+        for parts in product(
+            ["+", "-", ""], ["12", ""], [".", ""], ["5", ""], ["e", ""], ["-", ""], ["3"]
+        ):
+            instring = "".join(parts)
+            with self.subTest(instring=instring):
+                self.assertEqual(
+                    parse_outcome(ppc.number, instring),
+                    parse_outcome(ppc.fast_number, instring),
+                )
+
+        from array import array
+
+        self.assertParseAndCheckList(
+            ppc.fast_number_array(),
+            "1, 2.5 , -3e2,.5",
+            [array("d", [1.0, 2.5, -300.0, 0.5])],
+        )
+        self.assertParseAndCheckList(
+            ppc.fast_number_array("q", delim=";") + pp.Word(pp.alphas),
+            "1; -2 ;3 end",
+            [array("q", [1, -2, 3]), "end"],
+        )
+        self.assertParseAndCheckList(
+            ppc.fast_number_array("H") + ",-3", "1,2,-3", [array("H", [1, 2]), ",-3"]
+        )
+        with self.assertRaisesParseException():
+            ppc.fast_number_array("B").parse_string("1, 256")
+        with self.assertRaises(ValueError):
+            ppc.fast_number_array("u")
+
     def testTokenMap(self):
         parser = pp.OneOrMore(pp.Word(pp.hexnums)).set_parse_action(
             pp.token_map(int, 16)
@@ -8571,6 +8994,55 @@ class Test02_WithoutPackrat(ppt.TestParseResultsAsserts, TestCase):
                 ),
             )
 
+    def testCloseMatchIndels(self):
+        searchseq = pp.CloseMatch("ATCATCGAATGGA", 2, allow_indels=True)
+
+        for instring, expected, mismatches in [
+            ("ATCATCGAATGGA", "ATCATCGAATGGA", []),
+            ("ATCATCGATGGA", "ATCATCGATGGA", [7]),
+            ("ATCAXTCGAATGGA", "ATCAXTCGAATGGA", [4]),
+            ("TCATCGAATGGAX", "TCATCGAATGGA", [0]),
+            ("ATCXTCGAATGA", "ATCXTCGAATGA", [3, 10]),
+            ("ATCATCGAATGGAC", "ATCATCGAATGGA", []),
+        ]:
+            with self.subTest(instring=instring):
+                result = searchseq.parse_string(instring)
+                self.assertEqual(expected, result[0])
+                self.assertEqual(mismatches, result.mismatches)
+
+        with self.assertRaisesParseException():
+            searchseq.parse_string("ATXXTCGXATGGA")
+
+    def testCloseMatchScan(self):
+        # scanning for close matches only tries locations where part of the
+        # match string is found; results must be the same as trying every location
+        rnd = random.Random(2)
+        pieces = []
+        for _ in range(100):
+            pieces.append("".join(rnd.choice("ACGT \n") for _ in range(30)))
+            close = list("TTAAATCTAG")
+            for _ in range(rnd.randint(0, 3)):
+                close[rnd.randrange(len(close))] = rnd.choice(["", "a", "CC", "G"])
+            pieces.append("".join(close))
+        text = "".join(pieces)
+        for kwargs in [{}, {"caseless": True}, {"allow_indels": True}]:
+            searchseq = pp.CloseMatch("TTAAATCTAG", 2, **kwargs)
+            every_loc = pp.And([searchseq])
+            for overlap in (False, True):
+                with self.subTest(kwargs=kwargs, overlap=overlap):
+                    found = [
+                        (t.as_list(), t.mismatches, s, e)
+                        for t, s, e in searchseq.scan_string(text, overlap=overlap)
+                    ]
+                    self.assertTrue(found)
+                    self.assertEqual(
+                        [
+                            (t.as_list(), t.mismatches, s, e)
+                            for t, s, e in every_loc.scan_string(text, overlap=overlap)
+                        ],
+                        found,
+                    )
+
     def testDefaultKeywordChars(self):
         with self.assertRaisesParseException(
             msg="failed to fail matching keyword using updated keyword chars"
@@ -9570,6 +10042,41 @@ class Test02_WithoutPackrat(ppt.TestParseResultsAsserts, TestCase):
         ):
             indented_expr.parse_string(bad_data2, parse_all=True)
 
+    def testIndentedBlockReusesBlockExpressions(self):
+        parsed_lines = []
+        stmt = pp.Forward()
+        value = pp.Word(pp.nums).add_parse_action(
+            lambda s, l, t: parsed_lines.append(pp.lineno(l, s))
+        )
+        nested_block = pp.IndentedBlock(stmt)
+        stmt <<= value | pp.Group(pp.Word(pp.alphas) + ":" + nested_block)
+        block = pp.IndentedBlock(stmt)
+
+        data = dedent(
+            """\
+            1
+            a:
+                2
+                b:
+                    3
+                4
+            c:
+                5
+            """
+        )
+        expected = [
+            ["1", ["a", ":", ["2", ["b", ":", ["3"]], "4"]], ["c", ":", ["5"]]]
+        ]
+        for _ in range(2):
+            parsed_lines.clear()
+            self.assertParseAndCheckList(block, data, expected, verbose=False)
+            # each statement is only parsed once, with no trial parse of the block
+            self.assertEqual([1, 3, 5, 6, 8], parsed_lines)
+
+        # one expression per indent column, reused for every later parse
+        self.assertEqual({1}, {key[0] for key in block._block_exprs})
+        self.assertEqual({5, 9}, {key[0] for key in nested_block._block_exprs})
+
     def testInvalidDiagSetting(self):
         with self.assertRaises(
             ValueError,
@@ -10135,6 +10642,85 @@ class Test02_WithoutPackrat(ppt.TestParseResultsAsserts, TestCase):
                 expr, source, [s.strip() for s in source.split(",")]
             )
 
+    def testDelimitedListPlainTokens(self):
+        # lists of simple tokens are matched using regexes, and must give the same
+        # results and locations as lists whose items have parse actions
+        def no_op(t):
+            return None
+
+        def parse_outcome(expr, source):
+            try:
+                return expr.parse_string(source).as_list()
+            except pp.ParseException as pe:
+                return str(pe)
+
+        for content, delim in [
+            (pp.Word(pp.alphas), ","),
+            (pp.Regex(r"[a-z]\d*"), ";"),
+            (pp.Literal("ab"), pp.Regex(r"\s*;")),
+            (pp.Char("ab1"), pp.Literal(",").leave_whitespace()),
+        ]:
+            for kwargs in [
+                {},
+                {"min": 2},
+                {"max": 2},
+                {"min": 2, "max": 3},
+                {"allow_trailing_delim": True},
+                {"max": 1, "allow_trailing_delim": True},
+            ]:
+                plain = pp.DelimitedList(content, delim, **kwargs)
+                with_action = pp.DelimitedList(
+                    content.copy().add_parse_action(no_op), delim, **kwargs
+                )
+                for source in ["ab, b1 ,a;", "a1;ab ;; ab ;a ", "a\n ,1 x", "ab;ab"]:
+                    with self.subTest(plain=plain, kwargs=kwargs, source=source):
+                        self.assertEqual(
+                            [
+                                (t.as_list(), s, e)
+                                for t, s, e in with_action.scan_string(source)
+                            ],
+                            [
+                                (t.as_list(), s, e)
+                                for t, s, e in plain.scan_string(source)
+                            ],
+                        )
+                        self.assertEqual(
+                            parse_outcome(with_action, source),
+                            parse_outcome(plain, source),
+                        )
+
+    def testDelimitedListPlainTokensChangedAfterParsing(self):
+        # changes to the content or delimiter after the first parse must not be
+        # ignored by the regex matching used for lists of simple tokens
+        word = pp.Word(pp.alphas)
+        expr = pp.DelimitedList(word)
+        self.assertParseAndCheckList(expr, "a, b, c", ["a", "b", "c"], verbose=False)
+        word.add_parse_action(pp.common.upcase_tokens)
+        self.assertParseAndCheckList(expr, "a, b, c", ["A", "B", "C"], verbose=False)
+        word.set_parse_action()
+        self.assertParseAndCheckList(expr, "a, b, c", ["a", "b", "c"], verbose=False)
+
+        expr = pp.DelimitedList(pp.Word(pp.alphas))
+        self.assertParseAndCheckList(expr, "a, b", ["a", "b"], verbose=False)
+        expr.ignore(pp.c_style_comment)
+        self.assertParseAndCheckList(expr, "a, /* x */ b", ["a", "b"], verbose=False)
+
+        word = pp.Word(pp.alphas)
+        expr = pp.DelimitedList(word)
+        self.assertParseAndCheckList(expr, "a,\nb", ["a", "b"], verbose=False)
+        word.set_whitespace_chars(" ")
+        with self.assertRaisesParseException():
+            expr.parse_string("a,\nb", parse_all=True)
+
+        delim = pp.Suppress(";")
+        expr = pp.DelimitedList(pp.Word(pp.alphas), delim)
+        self.assertParseAndCheckList(expr, "a; b", ["a", "b"], verbose=False)
+        delim.leave_whitespace()
+        self.assertEqual(["a"], expr.parse_string("a ;b").as_list())
+        delim.set_whitespace_chars(" ")
+        delim.add_condition(lambda s, l, t: s[l + 1] == "b")
+        self.assertEqual(["a", "b"], expr.parse_string("a ;b ;c").as_list())
+
     def testDelimitedListParseActions1(self):
         # from issue #408
         keyword = pp.Keyword("foobar")
@@ -11769,6 +12355,900 @@ class Test02_WithoutPackrat(ppt.TestParseResultsAsserts, TestCase):
         )
         pass
 
+    def testIncrementalParser(self):
+        integer = pp.Word(pp.nums).set_parse_action(lambda t: int(t[0]))
+        assignment = pp.Word(pp.alphas) + pp.Suppress("=") + integer + pp.Suppress(";")
+
+        collected = []
+        parser = pp.IncrementalParser(assignment, collected.append)
+
+        # matches that span chunk boundaries are suspended until complete
+        self.assertEqual([], parser.feed("abc = 1"))
+        self.assertEqual([], parser.feed("23"))
+        found = parser.feed("; de")
+        self.assertEqual([["abc", 123]], [t.as_list() for t in found])
+        self.assertEqual([], parser.feed("f = 4;"))
+        # matches passed to the callback are not also queued for iteration
+        self.assertEqual([], list(parser))
+
+        # consumed input is discarded from the buffer
+        self.assertEqual(10, parser.consumed)
+        self.assertEqual(" def = 4;", parser._buffer)
+
+        found = parser.close()
+        self.assertEqual([["def", 4]], [t.as_list() for t in found])
+        self.assertEqual([["abc", 123], ["def", 4]], [t.as_list() for t in collected])
+
+        with self.assertRaises(ValueError):
+            parser.feed("x = 1;")
+
+    def testIncrementalParserMatchesScanString(self):
+        wd = pp.Word(pp.alphas)
+        source = "now is the winter of our discontent " * 20
+        expected = [t.as_list() for t, _, _ in wd.scan_string(source)]
+
+        for chunk_size in (1, 3, 7, 50):
+            with self.subTest(chunk_size=chunk_size):
+                parser = pp.IncrementalParser(wd)
+                found = []
+                for i in range(0, len(source), chunk_size):
+                    found.extend(parser.feed(source[i : i + chunk_size]))
+                found.extend(parser.close())
+                self.assertEqual(expected, [t.as_list() for t in found])
+
+    def testIncrementalParserErrors(self):
+        assignment = pp.Word(pp.alphas) + "=" + pp.Word(pp.nums) + ";"
+
+        parser = pp.IncrementalParser(assignment)
+        parser.feed("a = 1; b = ")
+        with self.assertRaisesParseException():
+            parser.close()
+        self.assertEqual(["a", "=", "1", ";"], next(parser).as_list())
+
+        parser = pp.IncrementalParser(assignment, max_buffer=10)
+        with self.assertRaisesParseException():
+            parser.feed("a = 1 b = 2; c = 3;")
+
+        # syntax errors at the end of the buffer wait for more input
+        assignment = pp.Word(pp.alphas) + "==" - pp.Word(pp.nums) + ";"
+        parser = pp.IncrementalParser(assignment)
+        found = parser.feed("a == 1;\nb ==")
+        self.assertEqual([["a", "==", "1", ";"]], [t.as_list() for t in found])
+        found = parser.feed(" 2;\nc =")
+        self.assertEqual([["b", "==", "2", ";"]], [t.as_list() for t in found])
+        self.assertEqual([], parser.feed("= 3"))
+        found = parser.feed(";\nd == ")
+        self.assertEqual([["c", "==", "3", ";"]], [t.as_list() for t in found])
+        self.assertEqual(
+            [["a", "==", "1", ";"], ["b", "==", "2", ";"], ["c", "==", "3", ";"]],
+            [t.as_list() for t in parser],
+        )
+
+        # syntax errors followed by more input are raised, with locations
+        # relative to the start of the input stream
+        source = "a == 1;\nb == 2;\nc == 3;\nd == x; e == 4;"
+        try:
+            parser.feed("x; e == 4;")
+        except pp.ParseSyntaxException as pse:
+            self.assertEqual(source.index("x"), pse.loc)
+            self.assertEqual((4, 6), (pse.lineno, pse.col))
+            self.assertEqual("d == x; e == 4;", pse.line)
+            self.assertEqual("'x'", pse.found)
+        else:
+            self.fail("failed to raise exception for syntax error in buffer")
+
+        # the exception only holds the buffered text, even if the start of
+        # the line has been discarded
+        parser = pp.IncrementalParser(assignment)
+        parser.feed("a == 1; b == 2;")
+        source = "a == 1; b == 2; c == x; d == 4;"
+        try:
+            parser.feed(" c == x; d == 4;")
+        except pp.ParseSyntaxException as pse:
+            self.assertEqual(source.index("x"), pse.loc)
+            self.assertEqual((1, source.index("x") + 1), (pse.lineno, pse.col))
+            self.assertLess(len(pse.pstr), len(source))
+            self.assertEqual(" b == 2; c == x; d == 4;", pse.line)
+            self.assertEqual("b == 2; c == >!<x; d == 4;", pse.mark_input_line())
+        else:
+            self.fail("failed to raise exception for syntax error in buffer")
+
+        # only an error in the last word of the buffer waits for more input;
+        # a multi-word literal cut off between its words is raised at once
+        end_if = pp.Word(pp.alphas) - pp.Literal("end if")
+        self.assertEqual([], pp.IncrementalParser(end_if).feed("a end"))
+        with self.assertRaisesParseException(pp.ParseSyntaxException):
+            pp.IncrementalParser(end_if).feed("a end i")
+
+        parser = pp.IncrementalParser(assignment)
+        parser.feed("a == 1;\nb == 2")
+        try:
+            parser.close()
+        except pp.ParseSyntaxException as pse:
+            self.assertEqual(len("a == 1;\nb == 2"), pse.loc)
+            self.assertEqual((2, 7), (pse.lineno, pse.col))
+        else:
+            self.fail("failed to raise exception for incomplete input at close")
+
+    def testScanStreamAsync(self):
+        import asyncio
+
+        wd = pp.Word(pp.alphas)
+        source = "now is the winter 123 of our discontent, " * 50
+        expected = [(t.as_list(), s, e) for t, s, e in wd.scan_string(source)]
+
+        async def scan(chunk_size):
+            reader = asyncio.StreamReader()
+            reader.feed_data(source.encode())
+            reader.feed_eof()
+            return [
+                (t.as_list(), s, e)
+                async for t, s, e in wd.scan_stream_async(
+                    reader, chunk_size=chunk_size
+                )
+            ]
+
+        for chunk_size in (3, 16, 1000):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(expected, asyncio.run(scan(chunk_size)))
+
+    def testScanStreamAsyncLongMatches(self):
+        import asyncio
+
+        async def scan(expr, source, chunk_size):
+            reader = asyncio.StreamReader()
+            reader.feed_data(source.encode())
+            reader.feed_eof()
+            return [
+                (t.as_list(), s, e)
+                async for t, s, e in expr.scan_stream_async(
+                    reader, chunk_size=chunk_size
+                )
+            ]
+
+        # matches longer than chunk_size are buffered until complete
+        integer = pp.Word(pp.nums)
+        int_list = "[" + pp.DelimitedList(integer) + "]"
+        source = "xx [" + ", ".join(map(str, range(200))) + "] yy [1, 2] zz"
+        expected = [(t.as_list(), s, e) for t, s, e in int_list.scan_string(source)]
+        for chunk_size in (4, 16, 100):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(
+                    expected, asyncio.run(scan(int_list, source, chunk_size))
+                )
+
+        # syntax errors at the end of the buffer wait for more data
+        assignment = pp.Word(pp.alphas) + "=" - integer + ";"
+        source = "a = 1;\nbb = 22;\nccc = 333;"
+        expected = [(t.as_list(), s, e) for t, s, e in assignment.scan_string(source)]
+        for chunk_size in (1, 3, 5):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(
+                    expected, asyncio.run(scan(assignment, source, chunk_size))
+                )
+
+        # other syntax errors are raised, with locations relative to the
+        # start of the stream
+        source = "a = 1;\nbb = 22;\nc = x; d = 4;"
+        try:
+            asyncio.run(scan(assignment, source, 3))
+        except pp.ParseSyntaxException as pse:
+            self.assertEqual(source.index("x"), pse.loc)
+            self.assertEqual((3, 5), (pse.lineno, pse.col))
+        else:
+            self.fail("failed to raise exception for syntax error in stream")
+
+    def testScanStreamAsyncBackpressure(self):
+        import asyncio
+
+        class CountingReader:
+            def __init__(self, data, chunks):
+                self.data = data
+                self.reads = 0
+                self.chunks = chunks
+
+            async def read(self, n):
+                self.reads += 1
+                if self.reads > self.chunks:
+                    return ""
+                return self.data
+
+        async def take_one(reader):
+            scanner = pp.Word(pp.nums).scan_stream_async(reader, chunk_size=10)
+            tokens, start, end = await scanner.__anext__()
+            await scanner.aclose()
+            return tokens[0], start, end
+
+        reader = CountingReader("abc 123 4", chunks=1000)
+        self.assertEqual(("123", 4, 7), asyncio.run(take_one(reader)))
+        # only read as much as was needed to produce the first match
+        self.assertLess(reader.reads, 5)
+
+    def testParseStringAsync(self):
+        import asyncio
+        import threading
+
+        async def parse(text, **kwargs):
+            reader = asyncio.StreamReader()
+            reader.feed_data(text.encode())
+            reader.feed_eof()
+            return await pp.Word(pp.nums)[1, ...].parse_string_async(
+                reader, chunk_size=2, **kwargs
+            )
+
+        self.assertParseResultsEquals(
+            asyncio.run(parse("1 22 333")), expected_list=["1", "22", "333"]
+        )
+        with self.assertRaisesParseException():
+            asyncio.run(parse("1 22 x", parse_all=True))
+
+        # the parse is run in an executor, not in the event loop's thread
+        parse_threads = []
+
+        async def parse_in_thread():
+            reader = asyncio.StreamReader()
+            reader.feed_data(b"1 22 333")
+            reader.feed_eof()
+            expr = pp.Word(pp.nums).add_parse_action(
+                lambda: parse_threads.append(threading.get_ident())
+            )
+            await expr[1, ...].parse_string_async(reader)
+            return threading.get_ident()
+
+        loop_thread = asyncio.run(parse_in_thread())
+        self.assertEqual(3, len(parse_threads))
+        self.assertNotIn(loop_thread, parse_threads)
+
+    def testScanStringParallel(self):
+        record = pp.DelimitedList(pp.Word(pp.alphanums)) + pp.LineEnd().suppress()
+        source = "".join(f"a{i}, b{i},{i * 7}\n" for i in range(500))
+        expected = [(t.as_list(), s, e) for t, s, e in record.scan_string(source)]
+
+        for split_on in (r"\n", re.compile("\n"), pp.LineEnd()):
+            with self.subTest(split_on=split_on):
+                found = [
+                    (t.as_list(), s, e)
+                    for t, s, e in record.scan_string_parallel(
+                        source, workers=2, split_on=split_on, min_partition_size=100
+                    )
+                ]
+                self.assertEqual(expected, found)
+
+        # matches that run across a partition boundary
+        wd = pp.Word(pp.alphas)
+        source = "abc defghi jk " * 100
+        expected = [(t.as_list(), s, e) for t, s, e in wd.scan_string(source)]
+        found = [
+            (t.as_list(), s, e)
+            for t, s, e in wd.scan_string_parallel(
+                source, workers=2, split_on="f", min_partition_size=50
+            )
+        ]
+        self.assertEqual(expected, found)
+
+        found = list(
+            wd.scan_string_parallel(
+                source, workers=2, split_on="f", min_partition_size=50, max_matches=5
+            )
+        )
+        self.assertEqual(5, len(found))
+
+    def testScanStringParallelUnpicklableExpression(self):
+        integer = pp.Word(pp.nums).add_parse_action(lambda t: int(t[0]))
+        with self.assertRaises(TypeError):
+            list(
+                integer.scan_string_parallel(
+                    "1 2 3\n" * 100, workers=2, min_partition_size=10
+                )
+            )
+
+        # small inputs are scanned in-process
+        self.assertEqual(
+            [[1], [2], [3]],
+            [t.as_list() for t, s, e in integer.scan_string_parallel("1 2 3")],
+        )
+
+    def testParseMany(self):
+        integer = pp.Word(pp.nums).set_parse_action(lambda t: int(t[0]))
+        assignment = pp.Word(pp.alphas) + pp.Suppress("=") + integer
+        inputs = ["a = 1", "b = x", "c = 3 4", "d\t=\t4"]
+
+        # parse_many gives same results as parse_string
+        for parse_all in (False, True):
+            with self.subTest(parse_all=parse_all):
+                expected = []
+                for s in inputs:
+                    try:
+                        expected.append(
+                            assignment.parse_string(s, parse_all=parse_all).as_list()
+                        )
+                    except pp.ParseException as pe:
+                        expected.append(str(pe))
+                found = [
+                    r.as_list() if isinstance(r, pp.ParseResults) else str(r)
+                    for r in assignment.parse_many(
+                        inputs, parse_all=parse_all, on_error="return"
+                    )
+                ]
+                self.assertEqual(expected, found)
+
+        self.assertEqual(
+            [["a", 1], ["d", 4]],
+            [
+                r.as_list()
+                for r in assignment.parse_many(inputs, parse_all=True, on_error="skip")
+            ],
+        )
+
+        results = assignment.parse_many(inputs, parse_all=True)
+        self.assertEqual(["a", 1], next(results).as_list())
+        with self.assertRaisesParseException():
+            next(results)
+
+        with self.assertRaises(ValueError):
+            next(assignment.parse_many(inputs, on_error="ignore"))
+
+    def testParseManyIsLazy(self):
+        def inputs():
+            yield "1"
+            yield "2"
+            raise RuntimeError("read too far")
+
+        results = pp.Word(pp.nums).parse_many(inputs())
+        self.assertEqual(["1"], next(results).as_list())
+        self.assertEqual(["2"], next(results).as_list())
+        with self.assertRaises(RuntimeError):
+            next(results)
+
+    def testParseManyWithWorkers(self):
+        kv = pp.Group(pp.Word(pp.alphas)("key") + "=" + pp.Word(pp.nums)("value"))
+        command = pp.Word(pp.alphas)("cmd") + kv[1, ...]("args")
+        inputs = [f"set a={i} b={i * 2}" for i in range(250)] + ["set", "get x=1"]
+
+        expected = list(command.parse_many(inputs, on_error="return"))
+        found = list(
+            command.parse_many(inputs, on_error="return", workers=2, chunksize=16)
+        )
+        self.assertEqual(len(expected), len(found))
+        for exp, res in zip(expected, found):
+            if isinstance(exp, pp.ParseException):
+                self.assertIsInstance(res, pp.ParseException)
+                self.assertEqual(str(exp), str(res))
+            else:
+                self.assertEqual(exp.dump(), res.dump())
+                self.assertEqual("args", res.args.get_name())
+
+        found = list(command.parse_many(inputs, on_error="skip", workers=2))
+        self.assertEqual(251, len(found))
+        with self.assertRaisesParseException():
+            list(command.parse_many(inputs, workers=2))
+
+    def testParseManyWithWorkersUnpicklableParseAction(self):
+        integer = pp.Word(pp.nums).add_parse_action(lambda t: int(t[0]))
+        with self.assertRaisesRegex(TypeError, "parse action '<lambda>'.*module level"):
+            list((pp.Word(pp.alphas) + integer).parse_many(["a 1"], workers=2))
+
+    def testPackedParseResults(self):
+        from pyparsing.results import _pack_results, _unpack_results
+        import pickle
+
+        kv = pp.Group(pp.Word(pp.alphas)("key") + "=" + pp.Word(pp.nums)("value"))
+        command = pp.Word(pp.alphas)("cmd") + pp.Group(kv[1, ...])("args")
+        result = command.parse_string("set a=1 b=2")
+
+        unpacked = _unpack_results(pickle.loads(pickle.dumps(_pack_results(result))))
+        self.assertEqual(result.dump(), unpacked.dump())
+        # named results still refer to the tokens in the token list
+        self.assertIs(unpacked[1], unpacked.args)
+        self.assertEqual("args", unpacked[1].get_name())
+
+    def testPickleGrammars(self):
+        import operator
+        import pickle
+
+        ppc = pp.pyparsing_common
+
+        nested = pp.Forward()
+        nested <<= pp.Group("(" + (nested | pp.Word(pp.alphas))[...] + ")")
+
+        div, div_end = pp.make_html_tags("div")
+        tests = [
+            (ppc.number, "3.14159"),
+            (ppc.fraction, "3/4"),
+            (ppc.ipv6_address, "::1"),
+            (ppc.url, "https://github.com/pyparsing/pyparsing"),
+            (
+                ppc.iso8601_date().add_parse_action(ppc.convert_to_date()),
+                "1999-12-31",
+            ),
+            (pp.one_of("if then else", caseless=True)[...], "IF Then eLsE"),
+            (nested, "(a (b c) (d (e)))"),
+            (pp.nested_expr(), "(a (b c) d)"),
+            (
+                pp.infix_notation(
+                    ppc.integer,
+                    [
+                        ("-", 1, pp.OpAssoc.RIGHT),
+                        (pp.one_of("* /"), 2, pp.OpAssoc.LEFT),
+                        (pp.one_of("+ -"), 2, pp.OpAssoc.LEFT),
+                    ],
+                ),
+                "1 + 2 * -3",
+            ),
+            (pp.Word(pp.nums).add_condition(operator.truth), "123"),
+            (pp.Word(pp.hexnums).add_parse_action(pp.token_map(int, 16)), "ff"),
+            (pp.Literal("NA").add_parse_action(pp.replace_with(None)), "NA"),
+            (
+                div.add_parse_action(pp.with_attribute(type=pp.with_attribute.ANY_VALUE)),
+                '<div type="x">',
+            ),
+            (pp.original_text_for(pp.Word(pp.alphas) + pp.Word(pp.nums)), "abc  123"),
+            (pp.counted_array(pp.Word(pp.alphas)), "2 ab cd"),
+            (pp.common_html_entity, "&amp;"),
+            (pp.Regex(r"(\w+):").sub(r"<\1>"), "h1:"),
+            (pp.Word(pp.alphas) + pp.Opt(pp.Word(pp.nums)), "abc"),
+            (pp.Word(pp.alphas) & pp.Opt(pp.Word(pp.nums)), "abc"),
+        ]
+        for expr, instring in tests:
+            expected = expr.parse_string(instring, parse_all=True)
+            for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+                with self.subTest(expr=str(expr), protocol=protocol):
+                    unpickled = pickle.loads(pickle.dumps(expr, protocol))
+                    self.assertParseResultsEquals(
+                        unpickled.parse_string(instring, parse_all=True),
+                        expected_list=expected.as_list(),
+                        expected_dict=expected.as_dict(),
+                    )
+
+        # failing conditions still raise after unpickling
+        expr = pickle.loads(
+            pickle.dumps(pp.Word(pp.nums).add_condition(operator.not_, message="bad"))
+        )
+        with self.assertRaisesParseException(expected_msg="bad"):
+            expr.parse_string("123")
+
+    def testLazyBuiltinExpressions(self):
+        # pyparsing_common expressions and the any_open_tag/any_close_tag
+        # helpers are not built when pyparsing is imported
+        code = "\n".join(
+            [
+                "import pyparsing as pp",
+                "from pyparsing.common import _lazy_expr",
+                "assert all(",
+                "    isinstance(vars(pp.common)[name], _lazy_expr)",
+                "    for name in ('integer', 'number', 'ipv6_address', 'url')",
+                ")",
+                "assert 'any_open_tag' not in vars(pp.helpers)",
+            ]
+        )
+        subproc = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True
+        )
+        self.assertEqual(subproc.returncode, 0, msg=f"stderr: {subproc.stderr}")
+
+        # expressions are built once, on first access
+        ppc = pp.pyparsing_common
+        self.assertIsInstance(ppc.number, pp.ParserElement)
+        self.assertIs(ppc.number, ppc.number)
+        self.assertIs(vars(ppc)["number"], ppc.number)
+        self.assertEqual([1.5, 3], ppc.number[...].parse_string("1.5 3").as_list())
+        self.assertIs(pp.any_open_tag, pp.helpers.any_open_tag)
+        self.assertIs(pp.anyOpenTag, pp.any_open_tag)
+        self.assertEqual(
+            "abc", pp.Suppress(pp.any_open_tag).transform_string("<b>abc")
+        )
+
+        # built-in expressions pick up changes to the default whitespace
+        self.assertIn(ppc.identifier, pp.core_builtin_exprs)
+        with ppt.reset_pyparsing_context():
+            pp.ParserElement.set_default_whitespace_chars(" \t")
+            self.assertEqual(set(" \t"), ppc.identifier.whiteChars)
+
+        # expressions are built with the default settings, even if the global
+        # settings were changed before their first access
+        code = "\n".join(
+            [
+                "import pyparsing as pp",
+                "ppc = pp.pyparsing_common",
+                "pp.ParserElement.inline_literals_using(pp.Suppress)",
+                "pp.ParserElement.set_default_whitespace_chars(' \\t')",
+                "pp.Keyword.set_default_keyword_chars('abc')",
+                "result = ppc.ipv6_address.parse_string('fe80::1').as_list()",
+                "assert result == ['fe80::1'], result",
+                "result = ppc.iso8601_date.parse_string('2024-01-02').as_list()",
+                "assert result == ['2024-01-02'], result",
+                # inner elements skip the default whitespace, as when built at import
+                "result = ppc.fraction.parse_string('1 /\\n2').as_list()",
+                "assert result == [0.5], result",
+                "result = pp.any_close_tag.parse_string('</b>').as_list()",
+                "assert result == ['</b>'], result",
+                # global settings are not changed while building
+                "seen = []",
+                "lazy = vars(ppc)['uuid']",
+                "build = lazy.fn",
+                "lazy.fn = lambda cls: seen.append(",
+                "    (pp.ParserElement.DEFAULT_WHITE_CHARS,",
+                "     pp.ParserElement._literalStringClass)",
+                ") or build(cls)",
+                "ppc.uuid",
+                "assert seen == [(' \\t', pp.Suppress)], seen",
+                "assert ppc.ipv6_address.whiteChars == set(' \\t')",
+                "assert pp.any_open_tag.whiteChars == set(' \\t')",
+                "assert pp.ParserElement._literalStringClass is pp.Suppress",
+                "assert pp.ParserElement.DEFAULT_WHITE_CHARS == ' \\t'",
+                "assert pp.Keyword.DEFAULT_KEYWORD_CHARS == 'abc'",
+            ]
+        )
+        subproc = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True
+        )
+        self.assertEqual(subproc.returncode, 0, msg=f"stderr: {subproc.stderr}")
+
+    def testCharSet(self):
+        abc = pp.CharSet("cabbage")
+        self.assertEqual("abceg", str(abc))
+        self.assertEqual(((97, 99), (101, 101), (103, 103)), abc.ranges)
+        self.assertEqual(5, len(abc))
+        self.assertIn("b", abc)
+        self.assertNotIn("d", abc)
+        self.assertNotIn("ab", abc)
+
+        # set operations work on ranges, and accept strings
+        digits = pp.CharSet.from_srange("[0-9]")
+        self.assertEqual(pp.CharSet("0123456789"), digits)
+        self.assertEqual("[0-9a-ceg]", (abc | digits).regex_class())
+        self.assertEqual("[0-9_]", (digits + "_").regex_class())
+        self.assertEqual("[_a-c]", ("_" + abc - "eg").regex_class())
+        self.assertEqual("[ab]", (abc & "xyzab").regex_class())
+        self.assertEqual("[2-57]", (digits - "016-89" | "7").regex_class())
+        self.assertEqual(pp.CharSet("d"), "abcd" - abc)
+        self.assertTrue(abc <= abc | digits)
+        self.assertEqual(set("abceg"), abc)
+        self.assertEqual(
+            pp.CharSet("abcdefxyz"),
+            pp.CharSet.from_ranges([(0x78, 0x7A), (0x61, 0x64), (0x65,), (0x66,)]),
+        )
+
+        # CharSets for unicode sets match the corresponding strings
+        ppu = pp.unicode
+        for uset in (ppu.Latin1, ppu.Greek, ppu.Thai):
+            for name in (
+                "printables",
+                "alphas",
+                "nums",
+                "alphanums",
+                "identchars",
+                "identbodychars",
+            ):
+                with self.subTest(uset=uset.__name__, name=name):
+                    self.assertEqual(
+                        "".join(sorted(set(getattr(uset, name)))),
+                        str(getattr(uset, f"{name}_charset")),
+                    )
+
+        # CharSets can be used in place of strings in Word, Char, CharsNotIn, and srange
+        cjk_word = pp.Word(
+            ppu.CJK.alphas_charset, ppu.CJK.alphas_charset + pp.nums + "_"
+        )
+        self.assertParseAndCheckList(cjk_word, "漢字_テスト1", ["漢字_テスト1"])
+        greek_chars = pp.Char(ppu.Greek.alphas_charset, exclude_chars="β")[1, ...]
+        self.assertEqual(["α", "γ"], greek_chars.parse_string("αγβ").as_list())
+        self.assertEqual(
+            ["ab"], pp.CharsNotIn(pp.CharSet(",;")).parse_string("ab, cd;").as_list()
+        )
+        self.assertEqual(
+            ["ab ba "], pp.Word(pp.CharSet(" ab")).parse_string("ab ba c").as_list()
+        )
+        self.assertIs(ppu.Thai.charset, pp.srange(ppu.Thai.charset))
+        self.assertEqual(
+            "W:(0-9A-Za-zª²³µ...)", str(pp.Word(ppu.Latin1.alphanums_charset))
+        )
+        self.assertParseAndCheckList(
+            ppu.Greek.identifier[...], "αβ_1 γ", ["αβ_1", "γ"]
+        )
+
+    def testCharacterClassTokensUseRegex(self):
+        # Word with spaces, CharsNotIn, and White all match using a compiled regex,
+        # with the same results for all min/max/exact/as_keyword combinations as
+        # the character-by-character implementations they replace
+
+        def expected_match(first_chars, body_chars, min_len, max_len, keyword, s, loc):
+            if loc >= len(s) or s[loc] not in first_chars:
+                return None
+            start = loc
+            loc += 1
+            while loc < min(start + max_len, len(s)) and s[loc] in body_chars:
+                loc += 1
+            if loc - start < min_len:
+                return None
+            if keyword and (
+                (start > 0 and s[start - 1] in body_chars)
+                or (loc < len(s) and s[loc] in body_chars)
+            ):
+                return None
+            return loc
+
+        def actual_match(expr, s, loc):
+            self.assertIsNotNone(expr.re_match)
+            try:
+                return expr.parseImpl(s, loc)[0]
+            except pp.ParseException:
+                return None
+
+        all_chars = "ab -\n]^"
+        test_strings = ["", "a", "ab a", " ab  -\n]a", "]]^^--  ", "b a b\na"]
+        min_max_exact = [(1, 0, 0), (2, 0, 0), (1, 2, 0), (2, 4, 0), (1, 0, 3)]
+        for min_, max_, exact in min_max_exact:
+            exprs = [
+                (
+                    pp.CharsNotIn(not_chars, min=min_, max=max_, exact=exact),
+                    set(all_chars) - set(not_chars),
+                    set(all_chars) - set(not_chars),
+                    False,
+                )
+                for not_chars in ["-", " \n", "]^a"]
+            ]
+            exprs += [
+                (
+                    pp.Word(init, body, min=min_, max=max_, exact=exact, as_keyword=kw),
+                    set(init),
+                    set(body or init),
+                    kw,
+                )
+                for init, body in [(" a", None), ("a", "b -"), ("]^", " ^")]
+                for kw in (False, True)
+            ]
+            exprs += [
+                (pp.White(ws, min=min_, max=max_, exact=exact), set(ws), set(ws), False)
+                for ws in [" ", " \n"]
+            ]
+            for expr, first_chars, body_chars, keyword in exprs:
+                for s in test_strings:
+                    for loc in range(len(s) + 1):
+                        with self.subTest(expr=expr, s=s, loc=loc):
+                            self.assertEqual(
+                                expected_match(
+                                    first_chars,
+                                    body_chars,
+                                    expr.minLen,
+                                    expr.maxLen,
+                                    keyword,
+                                    s,
+                                    loc,
+                                ),
+                                actual_match(expr, s, loc),
+                            )
+
+        # a token whose min length is greater than its max length never matches
+        self.assertIsNone(actual_match(pp.White(" ", min=3, max=2), "     ", 0))
+
+    def testLiteralSet(self):
+        stop_words = pp.LiteralSet(
+            "a an and in of on the", caseless=True, as_keyword=True
+        )
+        self.assertEqual(
+            ["in", "the", "and"],
+            stop_words[1, ...].parse_string("In THE and").as_list(),
+        )
+        with self.assertRaises(pp.ParseException):
+            stop_words.parse_string("andy")
+
+        # longest match, regardless of the order the symbols are given
+        ops = pp.LiteralSet(["<", "=", "<=", "<<=", "<<"])
+        self.assertEqual(
+            ["<<=", "<", "<=", "="], ops[...].parse_string("<<= < <= =").as_list()
+        )
+
+        # caseless matching returns the first canonical spelling
+        units = pp.LiteralSet(["Km", "KM", "m"], caseless=True)
+        self.assertEqual(["Km", "m"], units[...].parse_string("km M").as_list())
+        self.assertEqual(["Km", "m"], units.symbols)
+
+        # keyword boundaries fall back to a shorter symbol that ends on a boundary
+        kw = pp.LiteralSet(["if", "if_else"], as_keyword=True)
+        self.assertEqual(["if"], kw.parse_string("if x").as_list())
+        self.assertEqual(["if_else"], kw.parse_string("if_else").as_list())
+        with self.assertRaises(pp.ParseException):
+            kw.parse_string("if_elsewhere")
+
+        trie = pp.one_of("< = <= > >= != ==", engine="trie")
+        self.assertIsInstance(trie, pp.LiteralSet)
+        self.assertEqual(
+            pp.one_of("< = <= > >= != ==")[...].parse_string("<= != < ==").as_list(),
+            trie[...].parse_string("<= != < ==").as_list(),
+        )
+        with self.assertRaises(ValueError):
+            pp.one_of("a b", engine="dfa")
+
+        big = pp.one_of([f"sym{i}" for i in range(5000)], engine="trie")
+        self.assertEqual(
+            ["sym4999", "sym12"], big[...].parse_string("sym4999 sym12").as_list()
+        )
+        self.assertIn("... (5000 symbols)", str(big))
+
+    def testScanMany(self):
+        ppc = pp.pyparsing_common
+        extractors = {
+            "int": ppc.integer,
+            "ident": ppc.identifier,
+            "ip": ppc.ipv4_address,
+            "kw": pp.Keyword("if") | pp.CaselessKeyword("else"),
+            "quoted": pp.quoted_string,
+            "word": pp.Word(pp.alphas).ignore(pp.python_style_comment),
+            "lookahead": pp.FollowedBy("x"),
+        }
+        samples = [
+            "if x = 10.0.0.1 ELSE 'abc' # if x",
+            "\tx1 xx if\tz 'a\\'b'\n# comment\nelse 12",
+            "",
+        ]
+        for instring in samples:
+            with self.subTest(instring=instring):
+                # same matches as scan_string for each expression, in location order
+                expected = sorted(
+                    (
+                        (start, order, name, tokens.as_list(), end)
+                        for order, (name, expr) in enumerate(extractors.items())
+                        for tokens, start, end in expr.scan_string(instring)
+                    ),
+                    key=lambda match: match[:2],
+                )
+                self.assertEqual(
+                    [
+                        (name, tokens, start, end)
+                        for start, _, name, tokens, end in expected
+                    ],
+                    [
+                        (name, tokens.as_list(), start, end)
+                        for name, tokens, start, end in pp.scan_many(
+                            extractors, instring
+                        )
+                    ],
+                )
+
+        self.assertEqual(
+            [("n", ["1"], 0, 1), ("n", ["2"], 2, 3)],
+            [
+                (name, tokens.as_list(), start, end)
+                for name, tokens, start, end in pp.scan_many(
+                    {"n": pp.Word(pp.nums), "never": pp.NoMatch()},
+                    "1 2 3",
+                    max_matches=2,
+                )
+            ],
+        )
+
+    def testFirstChars(self):
+        def first_chars(expr):
+            chars = expr._first_chars()
+            return None if chars is None else set(chars)
+
+        self.assertEqual(set("abc"), first_chars(pp.Word("abc", pp.nums)))
+        # alternatives can also start with whitespace to be skipped
+        self.assertEqual(
+            {"x", "{", " ", "\t", "\r", "\n"},
+            first_chars(pp.Literal("xy") | pp.Suppress("{")),
+        )
+        self.assertEqual(
+            set("+-0123456789"), first_chars(pp.Regex(r"[+-]?\d+", re.ASCII))
+        )
+        caseless_chars = first_chars(pp.Regex(r"(?i:a|b)x"))
+        self.assertLessEqual(set("aAbB"), caseless_chars)
+        self.assertNotIn("c", caseless_chars)
+        self.assertEqual({"(", "["}, first_chars(pp.Regex(r"(?:\((?=x)|\[)")))
+        self.assertEqual({"<"}, first_chars(pp.make_html_tags("a")[0]))
+        self.assertEqual({"'"}, first_chars(pp.QuotedString("'")))
+        self.assertEqual(
+            {"a", " ", "\t", "\r", "\n"}, first_chars(pp.Located(pp.Literal("a")))
+        )
+        self.assertEqual(set(), first_chars(pp.NoMatch()))
+        self.assertIn("ſ", first_chars(pp.CaselessLiteral("S")))
+        # case variants of non-ASCII characters
+        self.assertLessEqual({"é", "É"}, first_chars(pp.CaselessKeyword("élan")))
+        self.assertLessEqual({"ü", "Ü"}, first_chars(pp.CaselessLiteral("Über")))
+        self.assertLessEqual({"σ", "ς", "Σ"}, first_chars(pp.Regex("(?i)σ")))
+        self.assertParseAndCheckList(
+            pp.CaselessKeyword("élan") & pp.Word(pp.nums),
+            "ÉLAN 12",
+            ["élan", "12"],
+            verbose=False,
+        )
+        self.assertParseAndCheckList(
+            pp.CaselessLiteral("über") & pp.Word(pp.nums),
+            "über 1",
+            ["über", "1"],
+            verbose=False,
+        )
+
+        # can match empty, or not determinable
+        self.assertIsNone(first_chars(pp.Opt("x") + "y"))
+        self.assertIsNone(first_chars(pp.Regex(r"a*")))
+        self.assertIsNone(first_chars(pp.Empty()))
+        self.assertIsNone(first_chars(pp.SkipTo("x")))
+
+        # recursive grammars
+        nested = pp.Forward()
+        nested <<= pp.Group("(" + nested[...] + ")") | pp.Word(pp.nums)
+        self.assertEqual(set("(0123456789"), first_chars(nested) - set(" \t\n\r"))
+        left_recursive = pp.Forward()
+        left_recursive <<= left_recursive + "x" | "y"
+        self.assertIsNone(first_chars(left_recursive))
+
+    def testScanStringSkipsImpossibleStarts(self):
+        # long enough input with sparse matches so that the start prefilter is used
+        filler = "filler words and 1 2 3; " * 10
+        text = filler + "<b>x1</b>" + filler + "<b>y22</b> " + filler + "END"
+
+        ident = pp.Word(pp.alphas, pp.alphanums)
+        bold = pp.Suppress("<b>") + ident + pp.Suppress("</b>")
+        self.assertEqual([["x1"], ["y22"]], bold.search_string(text).as_list())
+        locs = [(s, e) for _, s, e in bold.scan_string(text)]
+        self.assertEqual(
+            [
+                (text.index("<b>x1"), text.index("x1</b>") + 6),
+                (text.index("<b>y22"), text.index("y22</b>") + 7),
+            ],
+            locs,
+        )
+        self.assertEqual(
+            text.replace("<b>", "").replace("</b>", ""),
+            bold.transform_string(text),
+        )
+        self.assertEqual(text.split(";"), list(pp.Literal(";").split(text)))
+        self.assertEqual(["END"], pp.Keyword("END").search_string(text)[0].as_list())
+
+        # ignored expressions are skipped before checking for a possible match
+        commented = text.replace("<b>x1</b>", "/* <b>z</b> */ <b>x1</b>")
+        bold_with_comments = bold.copy().ignore(pp.c_style_comment)
+        self.assertEqual(
+            [["x1"], ["y22"]], bold_with_comments.search_string(commented).as_list()
+        )
+
+        # overlapping matches and no whitespace skipping
+        run = "x" * 40 + "22x" + "x" * 40 + "3"
+        self.assertEqual(
+            [("22", 40, 42), ("2", 41, 42), ("3", 83, 84)],
+            [
+                (t[0], s, e)
+                for t, s, e in pp.Word(pp.nums).scan_string(run, overlap=True)
+            ],
+        )
+        spaced = pp.Literal(" and").leave_whitespace()
+        self.assertEqual(
+            text.count(" and"),
+            len(list(spaced.scan_string(text, always_skip_whitespace=False))),
+        )
+
+        # caseless matches that start with a non-ASCII character
+        accented = filler + "ÉLAN x " + filler + "élan " + filler + "Élan"
+        for expr in [
+            pp.CaselessKeyword("élan"),
+            pp.CaselessLiteral("ÉLAN"),
+            pp.Regex("élan", re.IGNORECASE),
+        ]:
+            with self.subTest(expr=expr):
+                expected = [
+                    accented.index("ÉLAN"),
+                    accented.index("élan"),
+                    accented.index("Élan"),
+                ]
+                self.assertEqual(
+                    expected, [s for _, s, _ in expr.scan_string(accented)]
+                )
+                self.assertEqual(
+                    expected,
+                    [s for _, s, _ in expr.scan_string(accented, overlap=True)],
+                )
+                self.assertEqual(
+                    expected,
+                    [s for _, _, s, _ in pp.scan_many({"elan": expr}, accented)],
+                )
+                replaced = expr.copy().set_parse_action(pp.replace_with("*"))
+                self.assertEqual(
+                    re.sub("(?i)élan", "*", accented),
+                    replaced.transform_string(accented),
+                )
+
 
 class Test04_WithPackrat(Test02_WithoutPackrat):
     """